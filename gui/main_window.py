@@ -1053,15 +1053,10 @@ class MainWindow:
                 search_term = self.search_box.get_search_term()
                 filter_options = self.filter_panel.get_filter_options()
                 
-                # 필터링된 할일 목록 가져오기
-                filtered_todos = self.todo_service.filter_todos(
+                # 필터링 및 정렬된 할일 목록 가져오기
+                sorted_todos = self.todo_service.list_todos(
                     show_completed=filter_options['show_completed'],
-                    search_term=search_term
-                )
-                
-                # 정렬 적용
-                sorted_todos = self.todo_service.sort_todos(
-                    filtered_todos, 
+                    search_term=search_term,
                     sort_by=filter_options['sort_by']
                 )
                 
@@ -1118,15 +1113,10 @@ class MainWindow:
             # 현재 필터 옵션 가져오기
             filter_options = self.filter_panel.get_filter_options()
             
-            # 검색어와 필터 옵션을 적용하여 할일 목록 필터링
-            filtered_todos = self.todo_service.filter_todos(
+            # 검색어와 필터 옵션을 적용하여 할일 목록 필터링 및 정렬
+            sorted_todos = self.todo_service.list_todos(
                 show_completed=filter_options['show_completed'],
-                search_term=search_term
-            )
-            
-            # 정렬 적용
-            sorted_todos = self.todo_service.sort_todos(
-                filtered_todos, 
+                search_term=search_term,
                 sort_by=filter_options['sort_by']
             )
             
@@ -96,9 +96,9 @@ class Todo:
         if subtask.todo_id != self.id:
             raise ValueError(f"SubTask todo_id ({subtask.todo_id}) does not match Todo id ({self.id})")
         
-        # 중복 ID 체크
-        existing_ids = {st.id for st in self.subtasks}
-        if subtask.id in existing_ids:
+        # 중복 ID 체크 (집합을 만들지 않고 찾는 즉시 중단)
+        subtask_id = subtask.id
+        if any(st.id == subtask_id for st in self.subtasks):
             raise ValueError(f"SubTask with id {subtask.id} already exists")
         
         self.subtasks.append(subtask)
@@ -206,16 +206,20 @@ class Todo:
             subtask.is_completed = False
             subtask.completed_at = None
     
-    def has_overdue_subtasks(self) -> bool:
+    def has_overdue_subtasks(self, now: Optional[datetime] = None) -> bool:
         """
         지연된 하위 작업이 있는지 확인
         
         Requirements 7.3: 하위 작업 목표 날짜 관리
         
+        Args:
+            now: 기준 시간 (None이면 현재 시간)
+        
         Returns:
             bool: 지연된 하위 작업이 있으면 True
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         for subtask in self.subtasks:
             if (not subtask.is_completed and 
                 subtask.due_date is not None and 
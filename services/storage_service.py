@@ -1,13 +1,202 @@
+import copy
 import json
 import os
+import re
 import time
+import queue
+import shutil
+import filecmp
+import atexit
+import weakref
 import threading
 import hashlib
-from typing import List, Optional, Dict, Any, Callable
+import logging
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Callable, Tuple, Mapping
 from datetime import datetime
 from models.todo import Todo
 from models.subtask import SubTask
 
+# orjson은 선택적 의존성 (없으면 표준 json 사용)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# ijson은 선택적 의존성 (큰 파일을 할일 단위로 스트리밍 로드)
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+
+logger = logging.getLogger(__name__)
+
+# 현재 데이터 파일 형식 버전 (목표 날짜 기능이 추가된 버전)
+_CURRENT_DATA_VERSION = "2.0"
+
+# 기본 설정 (읽기 전용, 사용할 때는 dict()로 복사)
+_DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType({
+    'show_startup_notifications': True,
+    'default_due_time': '18:00',
+    'date_format': 'relative',
+    'auto_backup_enabled': True,
+    'backup_retention_days': 30
+})
+
+# 이 크기를 넘는 파일은 ijson이 있으면 스트리밍으로 로드
+_STREAM_LOAD_THRESHOLD = 10 * 1024 * 1024
+
+# 스트리밍 로드를 쓸 수 없을 때 허용하는 최대 파일 크기
+_MAX_LOAD_SIZE = 100 * 1024 * 1024
+
+# 최근 이 시간 안에 바뀐 파일/디렉토리는 타임스탬프 해상도가 낮은 파일 시스템에서
+# 같은 mtime으로 다시 바뀔 수 있으므로 mtime 기준 메모이즈 대상에서 제외
+_MTIME_SETTLE_NS = 2 * 1000 * 1000 * 1000
+
+# 백업 복원 시 전체 파싱 대신 앞부분만 읽어 형식을 확인하는 크기
+_SNIFF_SIZE = 4096
+# 최상위 객체의 "todos" 키 (문자열 안의 이스케이프된 따옴표는 제외)
+_TODOS_KEY_PATTERN = re.compile(rb'(?<!\\)"todos"\s*:')
+
+# 자동 저장 스레드 종료 신호
+_STOP = object()
+
+# 프로세스 종료 시 대기 중인 자동 저장을 마무리할 서비스들
+_active_services: "weakref.WeakSet[StorageService]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_active_services() -> None:
+    """프로세스 종료 시 자동 저장 스레드를 멈추고 대기 중인 변경을 저장합니다."""
+    for service in list(_active_services):
+        try:
+            service._stop_auto_save()
+            if service._pending_save and service._current_todos is not None:
+                service.save_todos_with_auto_save(list(service._current_todos))
+        except Exception:
+            logger.exception("종료 시 자동 저장 실패: %s", service.file_path)
+
+
+def _snapshot_todos(todos: List[Todo]) -> List[Todo]:
+    """
+    자동 저장 스레드에 넘길 할일 목록 사본을 만듭니다.
+    
+    할일과 하위 작업의 필드는 하위 작업 목록을 빼면 모두 불변 값이므로,
+    객체와 하위 작업 목록만 복사하면 호출 스레드가 원본을 바꿔도 사본은 그대로입니다.
+    
+    Args:
+        todos: 복사할 할일 목록
+        
+    Returns:
+        List[Todo]: 원본과 객체를 공유하지 않는 할일 목록
+    """
+    snapshot = []
+    for todo in todos:
+        clone = copy.copy(todo)
+        clone.subtasks = [copy.copy(subtask) for subtask in todo.subtasks]
+        snapshot.append(clone)
+    return snapshot
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    JSON으로 직렬화할 수 없는 객체 처리 (Todo/SubTask는 딕셔너리로)
+    
+    Raises:
+        TypeError: 그 외 타입은 문자열로 바꾸지 않고 오류로 처리
+    """
+    if isinstance(obj, (Todo, SubTask)):
+        return obj.to_dict()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+
+def _dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    객체를 UTF-8 JSON 바이트로 직렬화
+    
+    Args:
+        obj: 직렬화할 객체
+        pretty: 들여쓰기(2칸) 적용 여부
+        sort_keys: 키 정렬 여부 (해시 계산 등 정규화가 필요한 경우)
+        
+    Returns:
+        직렬화된 JSON 바이트
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_json_default, option=option)
+    
+    # 들여쓰기가 없으면 orjson과 같은 공백 없는 구분자 사용
+    return json.dumps(obj, ensure_ascii=False, indent=2 if pretty else None,
+                      separators=None if pretty else (',', ':'),
+                      sort_keys=sort_keys, default=_json_default).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """
+    JSON 바이트를 파이썬 객체로 역직렬화
+    
+    Args:
+        data: JSON 바이트
+        
+    Returns:
+        역직렬화된 객체
+        
+    Raises:
+        json.JSONDecodeError: JSON 형식이 잘못된 경우 (orjson 오류도 이 타입의 하위 클래스)
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """
+    파일 내용을 복사하고 접근/수정 시간만 보존 (shutil.copy2 대체)
+    
+    shutil.copyfile은 Linux에서 sendfile로 커널 안에서 복사하며, copy2가 추가로 하는
+    권한/플래그/확장 속성 복사 대신 os.utime 한 번으로 시간만 맞춥니다.
+    
+    Args:
+        src: 원본 파일 경로
+        dst: 대상 파일 경로
+    """
+    st = os.stat(src)
+    shutil.copyfile(src, dst)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _write_all(fd: int, chunks) -> None:
+    """
+    여러 바이트 조각을 가능한 한 적은 시스템 호출로 파일 디스크립터에 모두 기록
+    
+    os.writev가 있으면 조각들을 이어 붙이지 않고 한 번의 호출로 넘기며,
+    부분 기록이 일어나면 남은 부분만 다시 기록합니다.
+    
+    Args:
+        fd: 쓰기용으로 열린 파일 디스크립터
+        chunks: 기록할 바이트열(또는 memoryview) 시퀀스
+    """
+    views = [memoryview(chunk) for chunk in chunks if len(chunk)]
+    while views:
+        if hasattr(os, 'writev'):
+            written = os.writev(fd, views)
+        else:
+            written = os.write(fd, views[0])
+        # 완전히 기록된 조각은 앞에서부터 제거
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if written:
+            views[0] = views[0][written:]
+
 
 class StorageService:
     """데이터 저장 및 로드를 담당하는 서비스 클래스"""
@@ -22,20 +211,45 @@ class StorageService:
         """
         self.file_path = file_path
         self.auto_save_enabled = auto_save_enabled
+        
+        # 경로 관련 값은 한 번만 계산하여 재사용
+        self._dir = os.path.dirname(file_path) or "."
+        self._basename = os.path.basename(file_path)
+        # 백업 스캔에서 쓰는 파일 이름 접두사 (순환 백업 / 순환 백업 번호 / 수동 백업)
+        self._backup_prefix = f"{self._basename}.backup"
+        self._backup_numbered_prefix = f"{self._backup_prefix}."
+        self._backup_scan_prefixes = (self._backup_prefix, f"{self._basename}.manual_backup")
+        self._backup_base = f"{file_path}.backup"
+        self._backup_paths = [f"{self._backup_base}.{i}" for i in range(1, 6)]
+        
         self.ensure_data_directory()
         
         # 자동 저장 관련 속성
         self._last_data_hash: Optional[str] = None
-        self._auto_save_timer: Optional[threading.Timer] = None
+        self._todo_hash_cache: Dict[int, Tuple[tuple, bytes]] = {}  # 할일 ID -> (필드 지문, 다이제스트)
+        self._auto_save_thread: Optional[threading.Thread] = None
         self._auto_save_interval = 5.0  # 5초마다 자동 저장 체크
         self._pending_save = False
-        self._save_lock = threading.Lock()
+        self._save_lock = threading.RLock()
+        self._write_queue: queue.Queue = queue.Queue(maxsize=1)  # 가장 최근 스냅샷 하나만 보관
+        self._current_todos: Optional[List[Todo]] = None  # 자동 저장 대상 메모리 데이터
+        self._data_generation = 0  # 데이터 파일이 교체될 때마다 증가 (이전 스냅샷 무시용)
         self._change_callbacks: List[Callable[[], None]] = []
         
         # 복구 관련 속성
         self._recovery_file = f"{self.file_path}.recovery"
         self._last_save_time = 0
         
+        # 파일 메타데이터 캐시 (None이면 아직 파일에서 읽지 않은 상태)
+        self._settings: Optional[Dict[str, Any]] = None
+        self._cached_next_id: Optional[int] = None
+        self._cached_next_subtask_id: Optional[int] = None
+        # 마지막으로 기록한 내용의 (해시, 크기, 수정 시간) - 같은 내용 재기록 방지용
+        self._last_written: Optional[Tuple[bytes, int, int]] = None
+        # mtime 기준 메모이즈: (상태 키, 무결성 상태), (디렉토리 mtime, 백업 파일 스캔 결과)
+        self._status_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
+        self._backup_scan_cache: Optional[Tuple[int, List[Tuple[str, str, float]]]] = None
+        
         # 프로그램 시작 시 복구 체크
         self._check_recovery_needed()
         
@@ -45,9 +259,8 @@ class StorageService:
     
     def ensure_data_directory(self) -> None:
         """데이터 디렉토리가 존재하는지 확인하고 없으면 생성"""
-        directory = os.path.dirname(self.file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
+        if not os.path.isdir(self._dir):
+            os.makedirs(self._dir, exist_ok=True)
     
     def file_exists(self) -> bool:
         """
@@ -56,7 +269,17 @@ class StorageService:
         Returns:
             파일 존재 여부
         """
-        return os.path.exists(self.file_path) and os.path.isfile(self.file_path)
+        # os.path.isfile은 존재하지 않는 경로에 대해 False를 반환하므로 stat 한 번으로 충분
+        return os.path.isfile(self.file_path)
+    
+    def _invalidate_file_cache(self) -> None:
+        """파일 내용이 외부 경로(복구, 빈 파일 생성 등)로 바뀌었을 때 메타데이터 캐시를 비웁니다."""
+        self._settings = None
+        self._cached_next_id = None
+        self._cached_next_subtask_id = None
+        self._last_written = None
+        self._status_cache = None
+        self._backup_scan_cache = None
     
     def create_empty_file(self) -> bool:
         """
@@ -65,20 +288,22 @@ class StorageService:
         Returns:
             파일 생성 성공 여부
         """
+        self._invalidate_file_cache()
         try:
             empty_data = {
                 "todos": [],
                 "next_id": 1,
                 "next_subtask_id": 1
             }
-            with open(self.file_path, 'w', encoding='utf-8') as file:
-                json.dump(empty_data, file, ensure_ascii=False, indent=2)
+            self._write_file_atomic(self.file_path, (_dumps(empty_data, pretty=True),))
             return True
         except Exception as e:
             print(f"빈 파일 생성 중 오류 발생: {e}")
             return False
     
-    def save_todos(self, todos: List[Todo]) -> bool:
+    def save_todos(self, todos: List[Todo],
+                   before_write: Optional[Callable[[bytes], None]] = None,
+                   pretty: bool = False) -> bool:
         """
         할일 목록을 JSON 파일에 저장
         
@@ -86,6 +311,9 @@ class StorageService:
         
         Args:
             todos: 저장할 할일 목록
+            before_write: 파일을 쓰기 직전에 직렬화된 내용(last_saved 제외)을 받을 콜백
+                          (내용이 바뀌지 않아 쓰기를 생략하면 호출되지 않음)
+            pretty: 사람이 읽기 좋게 들여쓰기하여 저장할지 여부 (기본값은 압축 형식)
             
         Returns:
             저장 성공 여부
@@ -95,71 +323,105 @@ class StorageService:
             if not isinstance(todos, list):
                 raise ValueError("todos는 리스트여야 합니다")
             
-            # 목표 날짜 필드 유효성 검사
-            validation_result = self.validate_due_date_fields(todos)
+            # 데이터 무결성 검사 및 복구 (목표 날짜 필드 검사와 통계도 같은 순회에서 수행)
+            validation_result = self._new_due_date_report(len(todos))
+            todos = self._validate_and_repair_data(todos, validation_result)
             if not validation_result['valid']:
                 print("목표 날짜 필드 유효성 검사 실패:")
                 for issue in validation_result['issues']:
                     print(f"  - {issue}")
-                # 유효성 검사 실패 시에도 복구 시도
-                print("데이터 복구를 시도합니다...")
+                print("데이터 복구를 시도했습니다.")
             
-            # 데이터 무결성 검사 및 복구
-            todos = self._validate_and_repair_data(todos)
-            
-            # 다음 ID 계산
-            next_id = max([todo.id for todo in todos], default=0) + 1
-            next_subtask_id = self._calculate_next_subtask_id(todos)
-            
-            # 현재 설정 로드 (기존 파일에서)
-            current_settings = {
-                'show_startup_notifications': True,
-                'default_due_time': '18:00',
-                'date_format': 'relative',
-                'auto_backup_enabled': True,
-                'backup_retention_days': 30
-            }
-            
-            if self.file_exists():
-                try:
-                    with open(self.file_path, 'r', encoding='utf-8') as file:
-                        existing_data = json.load(file)
-                        if 'settings' in existing_data:
-                            current_settings.update(existing_data['settings'])
-                except Exception:
-                    pass  # 기존 설정 로드 실패 시 기본값 사용
+            # 다음 ID 계산 (할일/하위 작업 ID를 한 번의 순회로)
+            max_todo_id = 0
+            max_subtask_id = 0
+            for todo in todos:
+                if todo.id > max_todo_id:
+                    max_todo_id = todo.id
+                for subtask in todo.subtasks:
+                    if subtask.id > max_subtask_id:
+                        max_subtask_id = subtask.id
+            next_id = max_todo_id + 1
+            next_subtask_id = max_subtask_id + 1
+            
+            # 기존 파일 존재 여부 (설정 로드와 백업 생성에 공용)
+            file_existed = self.file_exists()
+            
+            # 현재 설정 (캐시가 없을 때만 기존 파일에서 로드)
+            current_settings = self._settings
+            if current_settings is None:
+                current_settings = dict(_DEFAULT_SETTINGS)
+                
+                if file_existed:
+                    try:
+                        with open(self.file_path, 'rb') as file:
+                            existing_data = _loads(file.read())
+                            if 'settings' in existing_data:
+                                current_settings.update(existing_data['settings'])
+                    except Exception:
+                        pass  # 기존 설정 로드 실패 시 기본값 사용
             
             # 데이터 구조 생성 (새 필드들 포함)
             data = {
                 "todos": [todo.to_dict() for todo in todos],
                 "next_id": next_id,
                 "next_subtask_id": next_subtask_id,
-                "data_version": "2.0",
-                "settings": current_settings,
-                "last_saved": datetime.now().isoformat()
+                "data_version": _CURRENT_DATA_VERSION,
+                "settings": current_settings
             }
             
+            # 직렬화는 한 번만 수행하고, 검증은 메모리 상의 데이터로 처리
+            if len(data["todos"]) != len(todos):
+                raise ValueError("저장할 데이터 검증 실패: 할일 개수 불일치")
+            content = _dumps(data, pretty=pretty)
+            
+            # 디스크의 파일이 마지막으로 기록한 내용 그대로이면 쓰기/백업 순환/fsync 생략
+            content_hash = hashlib.blake2b(content, digest_size=16).digest()
+            if file_existed and self._is_written_content(content_hash):
+                self._settings = current_settings
+                self._cached_next_id = next_id
+                self._cached_next_subtask_id = next_subtask_id
+                return True
+            
+            # 저장 시각은 비교 대상에서 제외하고 마지막 키로 덧붙임
+            # (본문을 복사해 새 버퍼로 이어 붙이지 않고 조각 단위로 그대로 기록)
+            payload = self._extend_object(content, {"last_saved": datetime.now().isoformat()})
+            payload_size = len(payload[0]) + len(payload[1])
+            
+            # 같은 직렬화 결과를 재사용하려는 호출자(복구 파일 등)에게 전달
+            if before_write is not None:
+                before_write(content)
+            
             # 백업 파일 생성 (기존 파일이 있는 경우)
-            if self.file_exists():
+            if file_existed:
                 self._create_backup()
             
             # 임시 파일에 먼저 저장 (원자적 쓰기)
             temp_file = f"{self.file_path}.tmp"
             try:
-                with open(temp_file, 'w', encoding='utf-8') as file:
-                    json.dump(data, file, ensure_ascii=False, indent=2, default=str)
+                # 이름 없는 임시 파일을 쓸 수 있으면 다 쓴 뒤에만 이름을 붙임
+                if not self._write_unnamed_temp(payload, payload_size, temp_file):
+                    with open(temp_file, 'wb', buffering=0) as file:
+                        _write_all(file.fileno(), payload)
+                        # 이름 변경 전에 내용이 디스크에 기록되도록 보장
+                        os.fsync(file.fileno())
+                    
+                    # 저장된 데이터 검증 (다시 파싱하지 않고 기록된 크기만 확인)
+                    if os.path.getsize(temp_file) != payload_size:
+                        raise ValueError("저장된 데이터 검증 실패: 파일 크기 불일치")
                 
-                # 저장된 데이터 검증
-                with open(temp_file, 'r', encoding='utf-8') as file:
-                    verification_data = json.load(file)
-                    if len(verification_data.get('todos', [])) != len(todos):
-                        raise ValueError("저장된 데이터 검증 실패: 할일 개수 불일치")
+                # 임시 파일을 실제 파일로 이동 (os.replace는 대상 존재 여부와 무관하게 원자적)
+                os.replace(temp_file, self.file_path)
                 
-                # 임시 파일을 실제 파일로 이동
-                if os.path.exists(self.file_path):
-                    os.replace(temp_file, self.file_path)
-                else:
-                    os.rename(temp_file, self.file_path)
+                # 이름 변경 자체가 디스크에 반영되도록 디렉토리 fsync
+                self._fsync_directory()
+                
+                # 방금 기록한 내용과 메타데이터로 캐시 갱신
+                written_stat = os.stat(self.file_path)
+                self._last_written = (content_hash, written_stat.st_size, written_stat.st_mtime_ns)
+                self._settings = current_settings
+                self._cached_next_id = next_id
+                self._cached_next_subtask_id = next_subtask_id
                 
             except Exception as e:
                 # 임시 파일 정리
@@ -192,6 +454,153 @@ class StorageService:
             print(f"데이터 저장 중 예상치 못한 오류 발생: {e}")
             return False
     
+    def _write_unnamed_temp(self, payload: Tuple[Any, ...], payload_size: int, temp_file: str) -> bool:
+        """
+        O_TMPFILE(Linux)로 이름 없는 파일에 payload를 쓰고 fsync한 뒤 temp_file 이름으로 연결합니다.
+        
+        내용이 모두 기록되기 전에는 디렉토리에 이름이 생기지 않으므로
+        쓰기 도중 중단되어도 오래된 .tmp 파일이 남지 않습니다.
+        
+        Args:
+            payload: 순서대로 기록할 바이트 조각들
+            payload_size: 전체 바이트 수
+            temp_file: 기록 완료 후 붙일 임시 파일 경로
+            
+        Returns:
+            이 방식으로 기록했으면 True, 지원되지 않아 일반 임시 파일을 써야 하면 False
+        """
+        if not hasattr(os, 'O_TMPFILE'):
+            return False
+        
+        try:
+            fd = os.open(self._dir, os.O_TMPFILE | os.O_WRONLY | os.O_CLOEXEC, 0o666)
+        except OSError:
+            # 파일 시스템이 O_TMPFILE을 지원하지 않는 경우
+            return False
+        
+        try:
+            _write_all(fd, payload)
+            os.fsync(fd)
+            
+            if os.fstat(fd).st_size != payload_size:
+                raise ValueError("저장된 데이터 검증 실패: 파일 크기 불일치")
+            
+            # 이전 저장이 남긴 임시 파일이 있으면 링크가 실패하므로 먼저 제거
+            try:
+                os.unlink(temp_file)
+            except FileNotFoundError:
+                pass
+            
+            try:
+                os.link(f"/proc/self/fd/{fd}", temp_file)
+            except OSError:
+                # /proc을 쓸 수 없는 환경 등
+                return False
+            return True
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _extend_object(content: bytes, fields: Dict[str, Any]) -> Tuple[memoryview, bytes]:
+        """
+        직렬화된 JSON 객체 바이트를 복사하지 않고 뒤에 키를 더 이어 쓰기 위한 조각을 만듭니다.
+        
+        들여쓰기 형식(마지막이 줄바꿈+닫는 괄호)과 압축 형식을 모두 지원하며,
+        두 조각을 차례로 기록하면 fields가 마지막 키로 추가된 JSON 객체가 됩니다.
+        
+        Args:
+            content: _dumps로 만든 JSON 객체 바이트
+            fields: 추가할 키와 값
+            
+        Returns:
+            (닫는 괄호를 뺀 본문, 추가 키와 닫는 괄호)
+        """
+        if content.endswith(b'\n}'):
+            body = memoryview(content)[:-2]
+            separator, colon, closing = b',\n  ', b': ', b'\n}'
+        else:
+            body = memoryview(content)[:-1]
+            separator, colon, closing = b',', b':', b'}'
+        
+        tail = b''.join(separator + _dumps(key) + colon + _dumps(value)
+                        for key, value in fields.items())
+        return body, tail + closing
+    
+    def _is_written_content(self, content_hash: bytes) -> bool:
+        """
+        데이터 파일이 마지막으로 기록한 내용과 같은지 확인합니다.
+        
+        해시가 같더라도 그 사이 파일이 외부에서 바뀌었을 수 있으므로
+        크기와 수정 시간이 기록 직후와 같은 경우에만 같다고 판단합니다.
+        
+        Args:
+            content_hash: 저장하려는 내용(last_saved 제외)의 해시
+            
+        Returns:
+            다시 쓸 필요가 없으면 True
+        """
+        if self._last_written is None or self._last_written[0] != content_hash:
+            return False
+        try:
+            current_stat = os.stat(self.file_path)
+        except OSError:
+            return False
+        return (current_stat.st_size, current_stat.st_mtime_ns) == self._last_written[1:]
+    
+    def _write_file_atomic(self, path: str, chunks, durable: bool = True) -> None:
+        """
+        임시 파일에 쓴 뒤 os.replace로 교체하여 파일을 원자적으로 기록
+        
+        중간에 중단되어도 대상 파일은 이전 내용이나 새 내용 중 하나로만 남으며,
+        새 inode에 쓰므로 하드링크된 백업도 영향을 받지 않습니다.
+        
+        Args:
+            path: 기록할 파일 경로
+            chunks: 기록할 바이트 조각 시퀀스
+            durable: True이면 교체 전에 fsync하여 디스크 기록을 보장
+            
+        Raises:
+            OSError: 기록 또는 교체에 실패한 경우 (임시 파일은 정리됨)
+        """
+        temp_file = f"{path}.tmp"
+        with self._save_lock:
+            try:
+                with open(temp_file, 'wb', buffering=0) as file:
+                    _write_all(file.fileno(), chunks)
+                    if durable:
+                        os.fsync(file.fileno())
+                os.replace(temp_file, path)
+            except BaseException:
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
+                raise
+        
+        if durable and os.path.dirname(os.path.abspath(path)) == os.path.abspath(self._dir):
+            self._fsync_directory()
+    
+    def _fsync_directory(self) -> None:
+        """
+        데이터 디렉토리를 fsync하여 파일 이름 변경(os.replace)을 영속화
+        
+        O_DIRECTORY를 지원하지 않는 플랫폼(Windows 등)에서는 아무 작업도 하지 않습니다.
+        """
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        
+        try:
+            dir_fd = os.open(self._dir, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass  # 일부 파일 시스템은 디렉토리 fsync를 지원하지 않음
+        finally:
+            os.close(dir_fd)
+    
     def load_todos(self) -> List[Todo]:
         """
         JSON 파일에서 할일 목록을 로드
@@ -212,47 +621,49 @@ class StorageService:
                 print("데이터 파일이 비어있습니다. 새로운 파일을 생성합니다.")
                 self.create_empty_file()
                 return []
-            elif file_size > 100 * 1024 * 1024:  # 100MB 제한
+            elif file_size > _MAX_LOAD_SIZE and not HAS_IJSON:
                 print("경고: 데이터 파일이 너무 큽니다. 백업에서 복구를 시도합니다.")
                 return self._restore_from_backup()
             
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            
-            # 기존 CLI 데이터 파일 자동 변환
-            data = self._migrate_legacy_data(data)
-            
-            # 데이터 구조 검증
-            if not isinstance(data, dict):
-                raise ValueError("데이터가 딕셔너리 형태가 아닙니다")
-            
-            if 'todos' not in data:
-                raise ValueError("'todos' 키가 없습니다")
-            
-            if not isinstance(data['todos'], list):
-                raise ValueError("'todos' 값이 리스트가 아닙니다")
-            
-            todos = []
-            invalid_count = 0
-            
-            for i, todo_data in enumerate(data['todos']):
-                try:
-                    if not isinstance(todo_data, dict):
-                        raise ValueError(f"할일 데이터가 딕셔너리가 아닙니다 (인덱스: {i})")
-                    
-                    todo = Todo.from_dict(todo_data)
-                    todos.append(todo)
-                except Exception as e:
-                    invalid_count += 1
-                    print(f"할일 데이터 파싱 오류 (인덱스 {i}, 건너뜀): {e}")
-                    continue
+            data = None
+            if HAS_IJSON and file_size > _STREAM_LOAD_THRESHOLD:
+                # 큰 파일은 할일 단위로 스트리밍하여 원본 바이트와 전체 딕셔너리를 동시에 들고 있지 않음
+                data, todos, invalid_count = self._stream_load_todos()
+                # 이전 버전 형식이면 마이그레이션을 위해 전체 로드로 다시 처리
+                if not self._is_current_format(data):
+                    data = None
+            
+            if data is None:
+                with open(self.file_path, 'rb') as file:
+                    data = _loads(file.read())
+                
+                # 기존 CLI 데이터 파일 자동 변환
+                data = self._migrate_legacy_data(data)
+                
+                # 데이터 구조 검증
+                if not isinstance(data, dict):
+                    raise ValueError("데이터가 딕셔너리 형태가 아닙니다")
+                
+                if 'todos' not in data:
+                    raise ValueError("'todos' 키가 없습니다")
+                
+                if not isinstance(data['todos'], list):
+                    raise ValueError("'todos' 값이 리스트가 아닙니다")
+                
+                todos, invalid_count = self._build_todos(data['todos'])
             
             if invalid_count > 0:
-                print(f"경고: {invalid_count}개의 잘못된 할일 데이터를 건너뛰었습니다.")
+                logger.warning("%d개의 잘못된 할일 데이터를 건너뛰었습니다.", invalid_count)
             
             # 데이터 무결성 검사 및 복구
             todos = self._validate_and_repair_data(todos)
             
+            # 파일 메타데이터 캐시 갱신 (이후 저장/ID 조회 시 파일 재읽기 방지)
+            if isinstance(data.get('settings'), dict):
+                self._settings = dict(data['settings'])
+            self._cached_next_id = data.get('next_id', 1)
+            self._cached_next_subtask_id = data.get('next_subtask_id', 1)
+            
             return todos
             
         except json.JSONDecodeError as e:
@@ -268,6 +679,122 @@ class StorageService:
             print(f"데이터 로드 중 예상치 못한 오류 발생: {e}")
             return self._restore_from_backup()
     
+    def _build_todos(self, todo_items) -> Tuple[List[Todo], int]:
+        """
+        할일 딕셔너리들을 Todo 객체로 변환합니다. 잘못된 항목은 건너뜁니다.
+        
+        Args:
+            todo_items: 할일 딕셔너리 목록 또는 이터레이터
+            
+        Returns:
+            (변환된 할일 목록, 건너뛴 항목 수)
+        """
+        todos = []
+        invalid_count = 0
+        
+        for i, todo_data in enumerate(todo_items):
+            try:
+                if not isinstance(todo_data, dict):
+                    raise ValueError(f"할일 데이터가 딕셔너리가 아닙니다 (인덱스: {i})")
+                
+                todo = Todo.from_dict(todo_data)
+                todos.append(todo)
+            except Exception as e:
+                invalid_count += 1
+                logger.debug("할일 데이터 파싱 오류 (인덱스 %d, 건너뜀): %s", i, e)
+                continue
+        
+        return todos, invalid_count
+    
+    def _stream_load_todos(self, path: Optional[str] = None) -> Tuple[Dict[str, Any], List[Todo], int]:
+        """
+        ijson으로 데이터 파일을 스트리밍 로드합니다.
+        
+        'todos' 배열의 항목은 하나씩 Todo로 변환하고 원본 딕셔너리는 바로 버리며,
+        그 밖의 최상위 값(next_id, settings 등)은 메타데이터로 모읍니다.
+        
+        Args:
+            path: 읽을 파일 경로 (None이면 데이터 파일)
+            
+        Returns:
+            (메타데이터, 할일 목록, 건너뛴 항목 수)
+            
+        Raises:
+            ValueError: JSON이 손상되었거나 데이터 구조가 올바르지 않은 경우
+        """
+        metadata: Dict[str, Any] = {}
+        with open(path or self.file_path, 'rb') as file:
+            todos, invalid_count = self._build_todos(self._iter_stream_items(file, metadata))
+        
+        if not isinstance(metadata.get('todos'), list):
+            raise ValueError("'todos' 값이 리스트가 아닙니다")
+        
+        return metadata, todos, invalid_count
+    
+    @staticmethod
+    def _iter_stream_items(file, metadata: Dict[str, Any]):
+        """
+        ijson 이벤트에서 'todos' 배열 항목을 하나씩 생성합니다.
+        
+        'todos' 이외의 최상위 값은 metadata에 채우며, 'todos'가 배열이면
+        metadata['todos']에는 자리 표시용 빈 리스트를 둡니다.
+        
+        Args:
+            file: 바이너리 모드로 연 데이터 파일
+            metadata: 최상위 값을 채울 딕셔너리
+        """
+        builder = None
+        target = None  # None이면 할일 항목, 아니면 최상위 키
+        depth = 0
+        
+        try:
+            for prefix, event, value in ijson.parse(file, use_float=True):
+                if builder is None:
+                    if prefix == '':
+                        continue
+                    if prefix == 'todos.item':
+                        if event in ('start_map', 'start_array'):
+                            builder, target, depth = ijson.ObjectBuilder(), None, 0
+                        else:
+                            yield value
+                            continue
+                    elif prefix == 'todos' and event in ('start_array', 'end_array'):
+                        metadata['todos'] = []
+                        continue
+                    elif event in ('start_map', 'start_array'):
+                        builder, target, depth = ijson.ObjectBuilder(), prefix, 0
+                    else:
+                        metadata[prefix] = value
+                        continue
+                
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                    if depth == 0:
+                        if target is None:
+                            yield builder.value
+                        else:
+                            metadata[target] = builder.value
+                        builder = None
+        except ijson.JSONError as e:
+            raise ValueError(f"JSON 파일이 손상되었습니다: {e}") from e
+    
+    @staticmethod
+    def _is_current_format(data: Dict[str, Any]) -> bool:
+        """
+        데이터가 현재 형식(마이그레이션 불필요)인지 확인합니다.
+        
+        Args:
+            data: 로드된 최상위 데이터
+            
+        Returns:
+            현재 버전 형식이면 True
+        """
+        return (data.get('data_version') == _CURRENT_DATA_VERSION and
+                'settings' in data and 'next_subtask_id' in data)
+    
     def get_next_id(self) -> int:
         """
         다음 할일 ID를 가져옴
@@ -275,13 +802,17 @@ class StorageService:
         Returns:
             다음 사용할 ID
         """
+        if self._cached_next_id is not None:
+            return self._cached_next_id
+        
         if not self.file_exists():
             return 1
         
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            return data.get('next_id', 1)
+            with open(self.file_path, 'rb') as file:
+                data = _loads(file.read())
+            self._cached_next_id = data.get('next_id', 1)
+            return self._cached_next_id
         except:
             # 오류 시 현재 할일들의 최대 ID + 1 반환
             todos = self.load_todos()
@@ -294,13 +825,17 @@ class StorageService:
         Returns:
             다음 사용할 하위 작업 ID
         """
+        if self._cached_next_subtask_id is not None:
+            return self._cached_next_subtask_id
+        
         if not self.file_exists():
             return 1
         
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            return data.get('next_subtask_id', 1)
+            with open(self.file_path, 'rb') as file:
+                data = _loads(file.read())
+            self._cached_next_subtask_id = data.get('next_subtask_id', 1)
+            return self._cached_next_subtask_id
         except:
             # 오류 시 현재 하위 작업들의 최대 ID + 1 반환
             todos = self.load_todos()
@@ -309,70 +844,112 @@ class StorageService:
     def _create_backup(self) -> None:
         """현재 데이터 파일의 백업 생성"""
         try:
-            backup_path = f"{self.file_path}.backup"
-            if os.path.exists(self.file_path):
+            backup_path = self._backup_base
+            backup_paths = self._backup_paths
+            if self.file_exists():
                 # 기존 백업들을 순환시킴 (최대 5개 유지)
-                for i in range(4, 0, -1):
-                    old_backup = f"{backup_path}.{i}"
-                    new_backup = f"{backup_path}.{i+1}"
-                    if os.path.exists(old_backup):
-                        if os.path.exists(new_backup):
-                            os.remove(new_backup)
-                        os.rename(old_backup, new_backup)
+                # 존재 여부를 따로 stat하지 않고 이동을 시도하여 저장마다의 시스템 호출을 줄임
+                for i in range(3, -1, -1):
+                    try:
+                        os.replace(backup_paths[i], backup_paths[i + 1])
+                    except FileNotFoundError:
+                        pass
                 
                 # 현재 백업을 .1로 이동
-                if os.path.exists(backup_path):
-                    if os.path.exists(f"{backup_path}.1"):
-                        os.remove(f"{backup_path}.1")
-                    os.rename(backup_path, f"{backup_path}.1")
+                try:
+                    os.replace(backup_path, backup_paths[0])
+                except FileNotFoundError:
+                    pass
                 
-                # 현재 파일을 백업으로 복사
-                import shutil
-                shutil.copy2(self.file_path, backup_path)
+                # 현재 파일을 백업으로 하드링크 (복사 없이 inode만 공유)
+                # save_todos는 os.replace로 새 inode를 쓰므로 백업 내용은 보존됨
+                try:
+                    os.link(self.file_path, backup_path)
+                except OSError:
+                    # 하드링크를 지원하지 않는 파일 시스템 등에서는 복사로 대체
+                    _copy_file(self.file_path, backup_path)
                 
         except Exception as e:
             print(f"백업 생성 중 오류 발생: {e}")
+        finally:
+            self._backup_scan_cache = None
+    
+    def _detach_backup_link(self) -> None:
+        """
+        메인 파일을 제자리에서 덮어쓰기 전에 백업과의 하드링크를 끊습니다.
+        
+        백업이 메인 파일과 같은 inode를 공유하는 경우 제자리 쓰기가
+        백업까지 변경하므로, 링크 수가 2 이상이면 메인 경로만 제거합니다.
+        """
+        try:
+            if os.stat(self.file_path).st_nlink > 1:
+                os.unlink(self.file_path)
+        except OSError:
+            pass
     
     def _restore_from_backup(self) -> List[Todo]:
         """백업 파일에서 데이터 복구 시도"""
-        backup_files = [
-            f"{self.file_path}.backup",
-            f"{self.file_path}.backup.1",
-            f"{self.file_path}.backup.2",
-            f"{self.file_path}.backup.3",
-            f"{self.file_path}.backup.4",
-            f"{self.file_path}.backup.5"
-        ]
-        
-        for backup_file in backup_files:
-            if os.path.exists(backup_file):
-                try:
-                    with open(backup_file, 'r', encoding='utf-8') as file:
-                        data = json.load(file)
+        for backup_file in self._rotating_backup_candidates():
+            # 목록 작성 후 사라진 파일은 open 실패로 건너뜀
+            try:
+                with open(backup_file, 'rb') as file:
+                    data = _loads(file.read())
+                
+                if isinstance(data, dict) and 'todos' in data:
+                    print(f"백업 파일에서 복구 성공: {backup_file}")
+                    # 복구된 데이터로 메인 파일 재생성
+                    self._detach_backup_link()
+                    _copy_file(backup_file, self.file_path)
+                    self._invalidate_file_cache()
                     
-                    if isinstance(data, dict) and 'todos' in data:
-                        print(f"백업 파일에서 복구 성공: {backup_file}")
-                        # 복구된 데이터로 메인 파일 재생성
-                        import shutil
-                        shutil.copy2(backup_file, self.file_path)
-                        
-                        todos = []
-                        for todo_data in data['todos']:
-                            try:
-                                todo = Todo.from_dict(todo_data)
-                                todos.append(todo)
-                            except:
-                                continue
-                        return todos
-                        
-                except Exception:
-                    continue
-        
+                    todos = []
+                    for todo_data in data['todos']:
+                        try:
+                            todo = Todo.from_dict(todo_data)
+                            todos.append(todo)
+                        except:
+                            continue
+                    return todos
+                    
+            except Exception:
+                continue
+    
         # 모든 백업 복구 실패 시 빈 파일 생성
         print("백업 복구 실패. 새로운 빈 파일을 생성합니다.")
         self.create_empty_file()
         return []
     
+    def _rotating_backup_candidates(self) -> List[str]:
+        """
+        순환 백업 파일(.backup, .backup.N) 경로를 최신순으로 반환합니다.
+        
+        디렉토리를 한 번만 읽어 존재하는 백업만 추리며, 수정 시간이 같으면
+        순환 번호가 작은 쪽을 먼저 둡니다. 디렉토리를 읽을 수 없으면
+        고정된 순환 경로 목록을 그대로 반환합니다.
+        
+        Returns:
+            복구를 시도할 백업 파일 경로 목록
+        """
+        prefix = self._backup_prefix
+        numbered_prefix = self._backup_numbered_prefix
+        try:
+            scanned = self._scan_backups()
+        except OSError:
+            return [self._backup_base] + self._backup_paths
+        
+        candidates = []
+        for name, path, mtime in scanned:
+            if name == prefix:
+                order = 0
+            elif name.startswith(numbered_prefix) and name[len(numbered_prefix):].isdigit():
+                order = int(name[len(numbered_prefix):])
+            else:
+                continue
+            candidates.append((-mtime, order, path))
+        
+        candidates.sort()
+        return [path for _, _, path in candidates]
+    
     def _migrate_legacy_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         기존 데이터 파일을 새로운 형식으로 자동 변환
@@ -385,6 +962,10 @@ class StorageService:
         Returns:
             변환된 데이터
         """
+        # 현재 버전으로 저장된 파일은 할일/하위 작업 전체를 검사할 필요 없음
+        if isinstance(data, dict) and self._is_current_format(data):
+            return data
+        
         migrated = False
         migration_log = []
         
@@ -396,13 +977,7 @@ class StorageService:
         
         # settings 필드가 없으면 기본값으로 추가
         if 'settings' not in data:
-            data['settings'] = {
-                'show_startup_notifications': True,
-                'default_due_time': '18:00',
-                'date_format': 'relative',
-                'auto_backup_enabled': True,
-                'backup_retention_days': 30
-            }
+            data['settings'] = dict(_DEFAULT_SETTINGS)
             migrated = True
             migration_log.append("settings 필드 추가")
         
@@ -452,7 +1027,7 @@ class StorageService:
         
         # 데이터 버전 정보 추가
         if 'data_version' not in data:
-            data['data_version'] = '2.0'  # 목표 날짜 기능이 추가된 버전
+            data['data_version'] = _CURRENT_DATA_VERSION
             migrated = True
             migration_log.append("데이터 버전 정보 추가")
         
@@ -462,14 +1037,14 @@ class StorageService:
                 # 마이그레이션 전 백업 생성
                 self._create_migration_backup()
                 
-                # 마이그레이션된 데이터 저장
-                with open(self.file_path, 'w', encoding='utf-8') as file:
-                    json.dump(data, file, ensure_ascii=False, indent=2, default=str)
+                # 마이그레이션된 데이터 저장 (원자적 교체)
+                self._write_file_atomic(self.file_path, (_dumps(data),))
                 
-                print("데이터 마이그레이션 완료:")
-                for log_entry in migration_log:
-                    print(f"  - {log_entry}")
-                print("파일이 새로운 형식으로 업데이트되었습니다.")
+                logger.info("데이터 마이그레이션 완료: %d개 항목 변환, 파일이 새로운 형식으로 업데이트되었습니다.",
+                            len(migration_log))
+                if migration_log and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("마이그레이션 상세:\n%s",
+                                 "\n".join(f"  - {entry}" for entry in migration_log))
                 
             except Exception as e:
                 print(f"마이그레이션된 데이터 저장 중 오류 발생: {e}")
@@ -478,7 +1053,8 @@ class StorageService:
         
         return data
     
-    def _validate_and_repair_data(self, todos: List[Todo]) -> List[Todo]:
+    def _validate_and_repair_data(self, todos: List[Todo],
+                                  report: Optional[Dict[str, Any]] = None) -> List[Todo]:
         """
         데이터 무결성 검사 및 복구
         
@@ -486,6 +1062,8 @@ class StorageService:
         
         Args:
             todos: 검사할 할일 목록
+            report: 주어지면 validate_due_date_fields와 같은 형식으로 날짜 필드
+                타입 문제와 목표 날짜 통계를 같은 순회에서 기록
             
         Returns:
             복구된 할일 목록
@@ -494,66 +1072,63 @@ class StorageService:
         repair_count = 0
         repair_log = []
         
+        # 목표 날짜 통계 (report가 주어진 경우에만 집계)
+        stats = report['statistics'] if report is not None else None
+        # 현재 시각은 한 번만 구해 지연 판정과 completed_at 보정에 공용
+        now = datetime.now()
+        
         # 할일 ID 중복 제거
         seen_todo_ids = set()
         
+        # 중복 ID에 새로 부여할 번호 (기존 최대 ID 다음부터 증가, 충돌마다 max를 다시 구하지 않음)
+        next_free_id = max((todo.id for todo in todos), default=0) + 1
+        next_free_subtask_id = max(
+            (subtask.id for todo in todos for subtask in todo.subtasks), default=0
+        ) + 1
+        
         for todo in todos:
             # 할일 ID 중복 검사
             if todo.id in seen_todo_ids:
                 # 새로운 ID 할당
-                max_id = max(seen_todo_ids) if seen_todo_ids else 0
                 old_id = todo.id
-                todo.id = max_id + 1
+                todo.id = next_free_id
+                next_free_id += 1
                 repair_count += 1
                 repair_log.append(f"중복된 할일 ID 수정: {old_id} -> {todo.id}")
             
             seen_todo_ids.add(todo.id)
             
-            # 목표 날짜 무결성 검사
-            if todo.due_date is not None:
-                try:
-                    # 목표 날짜가 유효한 datetime 객체인지 확인
-                    if not isinstance(todo.due_date, datetime):
-                        # 문자열인 경우 datetime으로 변환 시도
-                        if isinstance(todo.due_date, str):
-                            todo.due_date = datetime.fromisoformat(todo.due_date)
-                            repair_count += 1
-                            repair_log.append(f"할일 {todo.id}: due_date 형식 수정")
-                        else:
-                            # 변환할 수 없는 경우 None으로 설정
-                            todo.due_date = None
-                            repair_count += 1
-                            repair_log.append(f"할일 {todo.id}: 잘못된 due_date 제거")
-                except Exception:
-                    todo.due_date = None
-                    repair_count += 1
-                    repair_log.append(f"할일 {todo.id}: 손상된 due_date 제거")
-            
-            # 완료 날짜 무결성 검사
-            if todo.completed_at is not None:
-                try:
-                    if not isinstance(todo.completed_at, datetime):
-                        if isinstance(todo.completed_at, str):
-                            todo.completed_at = datetime.fromisoformat(todo.completed_at)
-                            repair_count += 1
-                            repair_log.append(f"할일 {todo.id}: completed_at 형식 수정")
-                        else:
-                            todo.completed_at = None
-                            repair_count += 1
-                            repair_log.append(f"할일 {todo.id}: 잘못된 completed_at 제거")
-                except Exception:
-                    todo.completed_at = None
-                    repair_count += 1
-                    repair_log.append(f"할일 {todo.id}: 손상된 completed_at 제거")
+            # 날짜 필드 무결성 검사 (이미 datetime이면 검사 생략)
+            for field_name in self._DATETIME_FIELDS:
+                value = getattr(todo, field_name)
+                if value is None or isinstance(value, datetime):
+                    continue
+                if report is not None:
+                    report['valid'] = False
+                    report['issues'].append(f"할일 {todo.id}: {field_name}{self._NOT_DATETIME_SUFFIX[field_name]}")
+                coerced = self._coerce_dt(value)
+                setattr(todo, field_name, coerced)
+                repair_count += 1
+                if coerced is not None:
+                    repair_log.append(f"할일 {todo.id}: {field_name} 형식 수정")
+                else:
+                    repair_log.append(f"할일 {todo.id}: 잘못된 {field_name} 제거")
             
             # 논리적 일관성 검사: 완료된 할일의 경우 completed_at이 있어야 함
-            if todo.is_completed() and todo.completed_at is None:
-                todo.completed_at = datetime.now()
+            todo_completed = todo.is_completed()
+            if todo_completed and todo.completed_at is None:
+                todo.completed_at = now
                 repair_count += 1
                 repair_log.append(f"할일 {todo.id}: 완료된 할일에 completed_at 추가")
             
-            # 하위 작업 무결성 검사
-            valid_subtasks = []
+            if stats is not None:
+                stats['total_subtasks'] += len(todo.subtasks)
+                if todo.due_date is not None:
+                    stats['todos_with_due_date'] += 1
+                    if todo.due_date < now and not todo_completed:
+                        stats['overdue_todos'] += 1
+            
+            # 하위 작업 무결성 검사 (하위 작업을 빼지는 않으므로 목록은 그대로 두고 항목만 수정)
             seen_subtask_ids = set()
             
             for subtask in todo.subtasks:
@@ -565,72 +1140,85 @@ class StorageService:
                 
                 # 하위 작업 ID 중복 검사
                 if subtask.id in seen_subtask_ids:
-                    # 새로운 ID 할당
-                    max_subtask_id = max(seen_subtask_ids) if seen_subtask_ids else 0
+                    # 새로운 ID 할당 (하위 작업 ID는 전체에서 고유하므로 전역 카운터 사용)
                     old_id = subtask.id
-                    subtask.id = max_subtask_id + 1
+                    subtask.id = next_free_subtask_id
+                    next_free_subtask_id += 1
                     repair_count += 1
                     repair_log.append(f"중복된 하위 작업 ID 수정: {old_id} -> {subtask.id}")
                 
                 seen_subtask_ids.add(subtask.id)
                 
-                # 하위 작업 목표 날짜 무결성 검사
-                if subtask.due_date is not None:
-                    try:
-                        if not isinstance(subtask.due_date, datetime):
-                            if isinstance(subtask.due_date, str):
-                                subtask.due_date = datetime.fromisoformat(subtask.due_date)
-                                repair_count += 1
-                                repair_log.append(f"하위작업 {subtask.id}: due_date 형식 수정")
-                            else:
-                                subtask.due_date = None
-                                repair_count += 1
-                                repair_log.append(f"하위작업 {subtask.id}: 잘못된 due_date 제거")
-                    except Exception:
-                        subtask.due_date = None
-                        repair_count += 1
-                        repair_log.append(f"하위작업 {subtask.id}: 손상된 due_date 제거")
-                
-                # 하위 작업 완료 날짜 무결성 검사
-                if subtask.completed_at is not None:
-                    try:
-                        if not isinstance(subtask.completed_at, datetime):
-                            if isinstance(subtask.completed_at, str):
-                                subtask.completed_at = datetime.fromisoformat(subtask.completed_at)
-                                repair_count += 1
-                                repair_log.append(f"하위작업 {subtask.id}: completed_at 형식 수정")
-                            else:
-                                subtask.completed_at = None
-                                repair_count += 1
-                                repair_log.append(f"하위작업 {subtask.id}: 잘못된 completed_at 제거")
-                    except Exception:
-                        subtask.completed_at = None
-                        repair_count += 1
-                        repair_log.append(f"하위작업 {subtask.id}: 손상된 completed_at 제거")
+                # 하위 작업 날짜 필드 무결성 검사
+                for field_name in self._DATETIME_FIELDS:
+                    value = getattr(subtask, field_name)
+                    if value is None or isinstance(value, datetime):
+                        continue
+                    if report is not None:
+                        report['valid'] = False
+                        report['issues'].append(
+                            f"하위작업 {subtask.id}: {field_name}{self._NOT_DATETIME_SUFFIX[field_name]}"
+                        )
+                    coerced = self._coerce_dt(value)
+                    setattr(subtask, field_name, coerced)
+                    repair_count += 1
+                    if coerced is not None:
+                        repair_log.append(f"하위작업 {subtask.id}: {field_name} 형식 수정")
+                    else:
+                        repair_log.append(f"하위작업 {subtask.id}: 잘못된 {field_name} 제거")
                 
                 # 하위 작업 논리적 일관성 검사
                 if subtask.is_completed and subtask.completed_at is None:
-                    subtask.completed_at = datetime.now()
+                    subtask.completed_at = now
                     repair_count += 1
                     repair_log.append(f"하위작업 {subtask.id}: 완료된 작업에 completed_at 추가")
                 
+                if stats is not None and subtask.due_date is not None:
+                    stats['subtasks_with_due_date'] += 1
+                    if subtask.due_date < now and not subtask.is_completed:
+                        stats['overdue_subtasks'] += 1
+                
                 # 목표 날짜 논리적 검사: 하위 작업이 상위 할일보다 늦으면 경고
                 if (subtask.due_date is not None and todo.due_date is not None and 
                     subtask.due_date > todo.due_date):
                     repair_log.append(f"경고: 하위작업 {subtask.id}의 목표날짜가 상위 할일보다 늦음")
-                
-                valid_subtasks.append(subtask)
             
-            todo.subtasks = valid_subtasks
             repaired_todos.append(todo)
         
         if repair_count > 0:
-            print(f"데이터 무결성 복구 완료: {repair_count}개 항목 수정")
-            for log_entry in repair_log:
-                print(f"  - {log_entry}")
+            logger.info("데이터 무결성 복구 완료: %d개 항목 수정", repair_count)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("무결성 복구 상세:\n%s",
+                             "\n".join(f"  - {entry}" for entry in repair_log))
         
         return repaired_todos
     
+    # 무결성 검사 대상 날짜 필드 (Todo/SubTask 공통)
+    _DATETIME_FIELDS = ('due_date', 'completed_at')
+    # 날짜 필드 타입 문제 메시지 접미사 (validate_due_date_fields와 같은 문구)
+    _NOT_DATETIME_SUFFIX = {'due_date': '가 datetime 타입이 아님',
+                            'completed_at': '이 datetime 타입이 아님'}
+    
+    @staticmethod
+    def _coerce_dt(value: Any) -> Optional[datetime]:
+        """
+        날짜 필드 값을 datetime으로 변환합니다.
+        
+        Args:
+            value: datetime, ISO 형식 문자열 또는 그 밖의 값
+            
+        Returns:
+            변환된 datetime (None이거나 변환할 수 없으면 None)
+        """
+        if value is None or isinstance(value, datetime):
+            return value
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        return None
+    
     def _calculate_next_subtask_id(self, todos: List[Todo]) -> int:
         """
         모든 하위 작업의 최대 ID + 1을 계산
@@ -641,14 +1229,7 @@ class StorageService:
         Returns:
             다음 사용할 하위 작업 ID
         """
-        max_subtask_id = 0
-        
-        for todo in todos:
-            for subtask in todo.subtasks:
-                if subtask.id > max_subtask_id:
-                    max_subtask_id = subtask.id
-        
-        return max_subtask_id + 1
+        return max((subtask.id for todo in todos for subtask in todo.subtasks), default=0) + 1
     
     # 자동 저장 및 백업 시스템 메서드들
     
@@ -689,31 +1270,33 @@ class StorageService:
         Returns:
             저장 성공 여부
         """
-        # 데이터 해시 계산
-        current_hash = self._calculate_data_hash(todos)
-        
-        # 데이터가 변경되지 않았으면 저장하지 않음
-        if current_hash == self._last_data_hash:
-            return True
-        
-        # 복구 파일 생성 (저장 시작 전)
-        self._create_recovery_file(todos)
-        
-        # 실제 저장 수행 (재시도 로직 포함)
-        success = self._save_with_retry(todos, max_retries=3)
-        
-        if success:
-            self._last_data_hash = current_hash
-            self._last_save_time = time.time()
-            self._pending_save = False
+        # 자동 저장 스레드와 호출 스레드가 동시에 저장하지 않도록 직렬화
+        with self._save_lock:
+            # 데이터 해시 계산
+            current_hash = self._calculate_data_hash(todos)
+            
+            # 데이터가 변경되지 않았으면 저장하지 않음
+            if current_hash == self._last_data_hash:
+                self._pending_save = False
+                return True
             
-            # 복구 파일 삭제 (저장 성공 시)
-            self._cleanup_recovery_file()
+            # 실제 저장 수행 (재시도 로직 포함)
+            # 복구 파일은 저장용으로 직렬화한 내용을 그대로 재사용하여 쓰기 직전에 생성
+            success = self._save_with_retry(todos, max_retries=3,
+                                            before_write=self._create_recovery_file)
             
-            # 변경 알림
-            self._notify_change()
-        
-        return success
+            if success:
+                self._last_data_hash = current_hash
+                self._last_save_time = time.time()
+                self._pending_save = False
+                
+                # 복구 파일 삭제 (저장 성공 시)
+                self._cleanup_recovery_file()
+                
+                # 변경 알림
+                self._notify_change()
+            
+            return success
     
     def _calculate_data_hash(self, todos: List[Todo]) -> str:
         """
@@ -723,35 +1306,84 @@ class StorageService:
             todos: 할일 목록
             
         Returns:
-            데이터의 MD5 해시값
+            데이터의 BLAKE2b(128비트) 해시값
         """
         try:
-            # 데이터를 JSON 문자열로 변환
-            data = {
-                "todos": [todo.to_dict() for todo in todos],
-                "next_id": max([todo.id for todo in todos], default=0) + 1,
-                "next_subtask_id": self._calculate_next_subtask_id(todos)
-            }
+            # 할일별 다이제스트를 순서대로 누적 (필드 지문이 같으면 이전 다이제스트 재사용)
+            data_hash = hashlib.blake2b(digest_size=16)
+            previous_cache = self._todo_hash_cache
+            new_cache: Dict[int, Tuple[tuple, bytes]] = {}
+            max_todo_id = 0
+            max_subtask_id = 0
+            
+            for todo in todos:
+                fingerprint = self._todo_fingerprint(todo)
+                cached = previous_cache.get(todo.id)
+                if cached is not None and cached[0] == fingerprint:
+                    digest = cached[1]
+                else:
+                    digest = hashlib.blake2b(_dumps(todo.to_dict(), sort_keys=True),
+                                             digest_size=16).digest()
+                new_cache[todo.id] = (fingerprint, digest)
+                data_hash.update(digest)
+                
+                if todo.id > max_todo_id:
+                    max_todo_id = todo.id
+                for subtask in todo.subtasks:
+                    if subtask.id > max_subtask_id:
+                        max_subtask_id = subtask.id
+            
+            # 삭제된 할일의 항목이 남지 않도록 캐시 교체
+            self._todo_hash_cache = new_cache
+            
+            # 다음 ID 값도 해시에 포함
+            data_hash.update((max_todo_id + 1).to_bytes(8, 'little', signed=True))
+            data_hash.update((max_subtask_id + 1).to_bytes(8, 'little', signed=True))
             
-            json_str = json.dumps(data, sort_keys=True, default=str)
-            return hashlib.md5(json_str.encode('utf-8')).hexdigest()
+            return data_hash.hexdigest()
         except Exception:
             return ""
     
-    def _save_with_retry(self, todos: List[Todo], max_retries: int = 3) -> bool:
+    @staticmethod
+    def _todo_fingerprint(todo: Todo) -> tuple:
+        """
+        할일의 직렬화 대상 필드를 튜플로 묶은 지문을 반환합니다.
+        
+        모델 객체는 GUI 등에서 직접 수정되므로 별도의 변경 표시 없이도
+        지문 비교(정확한 값 비교)만으로 다이제스트 재계산 여부를 판단합니다.
+        
+        Args:
+            todo: 대상 할일
+            
+        Returns:
+            필드 값 튜플
+        """
+        return (
+            todo.id, todo.title, todo.created_at, todo.folder_path,
+            todo.is_expanded, todo.due_date, todo.completed_at,
+            tuple(
+                (subtask.id, subtask.todo_id, subtask.title, subtask.is_completed,
+                 subtask.created_at, subtask.due_date, subtask.completed_at)
+                for subtask in todo.subtasks
+            )
+        )
+    
+    def _save_with_retry(self, todos: List[Todo], max_retries: int = 3,
+                         before_write: Optional[Callable[[bytes], None]] = None) -> bool:
         """
         재시도 로직이 포함된 저장 메서드
         
         Args:
             todos: 저장할 할일 목록
             max_retries: 최대 재시도 횟수
+            before_write: save_todos에 그대로 전달할 쓰기 직전 콜백
             
         Returns:
             저장 성공 여부
         """
         for attempt in range(max_retries + 1):
             try:
-                if self.save_todos(todos):
+                if self.save_todos(todos, before_write=before_write):
                     if attempt > 0:
                         print(f"데이터 저장 성공 (재시도 {attempt}회 후)")
                     return True
@@ -773,51 +1405,140 @@ class StorageService:
         return False
     
     def _start_auto_save(self) -> None:
-        """자동 저장 타이머를 시작합니다."""
-        if self._auto_save_timer is not None:
-            self._auto_save_timer.cancel()
+        """자동 저장 스레드를 시작합니다. 이미 실행 중이면 그대로 둡니다."""
+        if self._auto_save_thread is not None and self._auto_save_thread.is_alive():
+            return
         
-        self._auto_save_timer = threading.Timer(self._auto_save_interval, self._auto_save_check)
-        self._auto_save_timer.daemon = True
-        self._auto_save_timer.start()
+        self._drain_write_queue()
+        self._auto_save_thread = threading.Thread(
+            target=self._auto_save_loop, name="StorageAutoSave", daemon=True
+        )
+        self._auto_save_thread.start()
+        _active_services.add(self)
     
-    def _auto_save_check(self) -> None:
-        """자동 저장이 필요한지 확인하고 실행합니다."""
+    def _stop_auto_save(self) -> None:
+        """자동 저장 스레드를 종료하고 끝날 때까지 기다립니다."""
+        thread = self._auto_save_thread
+        if thread is None:
+            return
+        
+        # 새 스냅샷이 종료 신호를 밀어내지 않도록 먼저 참조를 해제
+        self._auto_save_thread = None
+        _active_services.discard(self)
+        self._submit_snapshot(_STOP)
+        if thread is not threading.current_thread():
+            thread.join(timeout=self._auto_save_interval)
+    
+    def _drain_write_queue(self) -> None:
+        """쓰기 큐에 남아 있는 스냅샷을 버립니다."""
         try:
-            if self._pending_save:
-                # 현재 데이터를 로드하여 저장
-                current_todos = self.load_todos()
-                if current_todos is not None:
-                    self.save_todos_with_auto_save(current_todos)
+            while True:
+                self._write_queue.get_nowait()
+        except queue.Empty:
+            pass
+    
+    def _submit_snapshot(self, snapshot: Any) -> None:
+        """
+        이전 스냅샷을 버리고 가장 최근 스냅샷만 쓰기 큐에 넣습니다.
+        
+        Args:
+            snapshot: 저장할 할일 목록 스냅샷 또는 종료 신호
+        """
+        while True:
+            self._drain_write_queue()
+            try:
+                self._write_queue.put_nowait(snapshot)
+                return
+            except queue.Full:
+                continue
+    
+    def _auto_save_loop(self) -> None:
+        """
+        자동 저장(쓰기 전용) 스레드 본체
+        
+        쓰기 큐에 스냅샷이 들어오면 즉시, 그렇지 않으면 주기마다 깨어납니다.
+        큐는 최신 스냅샷 하나만 보관하므로 밀린 변경은 한 번의 저장으로 합쳐집니다.
+        """
+        while True:
+            try:
+                snapshot = self._write_queue.get(timeout=self._auto_save_interval)
+            except queue.Empty:
+                snapshot = None
+            
+            if snapshot is _STOP:
+                break
+            self._auto_save_check(snapshot)
+    
+    def _auto_save_check(self, snapshot: Optional[List[Todo]] = None) -> None:
+        """
+        자동 저장이 필요한지 확인하고 메모리의 데이터를 그대로 저장합니다.
+        
+        Args:
+            snapshot: 저장할 (데이터 세대, 할일 목록) 스냅샷 (None이면 마지막으로 전달된 목록 사용)
+        """
+        try:
+            # 파일 교체와 겹치지 않도록 저장 잠금 안에서 확인하고 저장
+            with self._save_lock:
+                if snapshot is not None:
+                    generation, todos = snapshot
+                    if generation != self._data_generation:
+                        return  # 데이터 파일이 교체되기 전에 만든 스냅샷
+                elif self._pending_save and self._current_todos is not None:
+                    todos = list(self._current_todos)
+                else:
+                    return
+                self.save_todos_with_auto_save(todos)
         except Exception as e:
             print(f"자동 저장 중 오류 발생: {e}")
-        finally:
-            # 다음 자동 저장 스케줄링
-            if self.auto_save_enabled:
-                self._start_auto_save()
     
-    def mark_data_changed(self) -> None:
-        """데이터가 변경되었음을 표시합니다."""
+    def mark_data_changed(self, todos: Optional[List[Todo]] = None) -> None:
+        """
+        데이터가 변경되었음을 표시하고 자동 저장 스레드에 최신 스냅샷을 넘깁니다.
+        
+        호출 스레드는 직렬화나 디스크 I/O를 기다리지 않습니다. 목록은 호출 스레드에서
+        사본으로 만들어 넘기므로, 자동 저장 스레드는 화면에서 수정 중인 객체를
+        읽거나 (무결성 복구로) 고치지 않습니다.
+        
+        Args:
+            todos: 저장할 현재 할일 목록 (None이면 이전에 만든 사본 사용)
+        """
+        if todos is not None:
+            self._current_todos = _snapshot_todos(todos)
         self._pending_save = True
+        if self._current_todos is not None and self._auto_save_thread is not None:
+            self._submit_snapshot((self._data_generation, self._current_todos))
+    
+    def _discard_pending_changes(self) -> None:
+        """
+        데이터 파일을 교체하기 전에 아직 저장되지 않은 변경을 버립니다.
+        
+        대기 중인 스냅샷과 메모리 데이터를 비우고 데이터 세대를 올려,
+        자동 저장 스레드가 이미 꺼낸 이전 스냅샷도 교체된 파일을 덮어쓰지 않도록 합니다.
+        호출자는 저장 잠금을 잡은 상태여야 합니다.
+        """
+        self._data_generation += 1
+        self._pending_save = False
+        self._current_todos = None
+        self._drain_write_queue()
     
-    def _create_recovery_file(self, todos: List[Todo]) -> None:
+    def _create_recovery_file(self, content: bytes) -> None:
         """
         복구용 임시 파일을 생성합니다.
         
+        저장할 문서(todos, next_id, next_subtask_id 등)를 다시 직렬화하지 않고
+        그 바이트 뒤에 timestamp와 original_file 키만 덧붙여 기록합니다.
+        
         Args:
-            todos: 저장할 할일 목록
+            content: save_todos가 직렬화한 문서 바이트
         """
         try:
-            recovery_data = {
-                "todos": [todo.to_dict() for todo in todos],
-                "next_id": max([todo.id for todo in todos], default=0) + 1,
-                "next_subtask_id": self._calculate_next_subtask_id(todos),
+            body, tail = self._extend_object(content, {
                 "timestamp": time.time(),
                 "original_file": self.file_path
-            }
-            
-            with open(self._recovery_file, 'w', encoding='utf-8') as file:
-                json.dump(recovery_data, file, ensure_ascii=False, indent=2, default=str)
+            })
+            # 저장마다 기록되므로 fsync 없이 교체만 원자적으로 수행
+            # (메인 파일 저장은 별도로 fsync됨)
+            self._write_file_atomic(self._recovery_file, (body, tail), durable=False)
                 
         except Exception as e:
             print(f"복구 파일 생성 중 오류 발생: {e}")
@@ -825,8 +1546,9 @@ class StorageService:
     def _cleanup_recovery_file(self) -> None:
         """복구 파일을 삭제합니다."""
         try:
-            if os.path.exists(self._recovery_file):
-                os.remove(self._recovery_file)
+            os.remove(self._recovery_file)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"복구 파일 삭제 중 오류 발생: {e}")
     
@@ -836,26 +1558,25 @@ class StorageService:
             return
         
         try:
-            with open(self._recovery_file, 'r', encoding='utf-8') as file:
-                recovery_data = json.load(file)
+            with open(self._recovery_file, 'rb') as file:
+                recovery_data = _loads(file.read())
             
             # 복구 파일의 타임스탬프 확인
             recovery_time = recovery_data.get('timestamp', 0)
             
             # 메인 파일이 없거나 복구 파일이 더 최신인 경우
-            if not self.file_exists() or (self.file_exists() and 
+            if (not self.file_exists() or 
                 os.path.getmtime(self.file_path) < recovery_time):
                 
                 print("비정상 종료가 감지되었습니다. 데이터를 복구합니다...")
                 
-                # 복구 데이터로 메인 파일 생성
-                with open(self.file_path, 'w', encoding='utf-8') as file:
-                    main_data = {
-                        "todos": recovery_data["todos"],
-                        "next_id": recovery_data["next_id"],
-                        "next_subtask_id": recovery_data["next_subtask_id"]
-                    }
-                    json.dump(main_data, file, ensure_ascii=False, indent=2, default=str)
+                # 복구 데이터로 메인 파일 생성 (임시 파일에 쓴 뒤 원자적으로 교체)
+                main_data = {
+                    "todos": recovery_data["todos"],
+                    "next_id": recovery_data["next_id"],
+                    "next_subtask_id": recovery_data["next_subtask_id"]
+                }
+                self._write_file_atomic(self.file_path, (_dumps(main_data),))
                 
                 print("데이터 복구가 완료되었습니다.")
             
@@ -883,13 +1604,13 @@ class StorageService:
         
         try:
             if backup_name is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
                 backup_name = f"manual_backup_{timestamp}"
             
             backup_path = f"{self.file_path}.{backup_name}"
             
-            import shutil
-            shutil.copy2(self.file_path, backup_path)
+            _copy_file(self.file_path, backup_path)
+            self._backup_scan_cache = None
             
             print(f"수동 백업이 생성되었습니다: {backup_path}")
             return True
@@ -905,29 +1626,100 @@ class StorageService:
         Returns:
             백업 파일 경로 목록
         """
-        backup_files = []
-        directory = os.path.dirname(self.file_path) or "."
-        filename = os.path.basename(self.file_path)
+        backups = []
+        prefix = self._backup_prefix
         
         try:
-            for file in os.listdir(directory):
-                if file.startswith(f"{filename}.backup"):
-                    backup_files.append(os.path.join(directory, file))
+            # 공유 스캔 결과의 수정 시간을 정렬 키로 재사용
+            for name, path, mtime in self._scan_backups():
+                if name.startswith(prefix):
+                    backups.append((mtime, path))
             
             # 수정 시간 순으로 정렬 (최신 순)
-            backup_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+            backups.sort(reverse=True)
             
         except Exception as e:
             print(f"백업 파일 목록 조회 중 오류 발생: {e}")
         
-        return backup_files
+        return [path for _, path in backups]
     
-    def restore_from_backup_file(self, backup_path: str) -> bool:
+    def _scan_backups(self) -> List[Tuple[str, str, float]]:
+        """
+        데이터 디렉토리의 백업 파일(순환/수동)을 한 번 스캔하여 공유합니다.
+        
+        결과는 디렉토리 mtime을 키로 캐시되며, 백업 생성/삭제 시에도 명시적으로 비웁니다.
+        list_backups, cleanup_old_backups, 백업 복구 후보 조회가 같은 결과를 사용합니다.
+        
+        Returns:
+            (파일 이름, 경로, 수정 시간) 목록 (읽기 전용)
+            
+        Raises:
+            OSError: 디렉토리를 읽을 수 없는 경우
+        """
+        dir_mtime_ns = os.stat(self._dir).st_mtime_ns
+        cached = self._backup_scan_cache
+        if cached is not None and cached[0] == dir_mtime_ns:
+            return cached[1]
+        
+        prefixes = self._backup_scan_prefixes
+        scanned = []
+        with os.scandir(self._dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith(prefixes):
+                    continue
+                try:
+                    if entry.is_file():
+                        scanned.append((entry.name, entry.path, entry.stat().st_mtime))
+                except OSError:
+                    continue  # 목록 조회 중 삭제된 파일
+        
+        if self._is_settled(dir_mtime_ns):
+            self._backup_scan_cache = (dir_mtime_ns, scanned)
+        return scanned
+    
+    @staticmethod
+    def _is_settled(mtime_ns: int) -> bool:
+        """
+        mtime이 메모이즈 키로 쓰기에 충분히 오래되었는지 확인
+        
+        Args:
+            mtime_ns: 나노초 단위 수정 시간
+            
+        Returns:
+            최근 _MTIME_SETTLE_NS 이내에 바뀌지 않았으면 True
+        """
+        return mtime_ns <= time.time_ns() - _MTIME_SETTLE_NS
+    
+    def _status_cache_key(self) -> Optional[tuple]:
+        """
+        무결성 상태 메모이즈 키 (메인 파일과 백업 디렉토리의 stat 정보)
+        
+        Returns:
+            키 튜플, 아직 안정되지 않았거나 stat에 실패하면 None
+        """
+        try:
+            dir_mtime_ns = os.stat(self._dir).st_mtime_ns
+            try:
+                st = os.stat(self.file_path)
+                file_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+            except FileNotFoundError:
+                file_key = None
+        except OSError:
+            return None
+        
+        if not self._is_settled(dir_mtime_ns):
+            return None
+        if file_key is not None and not self._is_settled(file_key[0]):
+            return None
+        return (file_key, dir_mtime_ns)
+    
+    def restore_from_backup_file(self, backup_path: str, strict: bool = False) -> bool:
         """
         특정 백업 파일에서 데이터를 복구합니다.
         
         Args:
             backup_path: 복구할 백업 파일 경로
+            strict: True이면 형식 확인을 위해 항상 파일 전체를 파싱
             
         Returns:
             복구 성공 여부
@@ -937,21 +1729,32 @@ class StorageService:
             return False
         
         try:
-            # 백업 파일 유효성 검사
-            with open(backup_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            
-            if not isinstance(data, dict) or 'todos' not in data:
-                print("백업 파일 형식이 올바르지 않습니다.")
-                return False
+            # 백업 파일 유효성 검사 (앞뒤 일부만 확인해 판단되면 전체 파싱 생략)
+            if strict or not self._looks_like_todo_document(backup_path):
+                with open(backup_path, 'rb') as file:
+                    data = _loads(file.read())
+                
+                if not isinstance(data, dict) or 'todos' not in data:
+                    print("백업 파일 형식이 올바르지 않습니다.")
+                    return False
             
-            # 현재 파일을 백업으로 저장
-            if self.file_exists():
-                self._create_backup()
+            # 현재 파일이 선택한 백업과 같은 내용이면 사전 백업과 복사 모두 불필요
+            if self._same_file_content(self.file_path, backup_path):
+                print(f"현재 데이터가 백업과 같아 복구할 내용이 없습니다: {backup_path}")
+                return True
             
-            # 백업 파일을 메인 파일로 복사
-            import shutil
-            shutil.copy2(backup_path, self.file_path)
+            with self._save_lock:
+                # 복구한 파일을 이전 변경이 덮어쓰지 않도록 대기 중인 자동 저장을 버림
+                self._discard_pending_changes()
+                
+                # 현재 파일을 백업으로 저장
+                if self.file_exists():
+                    self._create_backup()
+                
+                # 백업 파일을 메인 파일로 복사
+                self._detach_backup_link()
+                _copy_file(backup_path, self.file_path)
+                self._invalidate_file_cache()
             
             print(f"백업에서 복구가 완료되었습니다: {backup_path}")
             return True
@@ -960,6 +1763,58 @@ class StorageService:
             print(f"백업 복구 중 오류 발생: {e}")
             return False
     
+    @staticmethod
+    def _same_file_content(path_a: str, path_b: str) -> bool:
+        """
+        두 파일의 내용이 같은지 확인 (같은 inode이거나 크기가 다르면 내용을 읽지 않음)
+        
+        Args:
+            path_a: 비교할 첫 번째 파일 경로
+            path_b: 비교할 두 번째 파일 경로
+            
+        Returns:
+            두 파일이 모두 존재하고 내용이 같으면 True
+        """
+        try:
+            stat_a = os.stat(path_a)
+            stat_b = os.stat(path_b)
+        except OSError:
+            return False
+        
+        if os.path.samestat(stat_a, stat_b):
+            return True  # 하드링크된 백업 등 같은 파일
+        if stat_a.st_size != stat_b.st_size:
+            return False
+        # 처음 다른 블록에서 바로 멈추는 바이트 비교
+        return filecmp.cmp(path_a, path_b, shallow=False)
+    
+    @staticmethod
+    def _looks_like_todo_document(path: str) -> bool:
+        """
+        파일 앞부분과 끝부분만 읽어 할일 데이터 문서로 보이는지 확인
+        
+        객체로 시작해 앞부분에 "todos" 키가 있고 닫는 중괄호로 끝나면 True입니다.
+        작은 파일이나 판단할 수 없는 경우에는 False를 반환하므로 호출자는 전체 파싱으로 확인해야 합니다.
+        
+        Args:
+            path: 확인할 파일 경로
+            
+        Returns:
+            전체 파싱 없이 신뢰할 수 있으면 True
+        """
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size <= 2 * _SNIFF_SIZE:
+                return False  # 작은 파일은 전체 파싱 비용이 크지 않음
+            head = file.read(_SNIFF_SIZE)
+            file.seek(-64, os.SEEK_END)
+            tail = file.read()
+        
+        head = head.lstrip(b'\xef\xbb\xbf \t\r\n')
+        return (head.startswith(b'{') and
+                _TODOS_KEY_PATTERN.search(head) is not None and
+                tail.rstrip().endswith(b'}'))
+    
     def get_data_integrity_status(self) -> Dict[str, Any]:
         """
         데이터 무결성 상태를 반환합니다.
@@ -967,6 +1822,12 @@ class StorageService:
         Returns:
             무결성 상태 정보
         """
+        # 파일과 백업 디렉토리가 그대로면 다시 읽고 파싱하지 않음
+        cache_key = self._status_cache_key()
+        cached = self._status_cache
+        if cache_key is not None and cached is not None and cached[0] == cache_key:
+            return dict(cached[1], integrity_issues=list(cached[1]["integrity_issues"]))
+        
         status = {
             "file_exists": self.file_exists(),
             "file_size": 0,
@@ -1001,7 +1862,12 @@ class StorageService:
             
         except Exception as e:
             status["integrity_issues"].append(f"상태 확인 중 오류: {e}")
+            return status
         
+        # 로드 중 복구/마이그레이션으로 파일이 바뀌었을 수 있으므로 키를 다시 계산
+        cache_key = self._status_cache_key()
+        if cache_key is not None:
+            self._status_cache = (cache_key, dict(status, integrity_issues=list(status["integrity_issues"])))
         return status
     
     def _check_data_integrity_issues(self, todos: List[Todo]) -> List[str]:
@@ -1017,21 +1883,33 @@ class StorageService:
         issues = []
         
         try:
-            # 할일 ID 중복 검사
-            todo_ids = [todo.id for todo in todos]
-            if len(todo_ids) != len(set(todo_ids)):
-                issues.append("중복된 할일 ID가 발견되었습니다")
+            # 할일 ID 중복 검사 (처음 발견된 중복 ID만 보고)
+            seen_todo_ids = set()
+            duplicate_todo_id = None
             
-            # 하위 작업 무결성 검사
             for todo in todos:
-                subtask_ids = [subtask.id for subtask in todo.subtasks]
-                
-                # 하위 작업 ID 중복 검사
-                if len(subtask_ids) != len(set(subtask_ids)):
-                    issues.append(f"할일 {todo.id}에 중복된 하위 작업 ID가 있습니다")
+                if duplicate_todo_id is None:
+                    if todo.id in seen_todo_ids:
+                        duplicate_todo_id = todo.id
+                        issues.append(f"중복된 할일 ID가 발견되었습니다: {todo.id}")
+                    else:
+                        seen_todo_ids.add(todo.id)
                 
-                # 하위 작업의 todo_id 검사
+                # 하위 작업 무결성 검사
+                seen_subtask_ids = set()
+                duplicate_subtask_id = None
                 for subtask in todo.subtasks:
+                    # 하위 작업 ID 중복 검사
+                    if duplicate_subtask_id is None:
+                        if subtask.id in seen_subtask_ids:
+                            duplicate_subtask_id = subtask.id
+                            issues.append(
+                                f"할일 {todo.id}에 중복된 하위 작업 ID가 있습니다: {subtask.id}"
+                            )
+                        else:
+                            seen_subtask_ids.add(subtask.id)
+                    
+                    # 하위 작업의 todo_id 검사
                     if subtask.todo_id != todo.id:
                         issues.append(f"하위 작업 {subtask.id}의 todo_id가 올바르지 않습니다")
             
@@ -1048,15 +1926,19 @@ class StorageService:
             복구 성공 여부
         """
         try:
-            todos = self.load_todos()
-            if not todos:
-                return True
-            
-            # 기존 복구 로직 사용
-            repaired_todos = self._validate_and_repair_data(todos)
-            
-            # 복구된 데이터 저장
-            return self.save_todos(repaired_todos)
+            with self._save_lock:
+                todos = self.load_todos()
+                if not todos:
+                    return True
+                
+                # 기존 복구 로직 사용
+                repaired_todos = self._validate_and_repair_data(todos)
+                
+                # 복구한 파일을 이전 변경이 덮어쓰지 않도록 대기 중인 자동 저장을 버림
+                self._discard_pending_changes()
+                
+                # 복구된 데이터 저장
+                return self.save_todos(repaired_todos)
             
         except Exception as e:
             print(f"데이터 무결성 복구 중 오류 발생: {e}")
@@ -1071,8 +1953,7 @@ class StorageService:
         try:
             if os.path.exists(self.file_path):
                 migration_backup_path = f"{self.file_path}.migration_backup"
-                import shutil
-                shutil.copy2(self.file_path, migration_backup_path)
+                _copy_file(self.file_path, migration_backup_path)
                 print(f"마이그레이션 백업 생성: {migration_backup_path}")
         except Exception as e:
             print(f"마이그레이션 백업 생성 중 오류 발생: {e}")
@@ -1086,32 +1967,32 @@ class StorageService:
         try:
             migration_backup_path = f"{self.file_path}.migration_backup"
             if os.path.exists(migration_backup_path):
-                import shutil
-                shutil.copy2(migration_backup_path, self.file_path)
+                self._detach_backup_link()
+                _copy_file(migration_backup_path, self.file_path)
+                self._invalidate_file_cache()
                 print("마이그레이션 백업에서 복구 완료")
                 # 백업 파일 삭제
                 os.remove(migration_backup_path)
         except Exception as e:
             print(f"마이그레이션 백업 복구 중 오류 발생: {e}")
     
-    def validate_due_date_fields(self, todos: List[Todo]) -> Dict[str, Any]:
+    @staticmethod
+    def _new_due_date_report(total_todos: int) -> Dict[str, Any]:
         """
-        목표 날짜 필드의 유효성을 검사
-        
-        Requirements 1.3: 데이터 무결성 검사
+        목표 날짜 검사 결과 딕셔너리의 초기값 생성
         
         Args:
-            todos: 검사할 할일 목록
+            total_todos: 검사 대상 할일 수
             
         Returns:
-            검사 결과 딕셔너리
+            validate_due_date_fields 형식의 빈 검사 결과
         """
-        validation_result = {
+        return {
             'valid': True,
             'issues': [],
             'warnings': [],
             'statistics': {
-                'total_todos': len(todos),
+                'total_todos': total_todos,
                 'todos_with_due_date': 0,
                 'overdue_todos': 0,
                 'total_subtasks': 0,
@@ -1119,69 +2000,87 @@ class StorageService:
                 'overdue_subtasks': 0
             }
         }
+    
+    def validate_due_date_fields(self, todos: List[Todo]) -> Dict[str, Any]:
+        """
+        목표 날짜 필드의 유효성을 검사
+        
+        Requirements 1.3: 데이터 무결성 검사
+        
+        Args:
+            todos: 검사할 할일 목록
+            
+        Returns:
+            검사 결과 딕셔너리
+        """
+        validation_result = self._new_due_date_report(len(todos))
+        issues = validation_result['issues']
+        warnings = validation_result['warnings']
+        
+        # 통계는 지역 변수로 세고 마지막에 한 번만 기록 (항목마다 딕셔너리 두 번 조회하지 않음)
+        todos_with_due_date = overdue_todos = 0
+        total_subtasks = subtasks_with_due_date = overdue_subtasks = 0
         
         now = datetime.now()
         
         for todo in todos:
+            todo_due = todo.due_date
+            # 목표 날짜가 datetime일 때만 비교에 사용
+            valid_todo_due = None
+            
             # 할일 목표 날짜 검사
-            if todo.due_date is not None:
-                validation_result['statistics']['todos_with_due_date'] += 1
+            if todo_due is not None:
+                todos_with_due_date += 1
                 
                 # 목표 날짜 타입 검사
-                if not isinstance(todo.due_date, datetime):
-                    validation_result['valid'] = False
-                    validation_result['issues'].append(
-                        f"할일 {todo.id}: due_date가 datetime 타입이 아님"
-                    )
+                if not isinstance(todo_due, datetime):
+                    issues.append(f"할일 {todo.id}: due_date가 datetime 타입이 아님")
                 else:
+                    valid_todo_due = todo_due
                     # 지연 여부 확인
-                    if todo.due_date < now and not todo.is_completed():
-                        validation_result['statistics']['overdue_todos'] += 1
+                    if todo_due < now and not todo.is_completed():
+                        overdue_todos += 1
             
             # 완료 날짜 검사
-            if todo.completed_at is not None:
-                if not isinstance(todo.completed_at, datetime):
-                    validation_result['valid'] = False
-                    validation_result['issues'].append(
-                        f"할일 {todo.id}: completed_at이 datetime 타입이 아님"
-                    )
-                elif todo.due_date is not None and todo.completed_at > todo.due_date:
-                    validation_result['warnings'].append(
-                        f"할일 {todo.id}: 목표날짜 이후에 완료됨"
-                    )
+            completed_at = todo.completed_at
+            if completed_at is not None:
+                if not isinstance(completed_at, datetime):
+                    issues.append(f"할일 {todo.id}: completed_at이 datetime 타입이 아님")
+                elif valid_todo_due is not None and completed_at > valid_todo_due:
+                    warnings.append(f"할일 {todo.id}: 목표날짜 이후에 완료됨")
             
             # 하위 작업 검사
-            for subtask in todo.subtasks:
-                validation_result['statistics']['total_subtasks'] += 1
-                
-                if subtask.due_date is not None:
-                    validation_result['statistics']['subtasks_with_due_date'] += 1
+            subtasks = todo.subtasks
+            total_subtasks += len(subtasks)
+            for subtask in subtasks:
+                subtask_due = subtask.due_date
+                if subtask_due is not None:
+                    subtasks_with_due_date += 1
                     
                     # 하위 작업 목표 날짜 타입 검사
-                    if not isinstance(subtask.due_date, datetime):
-                        validation_result['valid'] = False
-                        validation_result['issues'].append(
-                            f"하위작업 {subtask.id}: due_date가 datetime 타입이 아님"
-                        )
+                    if not isinstance(subtask_due, datetime):
+                        issues.append(f"하위작업 {subtask.id}: due_date가 datetime 타입이 아님")
                     else:
                         # 지연 여부 확인
-                        if subtask.due_date < now and not subtask.is_completed:
-                            validation_result['statistics']['overdue_subtasks'] += 1
+                        if subtask_due < now and not subtask.is_completed:
+                            overdue_subtasks += 1
                         
                         # 상위 할일과의 일관성 검사
-                        if (todo.due_date is not None and 
-                            subtask.due_date > todo.due_date):
-                            validation_result['warnings'].append(
-                                f"하위작업 {subtask.id}: 상위 할일보다 늦은 목표날짜"
-                            )
+                        if valid_todo_due is not None and subtask_due > valid_todo_due:
+                            warnings.append(f"하위작업 {subtask.id}: 상위 할일보다 늦은 목표날짜")
                 
                 # 하위 작업 완료 날짜 검사
-                if subtask.completed_at is not None:
-                    if not isinstance(subtask.completed_at, datetime):
-                        validation_result['valid'] = False
-                        validation_result['issues'].append(
-                            f"하위작업 {subtask.id}: completed_at이 datetime 타입이 아님"
-                        )
+                if subtask.completed_at is not None and not isinstance(subtask.completed_at, datetime):
+                    issues.append(f"하위작업 {subtask.id}: completed_at이 datetime 타입이 아님")
+        
+        validation_result['valid'] = not issues
+        validation_result['statistics'].update(
+            todos_with_due_date=todos_with_due_date,
+            overdue_todos=overdue_todos,
+            total_subtasks=total_subtasks,
+            subtasks_with_due_date=subtasks_with_due_date,
+            overdue_subtasks=overdue_subtasks
+        )
         
         return validation_result
     
@@ -1199,17 +2098,31 @@ class StorageService:
             내보내기 성공 여부
         """
         try:
+            # 직렬화, 통계, 다음 ID 계산을 목록 한 번 순회로 처리
+            todo_dicts = []
+            total_subtasks = 0
+            max_todo_id = 0
+            max_subtask_id = 0
+            for todo in todos:
+                todo_dicts.append(todo.to_dict())
+                if todo.id > max_todo_id:
+                    max_todo_id = todo.id
+                total_subtasks += len(todo.subtasks)
+                for subtask in todo.subtasks:
+                    if subtask.id > max_subtask_id:
+                        max_subtask_id = subtask.id
+            
             # 내보내기 데이터 구성
             export_data = {
                 'export_info': {
                     'version': '2.0',
                     'export_date': datetime.now().isoformat(),
                     'total_todos': len(todos),
-                    'total_subtasks': sum(len(todo.subtasks) for todo in todos)
+                    'total_subtasks': total_subtasks
                 },
-                'todos': [todo.to_dict() for todo in todos],
-                'next_id': max([todo.id for todo in todos], default=0) + 1,
-                'next_subtask_id': self._calculate_next_subtask_id(todos),
+                'todos': todo_dicts,
+                'next_id': max_todo_id + 1,
+                'next_subtask_id': max_subtask_id + 1,
                 'settings': {
                     'show_startup_notifications': True,
                     'default_due_time': '18:00',
@@ -1217,9 +2130,8 @@ class StorageService:
                 }
             }
             
-            # 파일에 저장
-            with open(export_path, 'w', encoding='utf-8') as file:
-                json.dump(export_data, file, ensure_ascii=False, indent=2, default=str)
+            # 파일에 저장 (한 번에 직렬화하여 임시 파일에 쓴 뒤 원자적으로 교체)
+            self._write_file_atomic(export_path, (_dumps(export_data, pretty=True),))
             
             print(f"데이터 내보내기 완료: {export_path}")
             return True
@@ -1245,26 +2157,25 @@ class StorageService:
                 print(f"가져올 파일이 존재하지 않습니다: {import_path}")
                 return []
             
-            with open(import_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            
-            # 데이터 구조 검증
-            if not isinstance(data, dict) or 'todos' not in data:
-                print("가져올 파일의 형식이 올바르지 않습니다.")
-                return []
-            
-            # 마이그레이션 적용
-            data = self._migrate_legacy_data(data)
-            
-            # Todo 객체로 변환
-            todos = []
-            for todo_data in data['todos']:
-                try:
-                    todo = Todo.from_dict(todo_data)
-                    todos.append(todo)
-                except Exception as e:
-                    print(f"할일 데이터 변환 중 오류 (건너뜀): {e}")
-                    continue
+            if HAS_IJSON and os.path.getsize(import_path) > _STREAM_LOAD_THRESHOLD:
+                # 큰 파일은 할일 단위로 스트리밍하여 변환 (누락된 필드 기본값은 Todo.from_dict가 채움)
+                _, todos, invalid_count = self._stream_load_todos(import_path)
+            else:
+                with open(import_path, 'rb') as file:
+                    data = _loads(file.read())
+                
+                # 데이터 구조 검증
+                if not isinstance(data, dict) or 'todos' not in data:
+                    print("가져올 파일의 형식이 올바르지 않습니다.")
+                    return []
+                
+                # 마이그레이션 적용
+                data = self._migrate_legacy_data(data)
+                
+                # Todo 객체로 변환 (로드와 같은 변환기 사용, 잘못된 항목은 건너뜀)
+                todos, invalid_count = self._build_todos(data['todos'])
+            if invalid_count > 0:
+                print(f"할일 데이터 변환 중 오류로 {invalid_count}개 항목을 건너뛰었습니다.")
             
             # 데이터 무결성 검사 및 복구
             todos = self._validate_and_repair_data(todos)
@@ -1292,23 +2203,21 @@ class StorageService:
         cutoff_time = time.time() - (retention_days * 24 * 60 * 60)
         
         try:
-            directory = os.path.dirname(self.file_path) or "."
-            filename = os.path.basename(self.file_path)
-            
-            for file in os.listdir(directory):
-                if (file.startswith(f"{filename}.backup") or 
-                    file.startswith(f"{filename}.manual_backup")):
-                    
-                    file_path = os.path.join(directory, file)
-                    if os.path.getmtime(file_path) < cutoff_time:
-                        try:
-                            os.remove(file_path)
-                            deleted_count += 1
-                            print(f"오래된 백업 파일 삭제: {file}")
-                        except Exception as e:
-                            print(f"백업 파일 삭제 중 오류: {file}, {e}")
+            for name, path, mtime in self._scan_backups():
+                if mtime >= cutoff_time:
+                    continue
+                
+                try:
+                    os.remove(path)
+                    deleted_count += 1
+                    print(f"오래된 백업 파일 삭제: {name}")
+                except FileNotFoundError:
+                    continue  # 스캔 이후 이미 삭제된 파일
+                except Exception as e:
+                    print(f"백업 파일 삭제 중 오류: {name}, {e}")
             
             if deleted_count > 0:
+                self._backup_scan_cache = None
                 print(f"총 {deleted_count}개의 오래된 백업 파일을 삭제했습니다.")
                 
         except Exception as e:
@@ -1318,19 +2227,17 @@ class StorageService:
     
     def shutdown(self) -> None:
         """서비스 종료 시 정리 작업을 수행합니다."""
-        # 자동 저장 타이머 중지
-        if self._auto_save_timer is not None:
-            self._auto_save_timer.cancel()
-            self._auto_save_timer = None
+        # 자동 저장 스레드 중지
+        self._stop_auto_save()
         
-        # 대기 중인 저장 작업 완료
-        if self._pending_save:
+        # 대기 중인 저장 작업 완료 (메모리 데이터가 없으면 파일이 이미 최신이므로
+        # 다시 읽어 그대로 쓰지 않음)
+        if self._pending_save and self._current_todos is not None:
             try:
-                current_todos = self.load_todos()
-                if current_todos is not None:
-                    self.save_todos_with_auto_save(current_todos)
+                self.save_todos_with_auto_save(self._current_todos)
             except Exception as e:
                 print(f"종료 시 저장 중 오류 발생: {e}")
+        self._pending_save = False
         
         # 복구 파일 정리
         self._cleanup_recovery_file()
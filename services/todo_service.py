@@ -4,15 +4,163 @@
 할일 추가, 조회, 수정, 삭제 등의 핵심 비즈니스 로직을 처리합니다.
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+import errno
+import heapq
+from bisect import bisect_left, bisect_right
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import filterfalse
+from operator import attrgetter, methodcaller
+from typing import List, Optional, Dict, Any, Tuple, Iterator, Callable
 from datetime import datetime, timedelta
 from models.todo import Todo
 from models.subtask import SubTask
 from services.storage_service import StorageService
 from services.file_service import FileService
+from services.date_service import DateService
 from utils.validators import TodoValidator
 from utils.performance_utils import get_performance_optimizer, batch_update
 
+logger = logging.getLogger(__name__)
+
+# 검색어별 검색 결과를 기억해 둘 최대 개수
+_SEARCH_RESULT_CACHE_SIZE = 32
+
+# 폴더 생성 실패 안내 메시지
+_FOLDER_PERMISSION_MESSAGE = "할일 폴더 생성 권한이 없습니다.\n관리자 권한으로 실행하거나 다른 위치를 선택해주세요."
+_FOLDER_NO_SPACE_MESSAGE = "디스크 공간이 부족하여 폴더를 생성할 수 없습니다.\n불필요한 파일을 삭제한 후 다시 시도해주세요."
+_FOLDER_NAME_TOO_LONG_MESSAGE = "할일 제목이 너무 길어 폴더를 생성할 수 없습니다.\n제목을 짧게 수정해주세요."
+
+# 폴더 생성 실패 시 errno별 안내 메시지
+_FOLDER_ERRNO_MESSAGES = {
+    errno.EACCES: _FOLDER_PERMISSION_MESSAGE,
+    errno.EPERM: _FOLDER_PERMISSION_MESSAGE,
+    errno.ENOSPC: _FOLDER_NO_SPACE_MESSAGE,
+    errno.ENAMETOOLONG: _FOLDER_NAME_TOO_LONG_MESSAGE,
+}
+_FOLDER_DEFAULT_MESSAGE = "할일 폴더 생성에 실패했습니다.\n시스템 관리자에게 문의하거나 다른 위치를 시도해주세요."
+
+
+def _folder_error_message(error: OSError) -> str:
+    """
+    폴더 생성 오류에 맞는 안내 메시지를 반환합니다.
+    
+    FileService는 원래 예외를 원인(__cause__)으로 감싸 다시 발생시키므로
+    예외 체인에서 처음 발견되는 errno로 메시지를 고릅니다. errno가 없는 오류
+    (FileService가 직접 만든 경로 길이 오류 등)만 메시지 내용으로 판단합니다.
+    
+    Args:
+        error: 폴더 생성 중 발생한 예외
+        
+    Returns:
+        str: 사용자 안내 메시지
+    """
+    current = error
+    while current is not None:
+        code = getattr(current, 'errno', None)
+        if code is not None:
+            return _FOLDER_ERRNO_MESSAGES.get(code, _FOLDER_DEFAULT_MESSAGE)
+        current = current.__cause__
+    
+    error_msg = str(error)
+    if "권한" in error_msg:
+        return _FOLDER_PERMISSION_MESSAGE
+    if "공간" in error_msg:
+        return _FOLDER_NO_SPACE_MESSAGE
+    if "경로가 너무" in error_msg:
+        return _FOLDER_NAME_TOO_LONG_MESSAGE
+    return _FOLDER_DEFAULT_MESSAGE
+
+
+def _insort_by_created_at(todos: List[Todo], todo: Todo) -> None:
+    """
+    생성 시간 순으로 정렬된 목록에 정렬 순서를 유지하며 할일을 삽입합니다.
+    
+    새 할일은 보통 가장 최근에 만들어졌으므로 끝에 바로 추가하고, 시계가 뒤로
+    돌아간 경우에만 이진 탐색으로 위치를 찾습니다. 생성 시간이 같으면 기존
+    항목 뒤에 삽입합니다 (bisect.insort_right와 같은 동작).
+    
+    Args:
+        todos: 생성 시간 순으로 정렬된 할일 목록
+        todo: 삽입할 할일
+    """
+    created_at = todo.created_at
+    if not todos or todos[-1].created_at <= created_at:
+        todos.append(todo)
+        return
+    
+    lo, hi = 0, len(todos)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if created_at < todos[mid].created_at:
+            hi = mid
+        else:
+            lo = mid + 1
+    todos.insert(lo, todo)
+
+
+def _index_by_created_at(todos: List[Todo], todo: Todo) -> int:
+    """
+    생성 시간 순으로 정렬된 목록에서 할일 객체의 위치를 찾습니다.
+    
+    이진 탐색으로 같은 생성 시간의 첫 위치를 찾은 뒤 그 구간에서만
+    객체 동일성(is)으로 비교합니다.
+    
+    Args:
+        todos: 생성 시간 순으로 정렬된 할일 목록
+        todo: 찾을 할일 객체
+        
+    Returns:
+        int: 할일의 위치 (없으면 -1)
+    """
+    created_at = todo.created_at
+    lo, hi = 0, len(todos)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if todos[mid].created_at < created_at:
+            lo = mid + 1
+        else:
+            hi = mid
+    
+    for index in range(lo, len(todos)):
+        candidate = todos[index]
+        if candidate is todo:
+            return index
+        if candidate.created_at != created_at:
+            break
+    return -1
+
+
+def _snapshot_fields(item: Any) -> Dict[str, Any]:
+    """
+    저장 실패 시 되돌릴 수 있도록 객체의 필드 값을 얕게 복사합니다.
+    
+    목록 등 가변 필드는 같은 객체를 가리키므로, 필드 값을 바꾸는 변경에만 사용합니다.
+    
+    Args:
+        item: 필드를 복사할 할일 또는 하위 작업
+        
+    Returns:
+        Dict[str, Any]: 필드 이름별 값
+    """
+    return dict(vars(item))
+
+
+def _restore_fields(item: Any, snapshot: Dict[str, Any]) -> None:
+    """
+    _snapshot_fields로 복사해 둔 필드 값을 그대로 되돌립니다.
+    
+    Args:
+        item: 되돌릴 할일 또는 하위 작업
+        snapshot: _snapshot_fields가 반환한 필드 값
+    """
+    vars(item).update(snapshot)
+
+
+# 검색 문자열에서 제목 사이를 구분하는 문자 (제목 경계를 넘어 일치하지 않도록)
+_SEARCH_SEPARATOR = "\n"
+
 
 class TodoService:
     """할일 관련 비즈니스 로직을 처리하는 서비스 클래스"""
@@ -28,6 +176,27 @@ class TodoService:
         self.storage_service = storage_service
         self.file_service = file_service
         self._todos_cache: Optional[List[Todo]] = None
+        # _todos_cache와 함께 쓰는 ID 인덱스 (어떤 목록으로 만들었는지 함께 기억)
+        self._todos_by_id: Dict[int, Todo] = {}
+        # 최대 할일 ID (None이면 다음 조회 때 인덱스에서 계산)
+        self._max_todo_id: Optional[int] = None
+        self._indexed_todos: Optional[List[Todo]] = None
+        # filter_todos용 소문자 검색 문자열 (할일, 제목+하위 작업 제목), 캐시가 바뀌면 다시 만듦
+        self._search_index: Optional[List[Tuple[Todo, str]]] = None
+        self._search_indexed_todos: Optional[List[Todo]] = None
+        # 검색어별 검색 결과 (LRU, 어떤 검색 인덱스로 만들었는지 함께 기억)
+        self._search_results: 'OrderedDict[str, List[Todo]]' = OrderedDict()
+        self._search_results_index: Optional[List[Tuple[Todo, str]]] = None
+        # 목표 날짜순 인덱스 (정렬된 목표 날짜 목록, 같은 순서의 (캐시 내 위치, 할일) 목록)
+        self._due_index: Optional[Tuple[List[datetime], List[Tuple[int, Todo]]]] = None
+        self._due_indexed_todos: Optional[List[Todo]] = None
+        # batch() 중첩 깊이와 아직 저장하지 않은 목록
+        self._batch_depth = 0
+        self._batch_pending: Optional[List[Todo]] = None
+        # 캐시에 아직 저장이 확인되지 않은 변경이 있는지 여부 (종료 시 저장 판단용)
+        self._dirty = False
+        # 배치 업데이트 콜백이 반영했지만 아직 저장하지 않은 변경이 있는지 여부
+        self._batch_updates_pending = False
         self.performance_optimizer = get_performance_optimizer()
         
         # 배치 업데이트 콜백 등록
@@ -50,59 +219,185 @@ class TodoService:
             RuntimeError: 저장에 실패한 경우
         """
         # 제목 유효성 검사
-        if not TodoValidator.validate_title(title):
+        clean_title = TodoValidator.clean_title(title)
+        if clean_title is None:
             raise ValueError("할일 제목이 유효하지 않습니다.")
         
         # 현재 할일 목록 로드
         todos = self.get_all_todos()
         
         # 새 ID 생성
-        next_id = self.storage_service.get_next_id()
+        next_id = self._next_todo_id()
         
         # 폴더 경로 생성
-        temp_todo = Todo(
+        todo = Todo(
             id=next_id,
-            title=title.strip(),
+            title=clean_title,
             created_at=datetime.now(),
-            folder_path=""  # 임시로 빈 문자열
+            folder_path=""  # 폴더 생성 후 채움
         )
         
         # 폴더 생성
         try:
-            folder_path = self.file_service.create_todo_folder(temp_todo)
+            folder_path = self.file_service.create_todo_folder(todo)
             # 실제 폴더 경로로 업데이트
-            todo = Todo(
-                id=next_id,
-                title=title.strip(),
-                created_at=temp_todo.created_at,
-                folder_path=folder_path
-            )
+            todo.folder_path = folder_path
         except OSError as e:
             # 더 상세한 오류 메시지 제공
-            error_msg = str(e)
-            if "Permission denied" in error_msg or "권한" in error_msg:
-                raise RuntimeError(f"할일 폴더 생성 권한이 없습니다.\n관리자 권한으로 실행하거나 다른 위치를 선택해주세요.\n상세 오류: {e}")
-            elif "No space left" in error_msg or "공간" in error_msg:
-                raise RuntimeError(f"디스크 공간이 부족하여 폴더를 생성할 수 없습니다.\n불필요한 파일을 삭제한 후 다시 시도해주세요.\n상세 오류: {e}")
-            elif "File name too long" in error_msg or "경로가 너무" in error_msg:
-                raise RuntimeError(f"할일 제목이 너무 길어 폴더를 생성할 수 없습니다.\n제목을 짧게 수정해주세요.\n상세 오류: {e}")
-            else:
-                raise RuntimeError(f"할일 폴더 생성에 실패했습니다.\n시스템 관리자에게 문의하거나 다른 위치를 시도해주세요.\n상세 오류: {e}")
-        
-        # 할일 목록에 추가
-        todos.append(todo)
+            raise RuntimeError(f"{_folder_error_message(e)}\n상세 오류: {e}")
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
+        # 할일 목록에 추가 (생성 시간 순서 유지, 다시 정렬하지 않음)
+        _insort_by_created_at(todos, todo)
+        
+        # 저장 (자동 저장 기능 사용, 일괄 변경 중에는 캐시에만 반영)
+        if not self._save_todos(todos, added=todo):
             # 저장 실패 시 생성된 폴더 삭제
             self.file_service.delete_todo_folder(folder_path)
             raise RuntimeError("할일 저장에 실패했습니다.")
         
-        # 캐시 무효화
-        self._todos_cache = None
-        
         return todo
     
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        여러 변경 작업을 묶어 블록이 끝날 때 한 번만 저장합니다.
+        
+        블록 안의 추가/수정/삭제는 메모리 캐시에만 반영되며, 중첩된 경우
+        가장 바깥 블록을 벗어날 때 전체 목록을 저장합니다.
+        
+        모두 반영되거나 모두 취소되는 트랜잭션이 아닙니다. 블록 안에서 예외가
+        발생해도 그 전까지의 변경은 저장된 뒤 예외가 그대로 전달됩니다
+        (할일 폴더 생성/삭제처럼 되돌릴 수 없는 작업이 함께 일어나기 때문).
+        
+            with todo_service.batch():
+                for title in titles:
+                    todo_service.add_todo(title)
+        
+        Raises:
+            RuntimeError: 블록이 정상 종료되었지만 저장에 실패한 경우
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            failed = self._batch_depth == 0 and not self._flush_batch()
+        if failed:
+            raise RuntimeError("일괄 변경 저장에 실패했습니다.")
+    
+    def _flush_batch(self) -> bool:
+        """
+        batch() 동안 모아 둔 변경을 한 번에 저장합니다.
+        
+        Returns:
+            bool: 저장할 내용이 없거나 저장에 성공하면 True
+        """
+        todos = self._batch_pending
+        if todos is None:
+            return True
+        self._batch_pending = None
+        
+        if self.storage_service.save_todos_with_auto_save(todos):
+            # 캐시는 batch() 동안 이미 최신 목록으로 유지됨
+            self._dirty = False
+            return True
+        
+        # 저장하지 못한 변경은 캐시에 남기고 자동 저장/종료 시 다시 저장되도록 표시
+        self.storage_service.mark_data_changed(todos)
+        return False
+    
+    def _save_todos(self, todos: List[Todo], added: Optional[Todo] = None,
+                    removed: Optional[Todo] = None) -> bool:
+        """
+        변경된 할일 목록을 저장하고 캐시를 갱신합니다.
+        
+        저장에 성공하면 디스크에서 다시 읽지 않고 저장한 목록을 그대로 캐시로
+        사용합니다. batch() 블록 안에서는 저장하지 않고 목록을 캐시로 유지하여
+        블록이 끝날 때 한 번만 저장합니다.
+        
+        Args:
+            todos: 저장할 할일 목록 (생성 순서대로 정렬된 상태)
+            added: 이번 변경으로 추가된 할일 (있는 경우)
+            removed: 이번 변경으로 삭제된 할일 (있는 경우)
+            
+        Returns:
+            bool: 저장 성공 여부 (일괄 변경 중에는 항상 True)
+        """
+        if self._batch_depth > 0:
+            self._set_cache(todos, added, removed)
+            self._batch_pending = todos
+            self._dirty = True
+            return True
+        
+        if not self.storage_service.save_todos_with_auto_save(todos):
+            # 호출자가 되돌리지 않는 변경(배치 업데이트 등)이 남을 수 있으므로 종료 시 다시 저장
+            self._dirty = True
+            return False
+        
+        self._set_cache(todos, added, removed)
+        self._dirty = False
+        return True
+    
+    def _set_cache(self, todos: List[Todo], added: Optional[Todo] = None,
+                   removed: Optional[Todo] = None) -> None:
+        """
+        캐시를 새 목록으로 교체하고 ID 인덱스를 증분 갱신합니다.
+        
+        기존 인덱스가 이전 캐시로 만든 것이면 추가/삭제된 할일만 반영해
+        새 목록에 이어 붙이고, 그렇지 않으면 다음 조회 때 다시 만들도록 둡니다.
+        
+        Args:
+            todos: 새 캐시 목록
+            added: 추가된 할일
+            removed: 삭제된 할일
+        """
+        index_valid = self._todos_cache is not None and self._indexed_todos is self._todos_cache
+        self._todos_cache = todos
+        self._search_index = None
+        self._due_index = None
+        if not index_valid:
+            self._indexed_todos = None
+            return
+        
+        if removed is not None:
+            self._todos_by_id.pop(removed.id, None)
+            if removed.id == self._max_todo_id:
+                # 최대 ID가 삭제된 경우에만 다음 조회 때 다시 계산
+                self._max_todo_id = None
+        if added is not None:
+            self._todos_by_id[added.id] = added
+            if self._max_todo_id is not None and added.id > self._max_todo_id:
+                self._max_todo_id = added.id
+        self._indexed_todos = todos
+    
+    def _next_todo_id(self) -> int:
+        """
+        새 할일에 부여할 ID를 반환합니다.
+        
+        Returns:
+            int: 다음 할일 ID
+        """
+        next_id = self.storage_service.get_next_id()
+        if self._batch_depth > 0:
+            # 일괄 변경 중에는 아직 저장되지 않은 할일도 고려
+            next_id = max(next_id, self.get_max_todo_id() + 1)
+        return next_id
+    
+    def _next_subtask_id(self) -> int:
+        """
+        새 하위 작업에 부여할 ID를 반환합니다.
+        
+        Returns:
+            int: 다음 하위 작업 ID
+        """
+        next_id = self.storage_service.get_next_subtask_id()
+        if self._batch_depth > 0:
+            # 일괄 변경 중에는 아직 저장되지 않은 하위 작업도 고려
+            max_subtask_id = max((subtask.id for todo in self._get_all_todos_internal()
+                                  for subtask in todo.subtasks), default=0)
+            next_id = max(next_id, max_subtask_id + 1)
+        return next_id
+    
     def get_all_todos(self) -> List[Todo]:
         """
         모든 할일 목록을 조회합니다.
@@ -112,20 +407,51 @@ class TodoService:
         Returns:
             List[Todo]: 할일 목록 (생성 순서대로 정렬)
         """
-        # 캐시가 있으면 캐시 반환
-        if self._todos_cache is not None:
-            return self._todos_cache.copy()
+        # 호출자가 목록을 변경해도 캐시가 영향받지 않도록 복사본 반환
+        return self._get_all_todos_internal().copy()
+    
+    def _get_all_todos_internal(self) -> List[Todo]:
+        """
+        캐시된 할일 목록을 복사하지 않고 그대로 반환합니다.
         
-        # 저장소에서 로드
-        todos = self.storage_service.load_todos()
+        반환된 목록은 캐시 자체이므로 읽기 전용으로만 사용해야 합니다.
+        캐시 목록은 한 번 게시된 뒤에는 제자리에서 바뀌지 않고(추가/삭제는 새 목록을
+        만들어 교체) 참조 교체는 한 번의 대입이므로, 다른 스레드가 캐시를 교체하거나
+        비우더라도 반환된 목록은 일관된 스냅샷으로 남습니다.
         
-        # 생성 시간 순으로 정렬 (Requirements 4.3)
-        todos.sort(key=lambda x: x.created_at)
+        Returns:
+            List[Todo]: 캐시된 할일 목록 (생성 순서대로 정렬)
+        """
+        # 속성을 한 번만 읽어 확인과 반환 사이에 다른 스레드가 캐시를 비워도 안전하도록 함
+        todos = self._todos_cache
+        if todos is None:
+            # 저장소에서 로드
+            todos = self.storage_service.load_todos()
+            
+            # 생성 시간 순으로 정렬 (Requirements 4.3)
+            todos.sort(key=attrgetter('created_at'))
+            
+            # 캐시 업데이트 (정렬이 끝난 목록만 게시)
+            self._todos_cache = todos
         
-        # 캐시 업데이트
-        self._todos_cache = todos.copy()
+        return todos
+    
+    def _get_todo_index(self) -> Dict[int, Todo]:
+        """
+        할일 ID -> 할일 객체 인덱스를 반환합니다.
         
-        return todos.copy()
+        인덱스는 현재 캐시 목록으로 만든 것일 때만 재사용하므로
+        캐시가 무효화되면 다음 조회 시 자동으로 다시 만들어집니다.
+        
+        Returns:
+            Dict[int, Todo]: ID별 할일 딕셔너리
+        """
+        todos = self._get_all_todos_internal()
+        if self._indexed_todos is not todos:
+            self._todos_by_id = {todo.id: todo for todo in todos}
+            self._max_todo_id = None
+            self._indexed_todos = todos
+        return self._todos_by_id
     
     def update_todo(self, todo_id: int, new_title: str) -> bool:
         """
@@ -144,35 +470,26 @@ class TodoService:
             ValueError: 제목이 유효하지 않거나 할일을 찾을 수 없는 경우
         """
         # 제목 유효성 검사
-        if not TodoValidator.validate_title(new_title):
+        clean_title = TodoValidator.clean_title(new_title)
+        if clean_title is None:
             raise ValueError("할일 제목이 유효하지 않습니다.")
         
-        # 할일 목록 로드
-        todos = self.get_all_todos()
+        # 할일 목록 로드 (목록 구조는 바꾸지 않으므로 캐시를 그대로 사용)
+        todos = self._get_all_todos_internal()
         
         # 해당 할일 찾기
-        todo_to_update = None
-        for todo in todos:
-            if todo.id == todo_id:
-                todo_to_update = todo
-                break
-        
-        if todo_to_update is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        todo_to_update = self._lookup(todo_id)
         
         # 제목 업데이트
-        old_title = todo_to_update.title
-        todo_to_update.title = new_title.strip()
+        snapshot = _snapshot_fields(todo_to_update)
+        todo_to_update.title = clean_title
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
-            # 저장 실패 시 원래 제목으로 복원
-            todo_to_update.title = old_title
+        # 저장 (자동 저장 기능 사용, 일괄 변경 중에는 캐시에만 반영)
+        if not self._save_todos(todos):
+            # 저장 실패 시 원래 값으로 복원
+            _restore_fields(todo_to_update, snapshot)
             return False
         
-        # 캐시 무효화
-        self._todos_cache = None
-        
         return True
     
     def delete_todo(self, todo_id: int, delete_folder: bool = False) -> bool:
@@ -191,36 +508,28 @@ class TodoService:
         Raises:
             ValueError: 할일을 찾을 수 없는 경우
         """
-        # 할일 목록 로드
-        todos = self.get_all_todos()
-        
         # 해당 할일 찾기
-        todo_to_delete = None
-        todo_index = -1
-        for i, todo in enumerate(todos):
-            if todo.id == todo_id:
-                todo_to_delete = todo
-                todo_index = i
-                break
-        
-        if todo_to_delete is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
-        
-        # 할일 목록에서 제거
-        todos.pop(todo_index)
+        todo_to_delete = self._lookup(todo_id)
+        
+        # 삭제할 할일을 뺀 새 목록 구성 (캐시 목록은 변경하지 않음)
+        cached = self._get_all_todos_internal()
+        index = _index_by_created_at(cached, todo_to_delete)
+        if index >= 0:
+            # 위치를 이진 탐색으로 찾아 복사본에서 한 번에 제거
+            todos = cached.copy()
+            del todos[index]
+        else:
+            todos = [todo for todo in cached if todo is not todo_to_delete]
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
+        # 저장 (자동 저장 기능 사용, 일괄 변경 중에는 캐시에만 반영)
+        if not self._save_todos(todos, removed=todo_to_delete):
             return False
         
         # 폴더 삭제 (요청된 경우)
         if delete_folder and todo_to_delete.folder_path:
             folder_deleted = self.file_service.delete_todo_folder(todo_to_delete.folder_path)
             if not folder_deleted:
-                print(f"경고: 폴더 삭제에 실패했습니다: {todo_to_delete.folder_path}")
-        
-        # 캐시 무효화
-        self._todos_cache = None
+                logger.warning("폴더 삭제에 실패했습니다: %s", todo_to_delete.folder_path)
         
         return True
     
@@ -234,13 +543,45 @@ class TodoService:
         Returns:
             Optional[Todo]: 찾은 할일 객체 (없으면 None)
         """
-        todos = self.get_all_todos()
+        return self._get_todo_index().get(todo_id)
+    
+    def _lookup(self, todo_id: int) -> Todo:
+        """
+        ID로 할일을 찾고, 없으면 ValueError를 발생시킵니다.
         
-        for todo in todos:
-            if todo.id == todo_id:
-                return todo
+        Args:
+            todo_id: 찾을 할일의 ID
+            
+        Returns:
+            Todo: 찾은 할일 객체
+            
+        Raises:
+            ValueError: 할일을 찾을 수 없는 경우
+        """
+        todo = self._get_todo_index().get(todo_id)
+        if todo is None:
+            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        return todo
+    
+    @staticmethod
+    def _lookup_subtask(todo: Todo, subtask_id: int) -> SubTask:
+        """
+        할일에서 ID로 하위 작업을 찾고, 없으면 ValueError를 발생시킵니다.
         
-        return None
+        Args:
+            todo: 하위 작업을 찾을 할일
+            subtask_id: 찾을 하위 작업의 ID
+            
+        Returns:
+            SubTask: 찾은 하위 작업 객체
+            
+        Raises:
+            ValueError: 하위 작업을 찾을 수 없는 경우
+        """
+        subtask = next((subtask for subtask in todo.subtasks if subtask.id == subtask_id), None)
+        if subtask is None:
+            raise ValueError("해당 하위 작업을 찾을 수 없습니다.")
+        return subtask
     
     def get_max_todo_id(self) -> int:
         """
@@ -249,15 +590,30 @@ class TodoService:
         Returns:
             int: 최대 ID (할일이 없으면 0)
         """
-        todos = self.get_all_todos()
-        if not todos:
-            return 0
-        
-        return max(todo.id for todo in todos)
+        # 최대 ID는 인덱스와 함께 증분 갱신되며, 모르는 경우에만 한 번 계산
+        todos_by_id = self._get_todo_index()
+        if self._max_todo_id is None:
+            self._max_todo_id = max(todos_by_id, default=0)
+        return self._max_todo_id
     
     def clear_cache(self) -> None:
-        """캐시를 무효화합니다."""
+        """
+        캐시를 무효화합니다.
+        
+        아직 저장하지 않은 변경이 있으면 먼저 저장하며, 저장에 실패하면
+        변경을 잃지 않도록 캐시를 그대로 둡니다.
+        """
+        if self._dirty and not self.force_save():
+            logger.warning("저장되지 않은 변경이 있어 캐시를 유지합니다.")
+            return
+        self._reset_cache()
+    
+    def _reset_cache(self) -> None:
+        """저장 여부와 관계없이 캐시와 파생 인덱스를 버립니다 (데이터 파일이 교체된 경우)."""
         self._todos_cache = None
+        self._search_index = None
+        self._due_index = None
+        self._dirty = False
     
     # 하위 작업 관련 메서드들
     
@@ -278,30 +634,24 @@ class TodoService:
             ValueError: 제목이 유효하지 않거나 할일을 찾을 수 없는 경우
         """
         # 제목 유효성 검사
-        if not TodoValidator.validate_title(subtask_title):
+        clean_title = TodoValidator.clean_title(subtask_title)
+        if clean_title is None:
             raise ValueError("하위 작업 제목이 유효하지 않습니다.")
         
         # 할일 목록 로드
-        todos = self.get_all_todos()
+        todos = self._get_all_todos_internal()
         
         # 해당 할일 찾기
-        target_todo = None
-        for todo in todos:
-            if todo.id == todo_id:
-                target_todo = todo
-                break
-        
-        if target_todo is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        target_todo = self._lookup(todo_id)
         
         # 새 하위 작업 ID 생성
-        next_subtask_id = self.storage_service.get_next_subtask_id()
+        next_subtask_id = self._next_subtask_id()
         
         # 하위 작업 생성
         subtask = SubTask(
             id=next_subtask_id,
             todo_id=todo_id,
-            title=subtask_title.strip(),
+            title=clean_title,
             is_completed=False,
             created_at=datetime.now()
         )
@@ -309,15 +659,12 @@ class TodoService:
         # 할일에 하위 작업 추가
         target_todo.add_subtask(subtask)
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
+        # 저장 (자동 저장 기능 사용, 일괄 변경 중에는 캐시에만 반영)
+        if not self._save_todos(todos):
             # 저장 실패 시 하위 작업 제거
             target_todo.remove_subtask(subtask.id)
             return None
         
-        # 캐시 무효화
-        self._todos_cache = None
-        
         return subtask
     
     def update_subtask(self, todo_id: int, subtask_id: int, new_title: str) -> bool:
@@ -338,45 +685,29 @@ class TodoService:
             ValueError: 제목이 유효하지 않거나 할일/하위작업을 찾을 수 없는 경우
         """
         # 제목 유효성 검사
-        if not TodoValidator.validate_title(new_title):
+        clean_title = TodoValidator.clean_title(new_title)
+        if clean_title is None:
             raise ValueError("하위 작업 제목이 유효하지 않습니다.")
         
         # 할일 목록 로드
-        todos = self.get_all_todos()
+        todos = self._get_all_todos_internal()
         
         # 해당 할일 찾기
-        target_todo = None
-        for todo in todos:
-            if todo.id == todo_id:
-                target_todo = todo
-                break
-        
-        if target_todo is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        target_todo = self._lookup(todo_id)
         
         # 해당 하위 작업 찾기
-        target_subtask = None
-        for subtask in target_todo.subtasks:
-            if subtask.id == subtask_id:
-                target_subtask = subtask
-                break
-        
-        if target_subtask is None:
-            raise ValueError("해당 하위 작업을 찾을 수 없습니다.")
+        target_subtask = self._lookup_subtask(target_todo, subtask_id)
         
         # 제목 업데이트
-        old_title = target_subtask.title
-        target_subtask.title = new_title.strip()
+        snapshot = _snapshot_fields(target_subtask)
+        target_subtask.title = clean_title
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
-            # 저장 실패 시 원래 제목으로 복원
-            target_subtask.title = old_title
+        # 저장 (자동 저장 기능 사용, 일괄 변경 중에는 캐시에만 반영)
+        if not self._save_todos(todos):
+            # 저장 실패 시 원래 값으로 복원
+            _restore_fields(target_subtask, snapshot)
             return False
         
-        # 캐시 무효화
-        self._todos_cache = None
-        
         return True
     
     def delete_subtask(self, todo_id: int, subtask_id: int) -> bool:
@@ -396,29 +727,19 @@ class TodoService:
             ValueError: 할일이나 하위작업을 찾을 수 없는 경우
         """
         # 할일 목록 로드
-        todos = self.get_all_todos()
+        todos = self._get_all_todos_internal()
         
         # 해당 할일 찾기
-        target_todo = None
-        for todo in todos:
-            if todo.id == todo_id:
-                target_todo = todo
-                break
-        
-        if target_todo is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        target_todo = self._lookup(todo_id)
         
         # 하위 작업 삭제
         if not target_todo.remove_subtask(subtask_id):
             raise ValueError("해당 하위 작업을 찾을 수 없습니다.")
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
+        # 저장 (자동 저장 기능 사용, 일괄 변경 중에는 캐시에만 반영)
+        if not self._save_todos(todos):
             return False
         
-        # 캐시 무효화
-        self._todos_cache = None
-        
         return True
     
     def toggle_subtask_completion(self, todo_id: int, subtask_id: int) -> bool:
@@ -438,40 +759,24 @@ class TodoService:
             ValueError: 할일이나 하위작업을 찾을 수 없는 경우
         """
         # 할일 목록 로드
-        todos = self.get_all_todos()
+        todos = self._get_all_todos_internal()
         
         # 해당 할일 찾기
-        target_todo = None
-        for todo in todos:
-            if todo.id == todo_id:
-                target_todo = todo
-                break
-        
-        if target_todo is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        target_todo = self._lookup(todo_id)
         
         # 해당 하위 작업 찾기
-        target_subtask = None
-        for subtask in target_todo.subtasks:
-            if subtask.id == subtask_id:
-                target_subtask = subtask
-                break
+        target_subtask = self._lookup_subtask(target_todo, subtask_id)
         
-        if target_subtask is None:
-            raise ValueError("해당 하위 작업을 찾을 수 없습니다.")
-        
-        # 완료 상태 토글
+        # 완료 상태 토글 (실패 시 되돌릴 수 있도록 이전 값을 보관)
+        snapshot = _snapshot_fields(target_subtask)
         target_subtask.toggle_completion()
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
-            # 저장 실패 시 상태 복원
-            target_subtask.toggle_completion()
+        # 저장 (자동 저장 기능 사용, 일괄 변경 중에는 캐시에만 반영)
+        if not self._save_todos(todos):
+            # 저장 실패 시 다시 토글하지 않고 이전 값(완료 시간 포함)을 그대로 복원
+            _restore_fields(target_subtask, snapshot)
             return False
         
-        # 캐시 무효화
-        self._todos_cache = None
-        
         return True
     
     def get_subtasks(self, todo_id: int) -> List[SubTask]:
@@ -490,16 +795,11 @@ class TodoService:
             ValueError: 할일을 찾을 수 없는 경우
         """
         # 해당 할일 찾기
-        target_todo = self.get_todo_by_id(todo_id)
-        
-        if target_todo is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        target_todo = self._lookup(todo_id)
         
-        # 하위 작업 목록을 생성 시간 순으로 정렬하여 반환
-        subtasks = target_todo.subtasks.copy()
-        subtasks.sort(key=lambda x: x.created_at)
-        
-        return subtasks
+        # 하위 작업 목록을 생성 시간 순으로 정렬한 새 목록으로 반환
+        # (하위 작업은 보통 추가 순서대로 정렬되어 있으므로 한 번의 선형 검사로 끝남)
+        return sorted(target_todo.subtasks, key=attrgetter('created_at'))
     
     # 필터링 및 검색 메서드들
     
@@ -514,35 +814,76 @@ class TodoService:
         Returns:
             List[Todo]: 필터링된 할일 목록
         """
-        todos = self.get_all_todos()
-        filtered_todos = []
+        search_term_lower = search_term.lower()
+        if not search_term or _SEARCH_SEPARATOR in search_term_lower:
+            # 검색어가 없거나 구분자를 포함하면 제목별로 직접 비교
+            return [
+                todo for todo in self._get_all_todos_internal()
+                if (show_completed or not todo.is_completed())
+                and (not search_term
+                     or search_term_lower in todo.title.lower()
+                     or any(search_term_lower in subtask.title.lower()
+                            for subtask in todo.subtasks))
+            ]
+        
+        # 완료 여부는 캐시하지 않고 매번 확인
+        matches = self._search_todos(search_term_lower)
+        if show_completed:
+            return list(matches)
+        return [todo for todo in matches if not todo.is_completed()]
+    
+    def _search_todos(self, search_term_lower: str) -> List[Todo]:
+        """
+        소문자 검색어가 제목이나 하위 작업 제목에 포함된 할일을 반환합니다.
         
-        for todo in todos:
-            # 완료된 할일 필터링
-            if not show_completed and todo.is_completed():
-                continue
-            
-            # 검색어 필터링
-            if search_term:
-                search_term_lower = search_term.lower()
-                
-                # 할일 제목에서 검색
-                title_match = search_term_lower in todo.title.lower()
-                
-                # 하위 작업에서 검색
-                subtask_match = any(
-                    search_term_lower in subtask.title.lower()
-                    for subtask in todo.subtasks
-                )
-                
-                if not (title_match or subtask_match):
-                    continue
+        최근 검색어의 결과를 기억해 두었다가, 검색 인덱스가 그대로이면 다시 검색하지 않습니다.
+        
+        Args:
+            search_term_lower: 소문자로 바꾼 검색어
             
-            filtered_todos.append(todo)
+        Returns:
+            List[Todo]: 생성 순서대로 정렬된 할일 목록 (수정하지 말 것)
+        """
+        search_index = self._get_search_index()
+        results = self._search_results
+        if self._search_results_index is not search_index:
+            results.clear()
+            self._search_results_index = search_index
+        
+        matches = results.get(search_term_lower)
+        if matches is not None:
+            results.move_to_end(search_term_lower)
+            return matches
+        
+        # 제목과 하위 작업 제목을 미리 소문자로 합쳐 둔 문자열에서 한 번에 검색
+        matches = [todo for todo, text in search_index if search_term_lower in text]
+        results[search_term_lower] = matches
+        if len(results) > _SEARCH_RESULT_CACHE_SIZE:
+            results.popitem(last=False)
+        return matches
+    
+    def _get_search_index(self) -> List[Tuple[Todo, str]]:
+        """
+        filter_todos 검색용 (할일, 소문자 검색 문자열) 목록을 반환합니다.
         
-        return filtered_todos
+        검색 문자열은 할일 제목과 하위 작업 제목을 구분자로 이어 소문자로 바꾼 것으로,
+        목록이 저장되거나 캐시가 바뀌면 다음 검색 때 다시 만들어집니다.
+        
+        Returns:
+            List[Tuple[Todo, str]]: 생성 순서대로 정렬된 (할일, 검색 문자열) 목록
+        """
+        todos = self._get_all_todos_internal()
+        if self._search_index is None or self._search_indexed_todos is not todos:
+            self._search_index = [
+                (todo, _SEARCH_SEPARATOR.join(
+                    [todo.title] + [subtask.title for subtask in todo.subtasks]).lower())
+                for todo in todos
+            ]
+            self._search_indexed_todos = todos
+        return self._search_index
     
-    def sort_todos(self, todos: List[Todo], sort_by: str = "created_at") -> List[Todo]:
+    @staticmethod
+    def sort_todos(todos: List[Todo], sort_by: str = "created_at") -> List[Todo]:
         """
         할일 목록을 정렬합니다.
         
@@ -553,12 +894,53 @@ class TodoService:
         Returns:
             List[Todo]: 정렬된 할일 목록
         """
+        return sorted(todos, key=TodoService._sort_key(sort_by) or attrgetter('created_at'))
+    
+    @staticmethod
+    def _sort_key(sort_by: str) -> Optional[Callable[[Todo], Any]]:
+        """
+        정렬 기준에 맞는 키 함수를 반환합니다.
+        
+        Args:
+            sort_by: 정렬 기준 ("created_at", "title", "progress")
+            
+        Returns:
+            Optional[Callable[[Todo], Any]]: 키 함수 (생성 시간 순이면 None)
+        """
         if sort_by == "title":
-            return sorted(todos, key=lambda x: x.title.lower())
+            return lambda x: x.title.lower()
         elif sort_by == "progress":
-            return sorted(todos, key=lambda x: x.get_completion_rate())
+            return methodcaller('get_completion_rate')
         else:  # "created_at" (기본값)
-            return sorted(todos, key=lambda x: x.created_at)
+            return None
+    
+    def list_todos(self, show_completed: bool = True, search_term: str = "",
+                   sort_by: str = "created_at", limit: Optional[int] = None) -> List[Todo]:
+        """
+        할일 목록을 필터링하고 정렬하여 반환합니다.
+        
+        filter_todos 결과는 이미 생성 시간 순이므로 created_at 정렬은 다시 하지 않고,
+        limit이 주어지면 전체를 정렬하는 대신 heapq로 앞쪽 항목만 고릅니다.
+        filter_todos 후 sort_todos를 호출한 것과 같은 결과를 반환합니다.
+        
+        Args:
+            show_completed: 완료된 할일 표시 여부
+            search_term: 검색어 (제목이나 하위작업에서 검색)
+            sort_by: 정렬 기준 ("created_at", "title", "progress")
+            limit: 반환할 최대 개수 (None이면 전체)
+            
+        Returns:
+            List[Todo]: 필터링 및 정렬된 할일 목록
+        """
+        todos = self.filter_todos(show_completed, search_term)
+        key = self._sort_key(sort_by)
+        
+        if key is None:
+            return todos if limit is None else todos[:limit]
+        if limit is not None:
+            return heapq.nsmallest(limit, todos, key=key)
+        todos.sort(key=key)
+        return todos
     
     def update_todo_expansion_state(self, todo_id: int, is_expanded: bool) -> bool:
         """
@@ -575,29 +957,38 @@ class TodoService:
             ValueError: 할일을 찾을 수 없는 경우
         """
         # 할일 목록 로드
-        todos = self.get_all_todos()
+        todos = self._get_all_todos_internal()
         
         # 해당 할일 찾기
-        target_todo = None
-        for todo in todos:
-            if todo.id == todo_id:
-                target_todo = todo
-                break
-        
-        if target_todo is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        target_todo = self._lookup(todo_id)
         
-        # 확장 상태 업데이트
+        # 확장 상태 업데이트 (GUI는 캐시된 할일을 먼저 바꾼 뒤 호출하므로
+        # 값이 같더라도 저장 예약은 항상 수행)
         target_todo.is_expanded = is_expanded
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
-            return False
+        # 확장 상태는 화면 표시용 정보이므로 즉시 파일에 쓰지 않고
+        # 자동 저장(또는 force_save/종료 시 저장)에 맡김
+        self._schedule_save(todos)
+        return True
+    
+    def _schedule_save(self, todos: List[Todo]) -> None:
+        """
+        변경된 할일 목록을 즉시 저장하지 않고 자동 저장 대상으로 표시합니다.
         
-        # 캐시 무효화
-        self._todos_cache = None
+        연속된 변경은 자동 저장 스레드에서 한 번의 저장으로 합쳐지며,
+        batch() 블록 안에서는 블록이 끝날 때 함께 저장됩니다.
+        
+        Args:
+            todos: 저장할 할일 목록
+        """
+        if self._batch_depth > 0:
+            self._save_todos(todos)
+            return
         
-        return True    
+        self._set_cache(todos)
+        self._dirty = True
+        self.storage_service.mark_data_changed(todos)
+    
 # 자동 저장 및 백업 관련 메서드들
     
     def enable_auto_save(self) -> None:
@@ -608,8 +999,7 @@ class TodoService:
     def disable_auto_save(self) -> None:
         """자동 저장 기능을 비활성화합니다."""
         self.storage_service.auto_save_enabled = False
-        if self.storage_service._auto_save_timer is not None:
-            self.storage_service._auto_save_timer.cancel()
+        self.storage_service._stop_auto_save()
     
     def force_save(self) -> bool:
         """
@@ -618,8 +1008,11 @@ class TodoService:
         Returns:
             저장 성공 여부
         """
-        todos = self.get_all_todos()
-        return self.storage_service.save_todos_with_auto_save(todos)
+        todos = self._get_all_todos_internal()
+        success = self.storage_service.save_todos_with_auto_save(todos)
+        if success:
+            self._dirty = False
+        return success
     
     def create_backup(self, backup_name: str = None) -> bool:
         """
@@ -652,10 +1045,14 @@ class TodoService:
         Returns:
             복구 성공 여부
         """
+        # 미뤄 둔 변경은 복구 전 백업에 포함되도록 먼저 저장
+        if self._dirty:
+            self.force_save()
+        
         success = self.storage_service.restore_from_backup_file(backup_path)
         if success:
-            # 캐시 무효화하여 새로운 데이터 로드
-            self.clear_cache()
+            # 교체된 파일을 다시 읽도록 캐시를 버림 (이전 변경은 저장하지 않음)
+            self._reset_cache()
         return success
     
     def get_data_status(self) -> Dict[str, Any]:
@@ -674,10 +1071,14 @@ class TodoService:
         Returns:
             복구 성공 여부
         """
+        # 미뤄 둔 변경도 복구 대상에 포함되도록 먼저 저장
+        if self._dirty:
+            self.force_save()
+        
         success = self.storage_service.repair_data_integrity()
         if success:
-            # 캐시 무효화하여 복구된 데이터 로드
-            self.clear_cache()
+            # 복구된 파일을 다시 읽도록 캐시를 버림 (이전 변경은 저장하지 않음)
+            self._reset_cache()
         return success
     
     # 목표 날짜 관련 비즈니스 로직 메서드들
@@ -699,38 +1100,27 @@ class TodoService:
             ValueError: 할일을 찾을 수 없거나 날짜가 유효하지 않은 경우
         """
         # 할일 목록 로드
-        todos = self.get_all_todos()
+        todos = self._get_all_todos_internal()
         
         # 해당 할일 찾기
-        target_todo = None
-        for todo in todos:
-            if todo.id == todo_id:
-                target_todo = todo
-                break
-        
-        if target_todo is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        target_todo = self._lookup(todo_id)
         
         # 목표 날짜 유효성 검사 (설정하는 경우에만)
         if due_date is not None:
-            from services.date_service import DateService
             is_valid, error_msg = DateService.validate_due_date(due_date)
             if not is_valid:
                 raise ValueError(error_msg)
         
         # 목표 날짜 설정
-        old_due_date = target_todo.due_date
+        snapshot = _snapshot_fields(target_todo)
         target_todo.set_due_date(due_date)
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
-            # 저장 실패 시 원래 날짜로 복원
-            target_todo.set_due_date(old_due_date)
+        # 저장 (자동 저장 기능 사용, 일괄 변경 중에는 캐시에만 반영)
+        if not self._save_todos(todos):
+            # 저장 실패 시 원래 값으로 복원
+            _restore_fields(target_todo, snapshot)
             return False
         
-        # 캐시 무효화
-        self._todos_cache = None
-        
         return True
     
     def set_subtask_due_date(self, todo_id: int, subtask_id: int, 
@@ -752,47 +1142,30 @@ class TodoService:
             ValueError: 할일이나 하위작업을 찾을 수 없거나 날짜가 유효하지 않은 경우
         """
         # 할일 목록 로드
-        todos = self.get_all_todos()
+        todos = self._get_all_todos_internal()
         
         # 해당 할일 찾기
-        target_todo = None
-        for todo in todos:
-            if todo.id == todo_id:
-                target_todo = todo
-                break
-        
-        if target_todo is None:
-            raise ValueError("해당 할일을 찾을 수 없습니다.")
+        target_todo = self._lookup(todo_id)
         
         # 해당 하위 작업 찾기
-        target_subtask = None
-        for subtask in target_todo.subtasks:
-            if subtask.id == subtask_id:
-                target_subtask = subtask
-                break
-        
-        if target_subtask is None:
-            raise ValueError("해당 하위 작업을 찾을 수 없습니다.")
+        target_subtask = self._lookup_subtask(target_todo, subtask_id)
         
-        # 목표 날짜 유효성 검사 (설정하는 경우에만)
+        # 목표 날짜 유효성 검사 (설정하는 경우에만, 이미 찾은 할일을 기준으로 검사)
         if due_date is not None:
-            is_valid, error_msg = self.validate_subtask_due_date(todo_id, due_date)
+            is_valid, error_msg = DateService.validate_due_date(due_date, target_todo.due_date)
             if not is_valid:
                 raise ValueError(error_msg)
         
         # 목표 날짜 설정
-        old_due_date = target_subtask.due_date
+        snapshot = _snapshot_fields(target_subtask)
         target_subtask.set_due_date(due_date)
         
-        # 저장 (자동 저장 기능 사용)
-        if not self.storage_service.save_todos_with_auto_save(todos):
-            # 저장 실패 시 원래 날짜로 복원
-            target_subtask.set_due_date(old_due_date)
+        # 저장 (자동 저장 기능 사용, 일괄 변경 중에는 캐시에만 반영)
+        if not self._save_todos(todos):
+            # 저장 실패 시 원래 값으로 복원
+            _restore_fields(target_subtask, snapshot)
             return False
         
-        # 캐시 무효화
-        self._todos_cache = None
-        
         return True
     
     def get_todos_by_due_date(self, start_date: Optional[datetime] = None,
@@ -809,25 +1182,59 @@ class TodoService:
         Returns:
             List[Todo]: 필터링된 할일 목록
         """
-        todos = self.get_all_todos()
-        filtered_todos = []
+        # 목표 날짜가 없는 할일은 인덱스에 없으므로 자동으로 제외됨
+        return self._todos_due_between(start_date, end_date)
+    
+    def _get_due_date_index(self) -> Tuple[List[datetime], List[Tuple[int, Todo]]]:
+        """
+        목표 날짜순으로 정렬된 인덱스를 반환합니다.
         
-        for todo in todos:
-            # 목표 날짜가 없는 할일은 제외
-            if todo.due_date is None:
-                continue
-            
-            # 시작 날짜 체크
-            if start_date is not None and todo.due_date < start_date:
-                continue
-            
-            # 종료 날짜 체크
-            if end_date is not None and todo.due_date > end_date:
-                continue
+        목표 날짜가 있는 할일만 포함하며, 목록이 저장되거나 캐시가 바뀌면
+        다음 조회 때 다시 만들어집니다.
+        
+        Returns:
+            Tuple[List[datetime], List[Tuple[int, Todo]]]: (정렬된 목표 날짜 목록,
+                같은 순서의 (캐시 내 위치, 할일) 목록)
+        """
+        todos = self._get_all_todos_internal()
+        if self._due_index is None or self._due_indexed_todos is not todos:
+            # 위치가 모두 다르므로 날짜가 같아도 Todo끼리 비교하지 않음
+            entries = sorted(
+                (todo.due_date, position, todo)
+                for position, todo in enumerate(todos)
+                if todo.due_date is not None
+            )
+            self._due_index = ([entry[0] for entry in entries],
+                               [(entry[1], entry[2]) for entry in entries])
+            self._due_indexed_todos = todos
+        return self._due_index
+    
+    def _todos_due_between(self, start: Optional[datetime], end: Optional[datetime],
+                           include_end: bool = True) -> List[Todo]:
+        """
+        목표 날짜가 주어진 범위에 있는 할일을 이진 탐색으로 찾습니다.
+        
+        Args:
+            start: 시작 날짜 (포함, None이면 제한 없음)
+            end: 종료 날짜 (None이면 제한 없음)
+            include_end: 종료 날짜와 같은 할일도 포함할지 여부
             
-            filtered_todos.append(todo)
+        Returns:
+            List[Todo]: 범위 안의 할일 목록 (생성 순서대로 정렬)
+        """
+        due_dates, entries = self._get_due_date_index()
+        lo = 0 if start is None else bisect_left(due_dates, start)
+        if end is None:
+            hi = len(due_dates)
+        elif include_end:
+            hi = bisect_right(due_dates, end)
+        else:
+            hi = bisect_left(due_dates, end)
         
-        return filtered_todos
+        # 캐시 내 위치순으로 되돌려 기존과 같은 생성 순서 유지
+        selected = entries[lo:hi]
+        selected.sort()
+        return [todo for _, todo in selected]
     
     def get_overdue_todos(self) -> List[Todo]:
         """
@@ -838,19 +1245,11 @@ class TodoService:
         Returns:
             List[Todo]: 목표 날짜가 지난 미완료 할일 목록
         """
-        todos = self.get_all_todos()
-        overdue_todos = []
-        
         now = datetime.now()
         
-        for todo in todos:
-            # 목표 날짜가 있고, 지났으며, 완료되지 않은 할일
-            if (todo.due_date is not None and 
-                todo.due_date < now and 
-                not todo.is_completed()):
-                overdue_todos.append(todo)
-        
-        return overdue_todos
+        # 목표 날짜가 지났으며 완료되지 않은 할일
+        return [todo for todo in self._todos_due_between(None, now, include_end=False)
+                if not todo.is_completed()]
     
     def get_urgent_todos(self, hours: int = 24) -> List[Todo]:
         """
@@ -864,20 +1263,12 @@ class TodoService:
         Returns:
             List[Todo]: 지정된 시간 내에 마감인 미완료 할일 목록
         """
-        todos = self.get_all_todos()
-        urgent_todos = []
-        
         now = datetime.now()
         urgent_threshold = now + timedelta(hours=hours)
         
-        for todo in todos:
-            # 목표 날짜가 있고, 긴급 기준 시간 내이며, 완료되지 않은 할일
-            if (todo.due_date is not None and 
-                now <= todo.due_date <= urgent_threshold and 
-                not todo.is_completed()):
-                urgent_todos.append(todo)
-        
-        return urgent_todos
+        # 긴급 기준 시간 내이며 완료되지 않은 할일
+        return [todo for todo in self._todos_due_between(now, urgent_threshold)
+                if not todo.is_completed()]
     
     def get_due_today_todos(self) -> List[Todo]:
         """
@@ -888,8 +1279,6 @@ class TodoService:
         Returns:
             List[Todo]: 오늘 마감인 미완료 할일 목록
         """
-        from services.date_service import DateService
-        
         date_ranges = DateService.get_date_filter_ranges()
         today_start, today_end = date_ranges["오늘"]
         
@@ -904,8 +1293,6 @@ class TodoService:
         Returns:
             List[Todo]: 이번 주 마감인 할일 목록
         """
-        from services.date_service import DateService
-        
         date_ranges = DateService.get_date_filter_ranges()
         week_start, week_end = date_ranges["이번 주"]
         
@@ -925,13 +1312,11 @@ class TodoService:
         Returns:
             List[Todo]: 목표 날짜순으로 정렬된 할일 목록
         """
-        def sort_key(todo: Todo):
-            # 목표 날짜가 없는 할일은 맨 뒤로
-            if todo.due_date is None:
-                return datetime.max if ascending else datetime.min
-            return todo.due_date
-        
-        return sorted(todos, key=sort_key, reverse=not ascending)
+        # 목표 날짜가 없는 할일은 원래 순서대로 맨 뒤로
+        dated = [todo for todo in todos if todo.due_date is not None]
+        undated = [todo for todo in todos if todo.due_date is None]
+        dated.sort(key=attrgetter('due_date'), reverse=not ascending)
+        return dated + undated
     
     def validate_subtask_due_date(self, todo_id: int, 
                                  subtask_due_date: datetime) -> Tuple[bool, str]:
@@ -954,7 +1339,6 @@ class TodoService:
             return False, "해당 할일을 찾을 수 없습니다."
         
         # DateService를 사용하여 유효성 검사
-        from services.date_service import DateService
         return DateService.validate_due_date(subtask_due_date, target_todo.due_date)
     
     def get_todos_with_overdue_subtasks(self) -> List[Todo]:
@@ -966,14 +1350,10 @@ class TodoService:
         Returns:
             List[Todo]: 지연된 하위 작업이 있는 할일 목록
         """
-        todos = self.get_all_todos()
-        todos_with_overdue_subtasks = []
-        
-        for todo in todos:
-            if todo.has_overdue_subtasks():
-                todos_with_overdue_subtasks.append(todo)
-        
-        return todos_with_overdue_subtasks
+        # 현재 시간은 한 번만 구하고, 하위 작업이 없는 할일은 바로 건너뜀
+        now = datetime.now()
+        return [todo for todo in self._get_all_todos_internal()
+                if todo.subtasks and todo.has_overdue_subtasks(now)]
     
     def _register_batch_callbacks(self) -> None:
         """배치 업데이트 콜백 등록"""
@@ -987,11 +1367,36 @@ class TodoService:
         
         # 목표 날짜 업데이트 배치 콜백
         batch_manager.register_update_callback('due_date_update', self._batch_update_due_dates)
+        
+        # 한 번의 플러시에서 반영된 모든 타입의 변경을 한 번에 저장
+        batch_manager.register_flush_callback('todo_service', self._save_batch_updates)
+    
+    def _mark_batch_updated(self) -> None:
+        """배치 업데이트 콜백이 변경한 내용을 플러시 끝에 저장하도록 표시합니다."""
+        # 할일을 제자리에서 바꾸므로 파생 인덱스는 다시 만들어야 함
+        self._search_index = None
+        self._due_index = None
+        self._batch_updates_pending = True
+        self._dirty = True
+    
+    def _save_batch_updates(self) -> bool:
+        """
+        배치 업데이트로 반영된 변경을 한 번에 저장합니다.
+        
+        BatchUpdateManager가 플러시마다 타입별 콜백을 모두 처리한 뒤 호출합니다.
+        
+        Returns:
+            bool: 저장할 내용이 없거나 저장에 성공하면 True
+        """
+        if not self._batch_updates_pending:
+            return True
+        self._batch_updates_pending = False
+        return self._save_todos(self._get_all_todos_internal())
     
     def _batch_update_todos(self, updates: List[Dict[str, Any]]) -> None:
         """할일 배치 업데이트 처리"""
         try:
-            todos = self.get_all_todos()
+            todos_by_id = self._get_todo_index()
             updated_todos = set()
             
             for update in updates:
@@ -999,72 +1404,82 @@ class TodoService:
                 data = update['data']
                 
                 # 해당 할일 찾기
-                for todo in todos:
-                    if todo.id == todo_id:
-                        # 데이터 업데이트
-                        if 'title' in data:
-                            todo.title = data['title']
-                        if 'due_date' in data:
-                            todo.set_due_date(data['due_date'])
-                        if 'completed_at' in data:
-                            todo.completed_at = data['completed_at']
-                        
-                        updated_todos.add(todo_id)
-                        break
+                todo = todos_by_id.get(todo_id)
+                if todo is None:
+                    continue
+                
+                # 데이터 업데이트
+                if 'title' in data:
+                    todo.title = data['title']
+                if 'due_date' in data:
+                    todo.set_due_date(data['due_date'])
+                if 'completed_at' in data:
+                    todo.completed_at = data['completed_at']
+                
+                updated_todos.add(todo_id)
             
-            # 배치로 저장
+            # 플러시가 끝날 때 한 번에 저장
             if updated_todos:
-                self.storage_service.save_todos_with_auto_save(todos)
-                self._todos_cache = None  # 캐시 무효화
+                self._mark_batch_updated()
+                logger.debug("배치 업데이트 완료: %d개 할일", len(updated_todos))
                 
-                print(f"배치 업데이트 완료: {len(updated_todos)}개 할일")
-                
-        except Exception as e:
-            print(f"할일 배치 업데이트 실패: {e}")
+        except Exception:
+            logger.exception("할일 배치 업데이트 실패")
+    
+    def _index_subtasks(self) -> Dict[int, SubTask]:
+        """
+        모든 하위 작업을 ID로 찾을 수 있는 딕셔너리를 만듭니다.
+        
+        하위 작업 목록은 제자리에서 바뀌므로 보관하지 않고, 배치 처리 한 번에 한 번씩 만듭니다.
+        
+        Returns:
+            Dict[int, SubTask]: 하위 작업 ID별 하위 작업
+        """
+        return {subtask.id: subtask
+                for todo in self._get_all_todos_internal()
+                for subtask in todo.subtasks}
     
     def _batch_update_subtasks(self, updates: List[Dict[str, Any]]) -> None:
         """하위작업 배치 업데이트 처리"""
         try:
-            todos = self.get_all_todos()
+            subtasks_by_id = self._index_subtasks()
             updated_count = 0
             
             for update in updates:
-                subtask_id = update['item_id']
                 data = update['data']
                 
                 # 해당 하위작업 찾기
-                for todo in todos:
-                    for subtask in todo.subtasks:
-                        if subtask.id == subtask_id:
-                            # 데이터 업데이트
-                            if 'title' in data:
-                                subtask.title = data['title']
-                            if 'is_completed' in data:
-                                subtask.is_completed = data['is_completed']
-                                if data['is_completed']:
-                                    subtask.completed_at = datetime.now()
-                                else:
-                                    subtask.completed_at = None
-                            if 'due_date' in data:
-                                subtask.set_due_date(data['due_date'])
-                            
-                            updated_count += 1
-                            break
+                subtask = subtasks_by_id.get(update['item_id'])
+                if subtask is None:
+                    continue
+                
+                # 데이터 업데이트
+                if 'title' in data:
+                    subtask.title = data['title']
+                if 'is_completed' in data:
+                    subtask.is_completed = data['is_completed']
+                    if data['is_completed']:
+                        subtask.completed_at = datetime.now()
+                    else:
+                        subtask.completed_at = None
+                if 'due_date' in data:
+                    subtask.set_due_date(data['due_date'])
+                
+                updated_count += 1
             
-            # 배치로 저장
+            # 플러시가 끝날 때 한 번에 저장
             if updated_count > 0:
-                self.storage_service.save_todos_with_auto_save(todos)
-                self._todos_cache = None  # 캐시 무효화
-                
-                print(f"배치 업데이트 완료: {updated_count}개 하위작업")
+                self._mark_batch_updated()
+                logger.debug("배치 업데이트 완료: %d개 하위작업", updated_count)
                 
-        except Exception as e:
-            print(f"하위작업 배치 업데이트 실패: {e}")
+        except Exception:
+            logger.exception("하위작업 배치 업데이트 실패")
     
     def _batch_update_due_dates(self, updates: List[Dict[str, Any]]) -> None:
         """목표 날짜 배치 업데이트 처리"""
         try:
-            todos = self.get_all_todos()
+            todos_by_id = self._get_todo_index()
+            subtasks_by_id: Optional[Dict[int, SubTask]] = None
             updated_count = 0
             
             for update in updates:
@@ -1074,45 +1489,42 @@ class TodoService:
                 
                 if item_type == 'todo':
                     # 할일 목표 날짜 업데이트
-                    for todo in todos:
-                        if todo.id == item_id:
-                            todo.set_due_date(data.get('due_date'))
-                            updated_count += 1
-                            break
+                    todo = todos_by_id.get(item_id)
+                    if todo is not None:
+                        todo.set_due_date(data.get('due_date'))
+                        updated_count += 1
                 elif item_type == 'subtask':
-                    # 하위작업 목표 날짜 업데이트
-                    for todo in todos:
-                        for subtask in todo.subtasks:
-                            if subtask.id == item_id:
-                                subtask.set_due_date(data.get('due_date'))
-                                updated_count += 1
-                                break
+                    # 하위작업 목표 날짜 업데이트 (하위작업 인덱스는 필요할 때 한 번만 생성)
+                    if subtasks_by_id is None:
+                        subtasks_by_id = self._index_subtasks()
+                    subtask = subtasks_by_id.get(item_id)
+                    if subtask is not None:
+                        subtask.set_due_date(data.get('due_date'))
+                        updated_count += 1
             
-            # 배치로 저장
+            # 플러시가 끝날 때 한 번에 저장
             if updated_count > 0:
-                self.storage_service.save_todos_with_auto_save(todos)
-                self._todos_cache = None  # 캐시 무효화
+                self._mark_batch_updated()
+                logger.debug("목표 날짜 배치 업데이트 완료: %d개 항목", updated_count)
                 
-                print(f"목표 날짜 배치 업데이트 완료: {updated_count}개 항목")
-                
-        except Exception as e:
-            print(f"목표 날짜 배치 업데이트 실패: {e}")
+        except Exception:
+            logger.exception("목표 날짜 배치 업데이트 실패")
     
     def queue_todo_update(self, todo_id: int, data: Dict[str, Any]) -> None:
-        """할일 업데이트를 배치 큐에 추가"""
-        self.performance_optimizer.batch_manager.queue_update('todo_update', todo_id, data)
+        """할일 업데이트를 배치 큐에 추가 (같은 할일의 대기 중인 업데이트와 합침)"""
+        self.performance_optimizer.batch_manager.queue_coalesced_update('todo_update', todo_id, data)
     
     def queue_subtask_update(self, subtask_id: int, data: Dict[str, Any]) -> None:
-        """하위작업 업데이트를 배치 큐에 추가"""
-        self.performance_optimizer.batch_manager.queue_update('subtask_update', subtask_id, data)
+        """하위작업 업데이트를 배치 큐에 추가 (같은 하위작업의 대기 중인 업데이트와 합침)"""
+        self.performance_optimizer.batch_manager.queue_coalesced_update('subtask_update', subtask_id, data)
     
     def queue_due_date_update(self, item_id: int, due_date: Optional[datetime], item_type: str = 'todo') -> None:
-        """목표 날짜 업데이트를 배치 큐에 추가"""
+        """목표 날짜 업데이트를 배치 큐에 추가 (같은 항목의 대기 중인 업데이트와 합침)"""
         data = {
             'due_date': due_date,
             'type': item_type
         }
-        self.performance_optimizer.batch_manager.queue_update('due_date_update', item_id, data)
+        self.performance_optimizer.batch_manager.queue_coalesced_update('due_date_update', item_id, data)
     
     def get_filtered_and_sorted_todos(self, 
                                      filter_type: str = "all",
@@ -1131,25 +1543,34 @@ class TodoService:
         Returns:
             List[Todo]: 필터링 및 정렬된 할일 목록
         """
-        # 필터링
+        # 필터링 (지연/긴급 필터는 이미 미완료 할일만 반환)
+        excludes_completed = False
         if filter_type == "due_today":
             todos = self.get_due_today_todos()
         elif filter_type == "overdue":
             todos = self.get_overdue_todos()
+            excludes_completed = True
         elif filter_type == "urgent":
             todos = self.get_urgent_todos()
+            excludes_completed = True
         elif filter_type == "this_week":
             todos = self.get_due_this_week_todos()
         else:  # "all"
-            todos = self.get_all_todos()
+            todos = self._get_all_todos_internal()
         
         # 완료된 할일 필터링
-        if not show_completed:
-            todos = [todo for todo in todos if not todo.is_completed()]
-        
-        # 정렬
-        if sort_by == "due_date":
+        if not show_completed and not excludes_completed:
+            todos = list(filterfalse(methodcaller('is_completed'), todos))
+        
+        # 정렬 (모든 필터 결과는 이미 생성 시간 순이므로 created_at 정렬은 다시 하지 않음)
+        if len(todos) < 2:
+            # 정렬할 필요 없음 (캐시 목록을 그대로 내보내지 않도록 새 목록으로 반환)
+            todos = list(todos)
+        elif sort_by == "due_date":
             todos = self.sort_todos_by_due_date(todos)
+        elif self._sort_key(sort_by) is None:
+            # 캐시 목록을 그대로 내보내지 않도록 새 목록으로 반환
+            todos = list(todos)
         else:
             todos = self.sort_todos(todos, sort_by)
         
@@ -1160,8 +1581,9 @@ class TodoService:
         # 배치 업데이트 강제 플러시
         self.performance_optimizer.batch_manager.force_flush()
         
-        # 마지막 저장 수행
-        self.force_save()
+        # 저장되지 않은 변경이 있을 때만 마지막 저장 수행
+        if self._dirty:
+            self.force_save()
         
         # 스토리지 서비스 종료
         self.storage_service.shutdown()
@@ -1169,4 +1591,4 @@ class TodoService:
         # 성능 최적화기 종료
         self.performance_optimizer.shutdown()
         
-        print("TodoService가 정상적으로 종료되었습니다.")
\ No newline at end of file
+        logger.info("TodoService가 정상적으로 종료되었습니다.")
\ No newline at end of file
@@ -180,14 +180,13 @@ class TestFileSystemErrorHandling(TestComprehensiveIntegration):
         os.chmod(todo.folder_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
         
         # 폴더 삭제 시도 (실패해야 함)
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs('services.todo_service', level='WARNING') as logs:
             success = self.todo_service.delete_todo(todo.id, delete_folder=True)
             # 할일은 삭제되지만 폴더 삭제는 실패
             self.assertTrue(success)  # 할일 자체는 삭제됨
-            
-            # 출력된 메시지 확인
-            printed_messages = [call.args[0] for call in mock_print.call_args_list]
-            self.assertTrue(any("경고: 폴더 삭제에 실패했습니다" in msg for msg in printed_messages))
+        
+        # 기록된 경고 메시지 확인
+        self.assertTrue(any("폴더 삭제에 실패했습니다" in msg for msg in logs.output))
         
         # 권한 복원
         os.chmod(todo.folder_path, stat.S_IRWXU)
@@ -415,6 +414,8 @@ class TestExceptionHandlingEnhancement(TestComprehensiveIntegration):
         # (실제로는 파일 잠금이나 다른 메커니즘이 필요하지만, 여기서는 간단히 시뮬레이션)
         with patch.object(self.storage_service, 'load_todos') as mock_load:
             mock_load.return_value = []  # 빈 목록 반환 (다른 프로세스가 파일을 초기화한 상황)
+            # 저장 후에도 캐시가 유지되므로 외부 변경을 반영하려면 캐시를 비움
+            self.todo_service.clear_cache()
             
             # 할일 수정 시도 - ValueError 예외 발생 예상
             with self.assertRaises(ValueError) as context:
@@ -214,6 +214,23 @@ class TestTodoServiceSubtasks(unittest.TestCase):
         updated_subtask2 = updated_todo2.subtasks[0]
         self.assertEqual(updated_subtask2.is_completed, initial_completion)
     
+    def test_toggle_subtask_completion_save_failure_restores_state(self):
+        """저장 실패 시 완료 상태와 완료 시간이 그대로 복원되는지 테스트"""
+        # Given
+        subtask = self.todo_service.add_subtask(self.test_todo.id, "완료된 하위 작업")
+        self.todo_service.toggle_subtask_completion(self.test_todo.id, subtask.id)
+        target = self.todo_service.get_todo_by_id(self.test_todo.id).subtasks[0]
+        completed_at = target.completed_at
+        
+        # When
+        with patch.object(self.storage_service, 'save_todos_with_auto_save', return_value=False):
+            result = self.todo_service.toggle_subtask_completion(self.test_todo.id, subtask.id)
+        
+        # Then
+        self.assertFalse(result)
+        self.assertTrue(target.is_completed)
+        self.assertEqual(target.completed_at, completed_at)
+    
     def test_toggle_subtask_completion_nonexistent_todo(self):
         """존재하지 않는 할일의 하위 작업 토글 시 오류 테스트"""
         # Given
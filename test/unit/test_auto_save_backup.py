@@ -14,6 +14,7 @@ import os
 import json
 import time
 import tempfile
+import threading
 import shutil
 from datetime import datetime
 from unittest.mock import patch, MagicMock
@@ -61,9 +62,8 @@ class TestAutoSaveBackupSystem(unittest.TestCase):
     
     def tearDown(self):
         """테스트 환경 정리"""
-        # 자동 저장 타이머 정리
-        if hasattr(self.storage_service, '_auto_save_timer') and self.storage_service._auto_save_timer:
-            self.storage_service._auto_save_timer.cancel()
+        # 자동 저장 스레드 정리
+        self.storage_service._stop_auto_save()
         
         # 임시 디렉토리 삭제
         if os.path.exists(self.test_dir):
@@ -172,6 +172,24 @@ class TestAutoSaveBackupSystem(unittest.TestCase):
         self.assertEqual(len(loaded_todos), 2)
         self.assertEqual(loaded_todos[0].title, "테스트 할일 1")
     
+    def test_recovery_file_reuses_save_payload(self):
+        """저장용 직렬화 결과로 만든 복구 파일로 복구되는지 테스트"""
+        self.assertTrue(self.storage_service.save_todos(
+            self.test_todos, before_write=self.storage_service._create_recovery_file))
+
+        recovery_file = f"{self.data_file}.recovery"
+        with open(recovery_file, 'r', encoding='utf-8') as f:
+            recovery_data = json.load(f)
+        self.assertEqual(len(recovery_data["todos"]), 2)
+        self.assertEqual(recovery_data["next_id"], 3)
+        self.assertEqual(recovery_data["original_file"], self.data_file)
+
+        # 메인 파일 삭제 후 복구 파일로 재생성
+        os.remove(self.data_file)
+        new_storage = StorageService(self.data_file, auto_save_enabled=False)
+        self.assertEqual(len(new_storage.load_todos()), 2)
+        self.assertFalse(os.path.exists(recovery_file))
+
     def test_save_retry_logic(self):
         """저장 재시도 로직 테스트"""
         # save_todos 메서드를 모킹하여 실패 시뮬레이션
@@ -211,6 +229,7 @@ class TestAutoSaveBackupSystem(unittest.TestCase):
         # 무결성 문제 확인
         issues = self.storage_service._check_data_integrity_issues(corrupted_todos)
         self.assertGreater(len(issues), 0)
+        self.assertIn("중복된 할일 ID가 발견되었습니다: 1", issues)
         
         # 무결성 복구 테스트
         repaired_todos = self.storage_service._validate_and_repair_data(corrupted_todos)
@@ -218,6 +237,31 @@ class TestAutoSaveBackupSystem(unittest.TestCase):
         # 복구 후 문제 확인
         issues_after_repair = self.storage_service._check_data_integrity_issues(repaired_todos)
         self.assertEqual(len(issues_after_repair), 0)
+
+    def test_duplicate_id_repair_assigns_unused_ids(self):
+        """중복 ID 복구 시 기존 ID와 겹치지 않는 새 ID 부여 테스트"""
+        todos = [
+            Todo(id=1, title="A", created_at=datetime.now(), folder_path="a",
+                 subtasks=[SubTask(id=1, todo_id=1, title="a1"), SubTask(id=1, todo_id=1, title="a2")]),
+            Todo(id=1, title="B", created_at=datetime.now(), folder_path="b",
+                 subtasks=[SubTask(id=2, todo_id=1, title="b1")]),
+            Todo(id=2, title="C", created_at=datetime.now(), folder_path="c"),
+        ]
+
+        repaired_todos = self.storage_service._validate_and_repair_data(todos)
+
+        self.assertEqual([todo.id for todo in repaired_todos], [1, 3, 2])
+        subtask_ids = [subtask.id for todo in repaired_todos for subtask in todo.subtasks]
+        self.assertEqual(subtask_ids, [1, 3, 2])
+
+    def test_repair_keeps_subtask_list_when_nothing_changes(self):
+        """복구할 것이 없으면 하위 작업 목록을 새 목록으로 바꾸지 않는지 테스트"""
+        subtasks = self.test_todos[0].subtasks
+        
+        self.storage_service._validate_and_repair_data(self.test_todos)
+        
+        # 다른 스레드가 같은 목록에 추가한 하위 작업이 사라지지 않도록 같은 목록 유지
+        self.assertIs(self.test_todos[0].subtasks, subtasks)
     
     def test_data_integrity_status(self):
         """데이터 무결성 상태 확인 테스트"""
@@ -259,6 +303,39 @@ class TestAutoSaveBackupSystem(unittest.TestCase):
         # 백업 복구가 성공했는지 확인 (제목은 백업 시점에 따라 다를 수 있음)
         self.assertIsNotNone(loaded_todos[0].title)
     
+    def test_backup_restore_skips_identical_content(self):
+        """현재 파일과 같은 백업에서 복구하면 사전 백업을 만들지 않는지 테스트"""
+        self.storage_service.save_todos(self.test_todos)
+        self.test_todos[0].title = "변경된 할일"
+        self.storage_service.save_todos(self.test_todos)
+        
+        # 현재 데이터와 같은 내용의 복사본
+        same_file = os.path.join(self.test_dir, "same_backup.json")
+        shutil.copyfile(self.data_file, same_file)
+        
+        with patch.object(self.storage_service, '_create_backup') as create_backup:
+            self.assertTrue(self.storage_service.restore_from_backup_file(same_file))
+        create_backup.assert_not_called()
+        self.assertEqual(self.storage_service.load_todos()[0].title, "변경된 할일")
+    
+    def test_backup_restore_sniffs_large_files(self):
+        """큰 백업 파일은 전체 파싱 없이 복원하고 잘린 파일은 거부하는지 테스트"""
+        data = {"todos": [todo.to_dict() for todo in self.test_todos],
+                "next_id": 3, "padding": "x" * 20000}
+        backup_file = os.path.join(self.test_dir, "large_backup.json")
+        with open(backup_file, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        
+        with patch('services.storage_service._loads',
+                   side_effect=AssertionError("전체 파싱 호출")):
+            self.assertTrue(self.storage_service.restore_from_backup_file(backup_file))
+        self.assertEqual(len(self.storage_service.load_todos()), 2)
+        
+        # 끝이 잘린 파일은 전체 파싱으로 확인되어 거부됨
+        with open(backup_file, 'rb+') as file:
+            file.truncate(os.path.getsize(backup_file) - 10)
+        self.assertFalse(self.storage_service.restore_from_backup_file(backup_file))
+    
     def test_todo_service_integration(self):
         """TodoService와의 통합 테스트"""
         # 자동 저장 활성화
@@ -302,8 +379,70 @@ class TestAutoSaveBackupSystem(unittest.TestCase):
         # 종료 테스트
         self.storage_service.shutdown()
         
-        # 타이머가 정리되었는지 확인
-        self.assertIsNone(self.storage_service._auto_save_timer)
+        # 자동 저장 스레드가 정리되었는지 확인
+        self.assertIsNone(self.storage_service._auto_save_thread)
+    
+    def test_shutdown_does_not_reload_without_in_memory_data(self):
+        """메모리 데이터 없이 변경 표시만 있으면 종료 시 파일을 다시 읽지 않는지 테스트"""
+        self.storage_service.save_todos(self.test_todos)
+        self.storage_service._pending_save = True
+        
+        with patch.object(self.storage_service, 'load_todos',
+                          side_effect=AssertionError("종료 중 load_todos 호출")):
+            self.storage_service.shutdown()
+        
+        self.assertFalse(self.storage_service._pending_save)
+    
+    def test_mark_data_changed_saves_in_memory_todos(self):
+        """변경 표시 시 디스크를 다시 읽지 않고 메모리 데이터를 저장하는지 테스트"""
+        self.storage_service.auto_save_enabled = True
+        self.storage_service._start_auto_save()
+        
+        saved = threading.Event()
+        self.storage_service.add_change_callback(saved.set)
+        
+        with patch.object(self.storage_service, 'load_todos',
+                          side_effect=AssertionError("자동 저장 중 load_todos 호출")):
+            self.storage_service.mark_data_changed(self.test_todos)
+            self.assertTrue(saved.wait(timeout=5))
+        
+        self.assertFalse(self.storage_service._pending_save)
+        self.assertEqual(len(self.storage_service.load_todos()), 2)
+    
+    def test_restore_discards_stale_auto_save_snapshot(self):
+        """복구 전에 만든 자동 저장 스냅샷이 복구된 파일을 덮어쓰지 않는지 테스트"""
+        self.storage_service.save_todos(self.test_todos[:1])
+        backup_path = f"{self.data_file}.only_first"
+        shutil.copy(self.data_file, backup_path)
+        self.storage_service.save_todos(self.test_todos)
+        
+        # 자동 저장 스레드가 복구 직전에 꺼내 둔 스냅샷
+        stale_snapshot = (self.storage_service._data_generation, list(self.test_todos))
+        self.storage_service.mark_data_changed(self.test_todos)
+        
+        self.assertTrue(self.storage_service.restore_from_backup_file(backup_path))
+        self.assertFalse(self.storage_service._pending_save)
+        
+        self.storage_service._auto_save_check(stale_snapshot)
+        self.storage_service.shutdown()
+        self.assertEqual([todo.id for todo in self.storage_service.load_todos()], [1])
+    
+    def test_mark_data_changed_hands_writer_a_copy(self):
+        """자동 저장 스레드에 넘기는 스냅샷이 호출자의 객체와 분리되어 있는지 테스트"""
+        self.storage_service.mark_data_changed(self.test_todos)
+        snapshot = self.storage_service._current_todos
+        
+        # 스냅샷을 만든 뒤 호출자가 바꾼 내용은 스냅샷에 반영되지 않음
+        self.test_todos[0].title = "나중에 바뀐 제목"
+        self.test_todos[0].subtasks.append(SubTask(id=3, todo_id=1, title="나중에 추가"))
+        
+        self.assertIsNot(snapshot[0], self.test_todos[0])
+        self.assertEqual(snapshot[0].title, "테스트 할일 1")
+        self.assertEqual([subtask.id for subtask in snapshot[0].subtasks], [1, 2])
+        
+        # 스냅샷을 복구해도 호출자의 객체는 바뀌지 않음
+        self.storage_service._validate_and_repair_data(snapshot)
+        self.assertEqual(len(self.test_todos[0].subtasks), 3)
     
     def test_change_callback_system(self):
         """변경 콜백 시스템 테스트"""
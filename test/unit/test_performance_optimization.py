@@ -132,7 +132,41 @@ class TestBatchUpdateManager(unittest.TestCase):
         
         # 즉시 처리됨
         self.assertEqual(len(self.processed_updates), 1)
+    
+    def test_flush_callback_runs_once_after_all_types(self):
+        """플러시 콜백이 모든 타입 처리 후 한 번만 호출되는지 테스트"""
+        events = []
+        self.batch_manager.register_update_callback('other', lambda updates: events.append('other'))
+        self.batch_manager.register_flush_callback('save', lambda: events.append('flush'))
+        
+        self.batch_manager.queue_update('test', 1, {'data': 'item_1'})
+        self.batch_manager.queue_update('other', 2, {'data': 'item_2'})
+        self.batch_manager.force_flush()
+        
+        self.assertEqual(len(self.processed_updates), 1)
+        self.assertEqual(events, ['other', 'flush'])
 
+    
+    def test_coalesced_updates_merge_by_item(self):
+        """같은 항목의 대기 중인 업데이트가 하나로 합쳐지는지 테스트"""
+        first = {'title': '첫 제목', 'type': 'todo'}
+        self.batch_manager.queue_coalesced_update('test', 1, first)
+        self.batch_manager.queue_coalesced_update('test', 1, {'title': '새 제목', 'done': True, 'type': 'todo'})
+        # 세부 타입이 다르면 합치지 않음
+        self.batch_manager.queue_coalesced_update('test', 1, {'title': '하위', 'type': 'subtask'})
+        self.batch_manager.force_flush()
+        
+        self.assertEqual([update['data'] for update in self.processed_updates], [
+            {'title': '새 제목', 'done': True, 'type': 'todo'},
+            {'title': '하위', 'type': 'subtask'},
+        ])
+        # 호출자의 딕셔너리는 바뀌지 않음
+        self.assertEqual(first, {'title': '첫 제목', 'type': 'todo'})
+        
+        # 플러시 후에는 새 항목으로 추가
+        self.batch_manager.queue_coalesced_update('test', 1, {'title': '다시', 'type': 'todo'})
+        self.batch_manager.force_flush()
+        self.assertEqual(len(self.processed_updates), 3)
 
 class TestRealTimeUpdateOptimizer(unittest.TestCase):
     """실시간 업데이트 최적화기 테스트"""
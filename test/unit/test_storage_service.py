@@ -9,8 +9,10 @@ from datetime import datetime
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import services.storage_service as storage_module
 from services.storage_service import StorageService
 from models.todo import Todo
+from models.subtask import SubTask
 
 
 class TestStorageService(unittest.TestCase):
@@ -228,6 +230,16 @@ class TestStorageService(unittest.TestCase):
         next_id = self.storage_service.get_next_id()
         
         self.assertEqual(next_id, 1) 
+    
+    def test_get_next_id_uses_cache_after_save(self):
+        """저장 후에는 파일을 다시 읽지 않고 캐시된 다음 ID를 반환하는지 테스트"""
+        from unittest.mock import patch
+        
+        self.storage_service.save_todos(self.sample_todos)
+        
+        with patch('builtins.open', side_effect=AssertionError("파일을 다시 읽으면 안 됩니다")):
+            self.assertEqual(self.storage_service.get_next_id(), 3)
+            self.assertEqual(self.storage_service.get_next_subtask_id(), 1)
    
     def test_backup_creation(self):
         """백업 파일 생성 테스트"""
@@ -248,7 +260,95 @@ class TestStorageService(unittest.TestCase):
         
         # 백업 파일 존재 확인
         self.assertTrue(os.path.exists(backup_path))
-    
+
+    def test_backup_keeps_previous_content_after_save(self):
+        """하드링크 백업이 다음 저장 후에도 이전 내용을 유지하는지 테스트"""
+        self.storage_service.save_todos(self.sample_todos)
+        self.storage_service.save_todos(self.sample_todos[:1])
+
+        backup_path = f"{self.test_file_path}.backup"
+        with open(backup_path, 'r', encoding='utf-8') as file:
+            backup_data = json.load(file)
+        self.assertEqual(len(backup_data["todos"]), 2)
+
+        # 메인 파일 제자리 쓰기(빈 파일 생성)가 백업을 변경하지 않아야 함
+        self.storage_service._create_backup()
+        self.storage_service.create_empty_file()
+        with open(backup_path, 'r', encoding='utf-8') as file:
+            backup_data = json.load(file)
+        self.assertEqual(len(backup_data["todos"]), 1)
+
+    def test_save_compact_by_default_and_pretty_on_request(self):
+        """기본 저장은 압축 형식, pretty=True이면 들여쓰기 형식인지 테스트"""
+        self.storage_service.save_todos(self.sample_todos)
+        with open(self.test_file_path, 'rb') as file:
+            compact = file.read()
+        self.assertNotIn(b'\n', compact)
+        
+        self.sample_todos[0].title = "변경된 할일"
+        self.storage_service.save_todos(self.sample_todos, pretty=True)
+        with open(self.test_file_path, 'rb') as file:
+            pretty = file.read()
+        self.assertTrue(pretty.startswith(b'{\n  "todos"'))
+        self.assertEqual(json.loads(pretty)['todos'][0]['title'], "변경된 할일")
+        self.assertIn('last_saved', json.loads(compact))
+
+    def test_save_skips_write_when_content_unchanged(self):
+        """내용이 같으면 다시 쓰거나 백업을 순환하지 않는지 테스트"""
+        self.storage_service.save_todos(self.sample_todos)
+        self.storage_service.save_todos(self.sample_todos)
+        backup_path = f"{self.test_file_path}.backup"
+        self.assertFalse(os.path.exists(backup_path))
+        
+        # 파일이 외부에서 바뀌었으면 같은 내용이라도 다시 저장
+        with open(self.test_file_path, 'w', encoding='utf-8') as file:
+            file.write('{"todos": []}')
+        self.assertTrue(self.storage_service.save_todos(self.sample_todos))
+        with open(self.test_file_path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        self.assertEqual(len(data['todos']), 2)
+        self.assertIn('last_saved', data)
+        self.assertTrue(os.path.exists(backup_path))
+
+    def test_restore_prefers_most_recent_backup(self):
+        """가장 최근에 수정된 순환 백업에서 복구하는지 테스트"""
+        older = {"todos": [self.sample_todos[0].to_dict()], "next_id": 2}
+        newer = {"todos": [todo.to_dict() for todo in self.sample_todos], "next_id": 3}
+        older_path = f"{self.test_file_path}.backup"
+        newer_path = f"{self.test_file_path}.backup.2"
+        for path, data in ((older_path, older), (newer_path, newer)):
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(data, file)
+        os.utime(older_path, (1000, 1000))
+        os.utime(newer_path, (2000, 2000))
+
+        with open(self.test_file_path, 'w', encoding='utf-8') as file:
+            file.write('invalid json')
+
+        todos = self.storage_service.load_todos()
+        self.assertEqual(len(todos), 2)
+
+    def test_integrity_status_memoized_until_file_changes(self):
+        """파일과 디렉토리가 그대로면 무결성 상태를 다시 계산하지 않는지 테스트"""
+        from unittest.mock import patch
+        
+        self.storage_service.save_todos(self.sample_todos)
+        os.utime(self.test_file_path, (1000, 1000))
+        os.utime(self.test_dir, (1000, 1000))
+        
+        first = self.storage_service.get_data_integrity_status()
+        self.assertEqual(first["todo_count"], 2)
+        
+        with patch.object(self.storage_service, 'load_todos',
+                          side_effect=AssertionError("load_todos 재호출")):
+            self.assertEqual(self.storage_service.get_data_integrity_status(), first)
+            self.assertEqual(self.storage_service.list_backups(), [])
+        
+        # 저장하면 파일 mtime이 바뀌므로 다시 계산
+        self.storage_service.save_todos(self.sample_todos[:1])
+        self.assertEqual(self.storage_service.get_data_integrity_status()["todo_count"], 1)
+        self.assertEqual(len(self.storage_service.list_backups()), 1)
+
     def test_backup_restoration(self):
         """백업에서 복구 테스트"""
         # 정상 데이터 저장 (백업 생성됨)
@@ -288,7 +388,73 @@ class TestStorageService(unittest.TestCase):
         self.assertTrue(result)
         self.assertTrue(os.path.exists(deep_path))
         self.assertTrue(os.path.exists(os.path.dirname(deep_path)))
+    
+    def test_save_and_load_without_orjson(self):
+        """orjson이 없을 때 표준 json으로 저장/로드되는지 테스트"""
+        original = storage_module.HAS_ORJSON
+        storage_module.HAS_ORJSON = False
+        try:
+            self.assertTrue(self.storage_service.save_todos(self.sample_todos))
+            todos = self.storage_service.load_todos()
+        finally:
+            storage_module.HAS_ORJSON = original
+        
+        self.assertEqual([todo.title for todo in todos], ["테스트 할일 1", "테스트 할일 2"])
+        
+        # 어느 쪽으로 저장하든 표준 json으로 읽을 수 있어야 함
+        with open(self.test_file_path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        self.assertEqual(data['next_id'], 3)
+    
+    def test_dumps_rejects_unknown_types(self):
+        """JSON이 아닌 타입을 문자열로 바꾸지 않고 오류로 처리하는지 테스트"""
+        original = storage_module.HAS_ORJSON
+        try:
+            for has_orjson in {original, False}:
+                storage_module.HAS_ORJSON = has_orjson
+                with self.assertRaises(TypeError):
+                    storage_module._dumps({'value': object()})
+        finally:
+            storage_module.HAS_ORJSON = original
+    
+    @unittest.skipUnless(storage_module.HAS_IJSON, "ijson이 설치되지 않음")
+    def test_stream_load_large_file(self):
+        """큰 파일을 ijson 스트리밍으로 로드하는 경로 테스트"""
+        from unittest.mock import patch
+        
+        self.sample_todos[0].subtasks.append(
+            SubTask(id=7, todo_id=1, title="하위 작업", due_date=datetime(2025, 1, 9, 18, 0))
+        )
+        self.storage_service.save_todos(self.sample_todos)
+        reloaded_service = StorageService(self.test_file_path, auto_save_enabled=False)
+        
+        with patch.object(storage_module, '_STREAM_LOAD_THRESHOLD', 0), \
+                patch.object(reloaded_service, '_stream_load_todos',
+                             wraps=reloaded_service._stream_load_todos) as stream_load:
+            todos = reloaded_service.load_todos()
+        
+        stream_load.assert_called_once()
+        self.assertEqual([todo.title for todo in todos], ["테스트 할일 1", "테스트 할일 2"])
+        self.assertEqual(todos[0].subtasks[0].due_date, datetime(2025, 1, 9, 18, 0))
+        self.assertEqual(reloaded_service.get_next_id(), 3)
+        self.assertEqual(reloaded_service.get_next_subtask_id(), 8)
+        self.assertIsInstance(reloaded_service._settings, dict)
+
 
+    @unittest.skipUnless(storage_module.HAS_IJSON, "ijson이 설치되지 않음")
+    def test_stream_import_large_file(self):
+        """큰 내보내기 파일을 ijson 스트리밍으로 가져오는 경로 테스트"""
+        from unittest.mock import patch
+        
+        export_path = os.path.join(self.test_dir, 'export.json')
+        self.assertTrue(self.storage_service.export_data_with_due_dates(export_path, self.sample_todos))
+        
+        with patch.object(storage_module, '_STREAM_LOAD_THRESHOLD', 0), \
+                patch.object(storage_module, '_loads',
+                             side_effect=AssertionError("전체 파싱 호출")):
+            todos = self.storage_service.import_data_with_due_dates(export_path)
+        
+        self.assertEqual([todo.title for todo in todos], ["테스트 할일 1", "테스트 할일 2"])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -151,7 +151,20 @@ class TestStorageServiceDueDate(unittest.TestCase):
         self.assertIn('completed_at', subtask_data)
         self.assertIsNone(subtask_data['due_date'])
         self.assertIsNone(subtask_data['completed_at'])
-    
+
+    def test_current_version_data_is_not_migrated(self):
+        """현재 버전 데이터는 마이그레이션(파일 재작성)하지 않는지 테스트"""
+        self.storage_service.save_todos([self.sample_todo_with_due_date])
+        with open(self.test_file_path, 'rb') as f:
+            original_bytes = f.read()
+
+        todos = self.storage_service.load_todos()
+
+        self.assertEqual(len(todos), 1)
+        with open(self.test_file_path, 'rb') as f:
+            self.assertEqual(f.read(), original_bytes)
+        self.assertFalse(os.path.exists(f"{self.test_file_path}.migration_backup"))
+
     def test_validate_due_date_fields(self):
         """목표 날짜 필드 유효성 검사 테스트"""
         # 정상적인 데이터
@@ -206,7 +219,49 @@ class TestStorageServiceDueDate(unittest.TestCase):
         self.assertIsInstance(repaired_todo.completed_at, datetime)
         self.assertEqual(repaired_todo.due_date, datetime(2025, 1, 15, 18, 0, 0))
         self.assertEqual(repaired_todo.completed_at, datetime(2025, 1, 14, 16, 30, 0))
-    
+
+    def test_data_integrity_repair_drops_unparseable_dates(self):
+        """변환할 수 없는 날짜 값 제거 테스트"""
+        todo = Todo(
+            id=1,
+            title="손상된 날짜",
+            created_at=datetime.now(),
+            folder_path="test_path",
+            subtasks=[SubTask(id=1, todo_id=1, title="하위 작업")]
+        )
+        todo.due_date = "not-a-date"
+        todo.subtasks[0].due_date = 12345
+
+        repaired_todo = self.storage_service._validate_and_repair_data([todo])[0]
+
+        self.assertIsNone(repaired_todo.due_date)
+        self.assertIsNone(repaired_todo.subtasks[0].due_date)
+
+    def test_repair_report_matches_due_date_validation(self):
+        """복구 순회에서 집계한 검사 결과가 validate_due_date_fields와 같은지 테스트"""
+        invalid_todo = Todo(
+            id=2,
+            title="잘못된 할일",
+            created_at=datetime.now(),
+            folder_path="test_path"
+        )
+        invalid_todo.due_date = "2025-01-15"
+        todos = [self.sample_todo_with_due_date, invalid_todo]
+        expected = self.storage_service.validate_due_date_fields(todos)
+        
+        report = self.storage_service._new_due_date_report(len(todos))
+        self.storage_service._validate_and_repair_data(todos, report)
+        
+        self.assertFalse(report['valid'])
+        self.assertEqual(report['issues'], expected['issues'])
+        # 복구 후 값 기준으로 집계하므로 변환된 due_date도 통계에 포함됨
+        self.assertEqual(report['statistics']['todos_with_due_date'],
+                         expected['statistics']['todos_with_due_date'])
+        self.assertEqual(report['statistics']['total_subtasks'],
+                         expected['statistics']['total_subtasks'])
+        self.assertEqual(report['statistics']['subtasks_with_due_date'],
+                         expected['statistics']['subtasks_with_due_date'])
+
     def test_export_import_data_with_due_dates(self):
         """목표 날짜 포함 데이터 내보내기/가져오기 테스트"""
         export_path = os.path.join(self.test_dir, 'export_test.json')
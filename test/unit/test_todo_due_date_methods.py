@@ -173,6 +173,9 @@ class TestTodoDueDateMethods(unittest.TestCase):
         # 지연된 하위 작업 있음
         self.assertTrue(self.todo.has_overdue_subtasks())
         
+        # 기준 시간을 넘기면 그 시간으로 판단
+        self.assertFalse(self.todo.has_overdue_subtasks(past_date - timedelta(minutes=1)))
+        
         # 하위 작업 완료 시 지연되지 않음
         self.subtask1.is_completed = True
         self.assertFalse(self.todo.has_overdue_subtasks())
@@ -4,6 +4,7 @@ TodoService 단위 테스트
 할일 비즈니스 로직 서비스의 모든 기능을 테스트합니다.
 """
 
+import errno
 import unittest
 import tempfile
 import shutil
@@ -83,6 +84,15 @@ class TestTodoService(unittest.TestCase):
             with self.assertRaises(RuntimeError):
                 self.todo_service.add_todo("테스트 할일")
     
+    def test_add_todo_folder_error_uses_errno(self):
+        """폴더 생성 오류 메시지를 errno로 고르는지 테스트"""
+        error = OSError("폴더 생성에 실패했습니다")
+        error.__cause__ = OSError(errno.ENOSPC, "No space left on device")
+        with patch.object(self.file_service, 'create_todo_folder', side_effect=error):
+            with self.assertRaises(RuntimeError) as context:
+                self.todo_service.add_todo("테스트 할일")
+        self.assertIn("디스크 공간이 부족", str(context.exception))
+    
     def test_add_todo_storage_failure(self):
         """저장 실패 시 할일 추가 테스트"""
         # StorageService의 save_todos 메서드를 모킹하여 False 반환
@@ -249,15 +259,15 @@ class TestTodoService(unittest.TestCase):
         
         # FileService의 delete_todo_folder 메서드를 모킹하여 False 반환
         with patch.object(self.file_service, 'delete_todo_folder', return_value=False):
-            with patch('builtins.print') as mock_print:
+            with self.assertLogs('services.todo_service', level='WARNING') as logs:
                 result = self.todo_service.delete_todo(todo.id, delete_folder=True)
                 
                 # 할일 삭제는 성공
                 self.assertTrue(result)
                 
-                # 경고 메시지가 출력되었는지 확인
-                mock_print.assert_called_once()
-                self.assertIn("경고", mock_print.call_args[0][0])
+            # 경고 로그가 한 번 기록되었는지 확인
+            self.assertEqual(len(logs.records), 1)
+            self.assertIn("폴더 삭제에 실패했습니다", logs.output[0])
     
     def test_get_todo_by_id_found(self):
         """ID로 할일 검색 성공 테스트"""
@@ -308,6 +318,231 @@ class TestTodoService(unittest.TestCase):
             # load_todos가 호출되었는지 확인 (캐시가 무효화됨)
             mock_load.assert_called_once()
     
+    def test_get_all_todos_returns_copy_of_cache(self):
+        """조회 결과를 변경해도 캐시와 ID 인덱스가 영향받지 않는지 테스트"""
+        todo = self.todo_service.add_todo("캐시 테스트")
+        
+        todos = self.todo_service.get_all_todos()
+        todos.clear()
+        
+        self.assertEqual(len(self.todo_service.get_all_todos()), 1)
+        self.assertIs(self.todo_service.get_todo_by_id(todo.id), self.todo_service.get_all_todos()[0])
+        self.assertEqual(self.todo_service.get_max_todo_id(), todo.id)
+    
+    def test_batch_saves_once(self):
+        """batch 블록 안의 여러 변경을 한 번만 저장하는지 테스트"""
+        first = self.todo_service.add_todo("기존 할일")
+        
+        with patch.object(self.storage_service, 'save_todos_with_auto_save',
+                          wraps=self.storage_service.save_todos_with_auto_save) as mock_save:
+            with self.todo_service.batch():
+                second = self.todo_service.add_todo("두 번째")
+                third = self.todo_service.add_todo("세 번째")
+                self.todo_service.update_todo(first.id, "수정된 할일")
+                subtask = self.todo_service.add_subtask(second.id, "하위 작업")
+                other = self.todo_service.add_subtask(third.id, "다른 하위 작업")
+                mock_save.assert_not_called()
+            mock_save.assert_called_once()
+        
+        self.assertEqual(len({first.id, second.id, third.id}), 3)
+        self.assertNotEqual(subtask.id, other.id)
+        
+        # 디스크에서 다시 읽어도 모든 변경이 반영되어 있어야 함
+        self.todo_service.clear_cache()
+        todos = self.todo_service.get_all_todos()
+        self.assertEqual([todo.title for todo in todos], ["수정된 할일", "두 번째", "세 번째"])
+    
+    def test_batch_saves_changes_made_before_exception(self):
+        """batch 블록에서 예외가 나도 그 전까지의 변경은 저장되고 예외는 전달되는지 테스트"""
+        with self.assertRaises(ValueError):
+            with self.todo_service.batch():
+                self.todo_service.add_todo("예외 전 할일")
+                raise ValueError("블록 안의 오류")
+        
+        # 트랜잭션이 아니므로 예외 전의 변경은 디스크에 남아 있음
+        self.assertEqual([todo.title for todo in StorageService(self.data_file).load_todos()],
+                         ["예외 전 할일"])
+    
+    def test_expansion_state_saved_lazily(self):
+        """확장 상태 변경은 즉시 저장하지 않고 force_save 때 저장하는지 테스트"""
+        todo = self.todo_service.add_todo("확장 테스트")
+        self.todo_service.disable_auto_save()
+        
+        with patch.object(self.storage_service, 'save_todos_with_auto_save',
+                          wraps=self.storage_service.save_todos_with_auto_save) as mock_save:
+            self.assertTrue(self.todo_service.update_todo_expansion_state(todo.id, False))
+            self.assertFalse(self.todo_service.get_todo_by_id(todo.id).is_expanded)
+            mock_save.assert_not_called()
+        
+            self.assertTrue(self.todo_service.force_save())
+            mock_save.assert_called_once()
+        
+        self.todo_service.clear_cache()
+        self.assertFalse(self.todo_service.get_todo_by_id(todo.id).is_expanded)
+    
+    def test_expansion_state_saved_when_object_changed_first(self):
+        """GUI처럼 할일 객체를 먼저 바꾼 뒤 호출해도 종료 시 저장되는지 테스트"""
+        todo = self.todo_service.add_todo("트리 축소 테스트")
+        self.todo_service.disable_auto_save()
+        
+        cached = self.todo_service.get_todo_by_id(todo.id)
+        cached.is_expanded = False
+        self.assertTrue(self.todo_service.update_todo_expansion_state(todo.id, False))
+        self.todo_service.shutdown()
+        
+        self.assertFalse(StorageService(self.data_file).load_todos()[0].is_expanded)
+    
+    def test_clear_cache_saves_deferred_changes(self):
+        """캐시를 비워도 미뤄 둔 확장 상태 변경이 유지되는지 테스트"""
+        todo = self.todo_service.add_todo("새로고침 테스트")
+        self.todo_service.disable_auto_save()
+        self.todo_service.update_todo_expansion_state(todo.id, False)
+        
+        self.todo_service.clear_cache()
+        self.assertFalse(self.todo_service.get_todo_by_id(todo.id).is_expanded)
+        self.assertFalse(StorageService(self.data_file).load_todos()[0].is_expanded)
+    
+    def test_restore_from_backup_not_undone_by_deferred_save(self):
+        """복구 후 종료해도 미뤄 둔 이전 변경이 복구된 파일을 덮어쓰지 않는지 테스트"""
+        self.todo_service.add_todo("a")
+        self.assertTrue(self.todo_service.create_backup("only_a"))
+        todo_b = self.todo_service.add_todo("b")
+        
+        self.todo_service.disable_auto_save()
+        self.todo_service.update_todo_expansion_state(todo_b.id, False)
+        
+        self.assertTrue(self.todo_service.restore_from_backup(f"{self.data_file}.only_a"))
+        self.assertEqual([t.title for t in self.todo_service.get_all_todos()], ["a"])
+        
+        self.todo_service.shutdown()
+        self.assertEqual([t.title for t in StorageService(self.data_file).load_todos()], ["a"])
+    
+    def test_filter_todos_search_follows_title_changes(self):
+        """검색 인덱스가 제목/하위 작업 변경을 반영하는지 테스트"""
+        first = self.todo_service.add_todo("Alpha 할일")
+        second = self.todo_service.add_todo("두 번째")
+        subtask = self.todo_service.add_subtask(second.id, "Beta 하위 작업")
+        
+        self.assertEqual([t.id for t in self.todo_service.filter_todos(search_term="alpha")], [first.id])
+        self.assertEqual([t.id for t in self.todo_service.filter_todos(search_term="BETA")], [second.id])
+        # 제목 경계를 넘어서는 일치하지 않아야 함
+        self.assertEqual(self.todo_service.filter_todos(search_term="번째beta"), [])
+        
+        self.todo_service.update_todo(first.id, "Gamma 할일")
+        self.todo_service.update_subtask(second.id, subtask.id, "Alpha 하위 작업")
+        self.assertEqual([t.id for t in self.todo_service.filter_todos(search_term="alpha")], [second.id])
+        self.assertEqual([t.id for t in self.todo_service.filter_todos(search_term="gamma")], [first.id])
+    
+    def test_filter_todos_cached_search_checks_completion(self):
+        """같은 검색어를 반복해도 완료 상태와 반환 목록이 독립적인지 테스트"""
+        todo = self.todo_service.add_todo("반복 검색")
+        subtask = self.todo_service.add_subtask(todo.id, "하위 작업")
+        
+        result = self.todo_service.filter_todos(show_completed=False, search_term="반복")
+        self.assertEqual([t.id for t in result], [todo.id])
+        result.clear()
+        
+        # 검색 결과를 다시 쓰더라도 완료 여부는 매번 확인
+        self.todo_service.toggle_subtask_completion(todo.id, subtask.id)
+        self.assertEqual(self.todo_service.filter_todos(show_completed=False, search_term="반복"), [])
+        self.assertEqual([t.id for t in self.todo_service.filter_todos(search_term="반복")], [todo.id])
+    
+    def test_insort_by_created_at_keeps_order(self):
+        """생성 시간 순서를 유지하며 할일을 삽입하는지 테스트"""
+        from datetime import timedelta
+        from services.todo_service import _insort_by_created_at
+        
+        base = datetime(2024, 1, 1, 12, 0, 0)
+        todos = []
+        for offset in (0, 10, 5, 10, -5, 20):
+            _insort_by_created_at(todos, Todo(
+                id=len(todos) + 1, title=f"할일 {offset}",
+                created_at=base + timedelta(seconds=offset), folder_path=""
+            ))
+        
+        self.assertEqual([todo.created_at for todo in todos],
+                         sorted(todo.created_at for todo in todos))
+        # 생성 시간이 같으면 나중에 추가된 할일이 뒤에 위치
+        same_time = [todo.id for todo in todos if todo.created_at == base + timedelta(seconds=10)]
+        self.assertEqual(same_time, [2, 4])
+    
+    def test_list_todos_matches_filter_then_sort(self):
+        """list_todos가 filter_todos 후 sort_todos와 같은 결과를 내는지 테스트"""
+        for title in ["다 검색", "가 검색", "나 기타", "라 검색"]:
+            self.todo_service.add_todo(title)
+        
+        for sort_by in ["created_at", "title", "progress"]:
+            expected = self.todo_service.sort_todos(
+                self.todo_service.filter_todos(search_term="검색"), sort_by=sort_by)
+            result = self.todo_service.list_todos(search_term="검색", sort_by=sort_by)
+            self.assertEqual([t.id for t in result], [t.id for t in expected])
+            
+            limited = self.todo_service.list_todos(search_term="검색", sort_by=sort_by, limit=2)
+            self.assertEqual([t.id for t in limited], [t.id for t in expected[:2]])
+    
+    def test_shutdown_skips_save_when_clean(self):
+        """저장되지 않은 변경이 없으면 종료 시 다시 저장하지 않는지 테스트"""
+        todo = self.todo_service.add_todo("종료 테스트")
+        
+        self.todo_service.force_save = Mock(wraps=self.todo_service.force_save)
+        self.todo_service.shutdown()
+        self.todo_service.force_save.assert_not_called()
+        
+        # 미뤄 둔 변경이 있으면 종료 시 저장
+        self.todo_service.disable_auto_save()
+        self.todo_service.update_todo_expansion_state(todo.id, False)
+        self.todo_service.force_save = Mock(wraps=self.todo_service.force_save)
+        self.todo_service.shutdown()
+        self.todo_service.force_save.assert_called_once()
+    
+    def test_batch_update_todos_applies_by_id(self):
+        """배치 업데이트가 ID로 할일을 찾아 반영하는지 테스트"""
+        first = self.todo_service.add_todo("첫 번째")
+        second = self.todo_service.add_todo("두 번째")
+        due_date = datetime(2030, 1, 1, 9, 0)
+        
+        self.todo_service._batch_update_todos([
+            {'item_id': second.id, 'data': {'title': "바뀐 두 번째"}},
+            {'item_id': 999, 'data': {'title': "없는 할일"}},
+        ])
+        self.todo_service._batch_update_due_dates([
+            {'item_id': first.id, 'data': {'due_date': due_date, 'type': 'todo'}},
+        ])
+        
+        # 두 타입의 변경을 플러시 끝에 한 번만 저장
+        with patch.object(self.storage_service, 'save_todos_with_auto_save',
+                          wraps=self.storage_service.save_todos_with_auto_save) as mock_save:
+            self.assertTrue(self.todo_service._save_batch_updates())
+            self.assertTrue(self.todo_service._save_batch_updates())
+            mock_save.assert_called_once()
+        
+        self.todo_service.clear_cache()
+        self.assertEqual(self.todo_service.get_todo_by_id(second.id).title, "바뀐 두 번째")
+        self.assertEqual(self.todo_service.get_todo_by_id(first.id).due_date, due_date)
+    
+    def test_batch_update_subtasks_applies_by_id(self):
+        """하위 작업 배치 업데이트가 ID로 하위 작업을 찾아 반영하는지 테스트"""
+        first = self.todo_service.add_todo("첫 번째")
+        second = self.todo_service.add_todo("두 번째")
+        first_subtask = self.todo_service.add_subtask(first.id, "하위 1")
+        second_subtask = self.todo_service.add_subtask(second.id, "하위 2")
+        due_date = datetime(2030, 1, 1, 9, 0)
+        
+        self.todo_service._batch_update_subtasks([
+            {'item_id': second_subtask.id, 'data': {'title': "바뀐 하위 2", 'is_completed': True}},
+            {'item_id': 999, 'data': {'title': "없는 하위 작업"}},
+        ])
+        self.todo_service._batch_update_due_dates([
+            {'item_id': first_subtask.id, 'data': {'due_date': due_date, 'type': 'subtask'}},
+        ])
+        self.assertTrue(self.todo_service._save_batch_updates())
+        
+        self.todo_service.clear_cache()
+        updated_second = self.todo_service.get_todo_by_id(second.id).subtasks[0]
+        self.assertEqual(updated_second.title, "바뀐 하위 2")
+        self.assertTrue(updated_second.is_completed)
+        self.assertEqual(self.todo_service.get_todo_by_id(first.id).subtasks[0].due_date, due_date)
+    
     def test_cache_invalidation_on_add(self):
         """할일 추가 시 캐시 무효화 테스트"""
         # 첫 번째 할일 추가
@@ -5,6 +5,7 @@ Task 5: TodoService에 목표 날짜 관련 비즈니스 로직 추가 검증
 """
 
 import unittest
+from unittest.mock import patch
 from datetime import datetime, timedelta
 import tempfile
 import os
@@ -263,6 +264,53 @@ class TestTodoServiceDueDate(unittest.TestCase):
         self.assertEqual(len(todos_with_overdue_subtasks), 1)
         self.assertEqual(todos_with_overdue_subtasks[0].id, self.todo1.id)
 
+    
+    def test_get_todos_by_due_date_follows_changes(self):
+        """목표 날짜 범위 조회가 생성 순서를 유지하고 변경을 반영하는지 테스트"""
+        now = datetime.now()
+        self.todo_service.set_todo_due_date(self.todo1.id, now + timedelta(days=2))
+        self.todo_service.set_todo_due_date(self.todo2.id, now + timedelta(days=1))
+        
+        # 목표 날짜순이 아닌 생성 순서대로 반환
+        in_range = self.todo_service.get_todos_by_due_date(now, now + timedelta(days=3))
+        self.assertEqual([todo.id for todo in in_range], [self.todo1.id, self.todo2.id])
+        
+        # 경계 날짜 포함
+        boundary = self.todo_service.get_todo_by_id(self.todo2.id).due_date
+        in_range = self.todo_service.get_todos_by_due_date(boundary, boundary)
+        self.assertEqual([todo.id for todo in in_range], [self.todo2.id])
+        
+        # 목표 날짜를 바꾸면 다음 조회에 반영
+        self.todo_service.set_todo_due_date(self.todo2.id, now + timedelta(days=5))
+        in_range = self.todo_service.get_todos_by_due_date(now, now + timedelta(days=3))
+        self.assertEqual([todo.id for todo in in_range], [self.todo1.id])
+
+    
+    def test_set_due_date_save_failure_restores_value(self):
+        """저장 실패 시 할일과 하위 작업의 목표 날짜가 복원되는지 테스트"""
+        original = datetime.now() + timedelta(days=3)
+        self.todo_service.set_todo_due_date(self.todo1.id, original)
+        self.todo_service.set_subtask_due_date(self.todo1.id, self.subtask1.id, original)
+        todo = self.todo_service.get_todo_by_id(self.todo1.id)
+        
+        with patch.object(self.storage_service, 'save_todos_with_auto_save', return_value=False):
+            self.assertFalse(self.todo_service.set_todo_due_date(self.todo1.id, None))
+            self.assertFalse(self.todo_service.set_subtask_due_date(
+                self.todo1.id, self.subtask1.id, original - timedelta(days=1)))
+        
+        self.assertEqual(todo.due_date, original)
+        self.assertEqual(todo.subtasks[0].due_date, original)
+
+    
+    def test_get_filtered_and_sorted_todos_created_at_returns_new_list(self):
+        """생성 시간순 조회가 정렬 없이 생성 순서의 새 목록을 반환하는지 테스트"""
+        result = self.todo_service.get_filtered_and_sorted_todos("all", "created_at")
+        self.assertEqual([todo.id for todo in result], [self.todo1.id, self.todo2.id])
+        
+        # 반환된 목록을 바꿔도 서비스의 목록은 그대로
+        result.clear()
+        self.assertEqual(len(self.todo_service.get_filtered_and_sorted_todos("all", "created_at")), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
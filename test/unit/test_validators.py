@@ -55,6 +55,14 @@ class TestTodoValidator(unittest.TestCase):
         long_title = "a" * 101
         self.assertFalse(TodoValidator.validate_title(long_title))
     
+    def test_clean_title(self):
+        """제목 정제 테스트"""
+        self.assertEqual(TodoValidator.clean_title("  할일 제목  "), "할일 제목")
+        self.assertEqual(TodoValidator.clean_title("a" * 100), "a" * 100)
+        self.assertIsNone(TodoValidator.clean_title("   "))
+        self.assertIsNone(TodoValidator.clean_title(None))
+        self.assertIsNone(TodoValidator.clean_title("a" * 101))
+    
     def test_validate_todo_id_valid_cases(self):
         """유효한 ID 테스트"""
         # 정상적인 ID
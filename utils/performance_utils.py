@@ -4,11 +4,12 @@
 긴급도 계산 캐싱, 배치 업데이트, 실시간 업데이트 최적화 등의 기능을 제공합니다.
 """
 
+import logging
 import time
 import threading
 import weakref
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Callable, Set
+from typing import Dict, Any, Optional, List, Callable, Set, Tuple
 from functools import wraps, lru_cache
 import gc
 import os
@@ -20,6 +21,8 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+logger = logging.getLogger(__name__)
+
 
 class UrgencyCache:
     """긴급도 계산 결과 캐싱 클래스"""
@@ -139,7 +142,11 @@ class BatchUpdateManager:
         self.batch_size = batch_size
         self.flush_interval = flush_interval
         self._pending_updates: List[Dict[str, Any]] = []
+        # 합칠 수 있는 대기 업데이트 ((타입, 항목 ID, 세부 타입) -> _pending_updates 안의 항목)
+        self._coalesced_updates: Dict[Tuple[str, Any, Any], Dict[str, Any]] = {}
         self._update_callbacks: Dict[str, Callable] = {}
+        # 모든 타입의 콜백을 처리한 뒤 한 번 호출되는 콜백 (변경을 한 번에 저장하는 용도)
+        self._flush_callbacks: Dict[str, Callable[[], None]] = {}
         self._lock = threading.RLock()
         self._last_flush = time.time()
         self._timer: Optional[threading.Timer] = None
@@ -148,6 +155,19 @@ class BatchUpdateManager:
         """업데이트 콜백 등록"""
         self._update_callbacks[update_type] = callback
     
+    def register_flush_callback(self, name: str, callback: Callable[[], None]) -> None:
+        """
+        플러시 완료 콜백 등록
+        
+        한 번의 플러시에서 모든 업데이트 타입의 콜백을 처리한 뒤 호출됩니다.
+        같은 이름으로 다시 등록하면 이전 콜백을 대체합니다.
+        
+        Args:
+            name: 콜백 이름
+            callback: 인자 없이 호출할 콜백
+        """
+        self._flush_callbacks[name] = callback
+    
     def queue_update(self, update_type: str, item_id: Any, data: Dict[str, Any]) -> None:
         """업데이트를 큐에 추가"""
         with self._lock:
@@ -165,6 +185,34 @@ class BatchUpdateManager:
                 # 타이머 설정
                 self._schedule_flush()
     
+    def queue_coalesced_update(self, update_type: str, item_id: Any, data: Dict[str, Any]) -> None:
+        """
+        같은 항목의 대기 중인 업데이트와 합쳐서 큐에 추가
+        
+        같은 타입, 같은 항목 ID, 같은 data['type']의 업데이트가 이미 대기 중이면
+        새 항목을 추가하지 않고 기존 data에 새 값을 덮어씁니다.
+        필드 값을 설정하는 업데이트처럼 마지막 값만 의미 있는 경우에만 사용합니다.
+        
+        Args:
+            update_type: 업데이트 타입
+            item_id: 항목 ID
+            data: 업데이트 데이터
+        """
+        key = (update_type, item_id, data.get('type'))
+        with self._lock:
+            pending = self._coalesced_updates.get(key)
+            if pending is None:
+                self.queue_update(update_type, item_id, data)
+                # 플러시되지 않고 남아 있는 경우에만 합칠 대상으로 기억
+                if self._pending_updates and self._pending_updates[-1]['data'] is data:
+                    self._coalesced_updates[key] = self._pending_updates[-1]
+                return
+            
+            # 호출자의 딕셔너리는 바꾸지 않고 합친 새 딕셔너리로 교체
+            pending['data'] = {**pending['data'], **data}
+            pending['timestamp'] = time.time()
+            self._schedule_flush()
+    
     def _schedule_flush(self) -> None:
         """자동 플러시 스케줄링"""
         if self._timer is not None:
@@ -193,11 +241,19 @@ class BatchUpdateManager:
                 if update_type in self._update_callbacks:
                     try:
                         self._update_callbacks[update_type](updates)
-                    except Exception as e:
-                        print(f"배치 업데이트 실패 ({update_type}): {e}")
+                    except Exception:
+                        logger.exception("배치 업데이트 실패 (%s)", update_type)
+            
+            # 타입별 처리가 끝난 뒤 한 번만 호출
+            for name, callback in list(self._flush_callbacks.items()):
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("배치 플러시 콜백 실패 (%s)", name)
             
             # 처리된 업데이트 제거
             self._pending_updates.clear()
+            self._coalesced_updates.clear()
             self._last_flush = time.time()
             
             # 타이머 정리
@@ -285,8 +341,8 @@ class RealTimeUpdateOptimizer:
                     try:
                         self._update_callbacks[component_id]()
                         self._last_update_times[component_id] = current_time
-                    except Exception as e:
-                        print(f"실시간 업데이트 실패 ({component_id}): {e}")
+                    except Exception:
+                        logger.exception("실시간 업데이트 실패 (%s)", component_id)
             
             # 다음 사이클 스케줄링
             if self._update_queue:
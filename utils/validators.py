@@ -24,18 +24,35 @@ class TodoValidator:
         Returns:
             bool: 유효한 제목이면 True, 그렇지 않으면 False
         """
+        return TodoValidator.clean_title(title) is not None
+    
+    @staticmethod
+    def clean_title(title: str) -> Optional[str]:
+        """
+        할일 제목을 검사하고 앞뒤 공백을 제거한 제목을 반환
+        
+        validate_title과 같은 규칙으로 검사하며, 호출자가 검사 후 다시
+        strip()하지 않도록 정제된 제목을 함께 돌려줍니다.
+        
+        Args:
+            title: 검사할 할일 제목
+            
+        Returns:
+            Optional[str]: 유효한 제목이면 공백을 제거한 제목, 그렇지 않으면 None
+        """
         if not title or not isinstance(title, str):
-            return False
+            return None
             
         # 공백만 있는 경우도 무효
-        if not title.strip():
-            return False
+        cleaned = title.strip()
+        if not cleaned:
+            return None
             
         # 제목 길이 제한 (1-100자)
-        if len(title.strip()) > 100:
-            return False
+        if len(cleaned) > 100:
+            return None
             
-        return True
+        return cleaned
     
     @staticmethod
     def validate_todo_id(todo_id: str, max_id: int) -> Optional[int]: